@@ -14,9 +14,11 @@
 
 import argparse
 import asyncio
+import dataclasses
 import getpass
 import logging
 from collections.abc import Iterable  # noqa: TC003
+from typing import Any
 
 import vera
 from vera import CsvRow, VeraConfig
@@ -25,6 +27,8 @@ from .core.gs_client import GoogleSheetsClient
 
 logger: logging.Logger = logging.getLogger(vera.PROJECT_NAME)
 
+STREAM_BATCH_ROWS: int = 50
+
 
 class GoogleSheetsConfig(VeraConfig):
     gs_credentials: str | None = None
@@ -34,6 +38,45 @@ class GoogleSheetsConfig(VeraConfig):
     gs_combine: bool = False
 
 
+@dataclasses.dataclass(slots=True)
+class _SheetStream:
+    """The rows of a suite run waiting to be appended to its sheet."""
+
+    client: GoogleSheetsClient
+    spreadsheet_id: str
+    sheet_name: str
+    include_header: bool
+    header: list[str] = dataclasses.field(default_factory=list)
+    pending: list[list[Any]] = dataclasses.field(default_factory=list)
+    started: bool = False
+
+    def add(self, row: CsvRow) -> None:
+        row_dict: dict[str, Any] = row.model_dump(by_alias=True)
+        if not self.header:
+            self.header = list(row_dict.keys())
+
+        self.pending.append(list(row_dict.values()))
+
+    def flush(self) -> None:
+        if not self.pending:
+            return
+
+        values: list[list[Any]] = self.pending
+        self.pending = []
+        if not self.started:
+            self.client.ensure_sheet_exists(self.spreadsheet_id, self.sheet_name)
+            if self.include_header:
+                values = [self.header, *values]
+
+            self.started = True
+
+        logger.debug("Appending %d rows to sheet '%s'", len(values), self.sheet_name)
+        self.client.append_rows(self.spreadsheet_id, f"'{self.sheet_name}'!A1", values)
+
+
+_streams: dict[int, _SheetStream] = {}
+
+
 @vera.hook_impl
 def display_test_command_help(extra_args: list[str]) -> bool:
     """Displays help for additional CLI arguments for the 'eval' command.
@@ -164,9 +207,42 @@ def handle_config_command_display(config: VeraConfig) -> None:
         logger.info("  GS Password: %s", "*******" if gs_config.gs_password else "Not set")
 
 
+@vera.hook_impl
+async def on_row_completed(row: CsvRow, run_index: int) -> None:
+    """Appends the rows of a suite run to Google Sheets in batches while it runs."""
+    config: VeraConfig[GoogleSheetsConfig] = GoogleSheetsConfig.get()
+    if not config.gs_credentials or not config.gs_spreadsheet_id:
+        return
+
+    stream: _SheetStream | None = _streams.get(run_index)
+    if stream is None:
+        client: GoogleSheetsClient = await asyncio.to_thread(
+            GoogleSheetsClient, config.gs_credentials
+        )
+        stream = _streams[run_index] = _SheetStream(
+            client=client,
+            spreadsheet_id=config.gs_spreadsheet_id,
+            sheet_name="Combined Results" if config.gs_combine else f"Run {run_index + 1}",
+            include_header=run_index == 0 or not config.gs_combine,
+        )
+
+    stream.add(row)
+    if len(stream.pending) >= STREAM_BATCH_ROWS:
+        await asyncio.to_thread(stream.flush)
+
+
 @vera.hook_impl
 async def publish_results(rows: Iterable[CsvRow], run_index: int) -> None:
-    """Publishes results to Google Sheets."""
+    """Publishes results to Google Sheets.
+
+    If the rows of the run were streamed, only the rows that were not appended yet are.
+    """
+    stream: _SheetStream | None = _streams.pop(run_index, None)
+    if stream is not None:
+        await asyncio.to_thread(stream.flush)
+        logger.info("Successfully published results to Google Sheets.")
+        return
+
     config: VeraConfig[GoogleSheetsConfig] = GoogleSheetsConfig.get()
     gs_credentials: str = config.gs_credentials or ""
     gs_spreadsheet_id: str = config.gs_spreadsheet_id or ""
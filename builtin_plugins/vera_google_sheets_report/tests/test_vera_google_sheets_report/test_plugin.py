@@ -23,6 +23,7 @@ from vera_google_sheets_report.plugin_impl import (
     handle_config_command_display,
     handle_config_command_extra_args,
     handle_test_command_extra_args,
+    on_row_completed,
     publish_results,
 )
 
@@ -155,3 +156,33 @@ async def test_publish_results_combine(mock_client_class: MagicMock) -> None:
     # Run 1 should NOT have a header
     await publish_results(rows, run_index=1)
     mock_client.append_rows.assert_called_with(sheet_id, "'Combined Results'!A1", [["Value1"]])
+
+
+@pytest.mark.asyncio
+@patch("vera_google_sheets_report.plugin_impl.STREAM_BATCH_ROWS", 2)
+@patch("vera_google_sheets_report.plugin_impl.GoogleSheetsClient")
+async def test_streamed_rows_are_appended_in_batches(mock_client_class: MagicMock) -> None:
+    mock_client = mock_client_class.return_value
+    CONFIG.gs_credentials = "creds.json"
+    CONFIG.gs_spreadsheet_id = "123"
+    CONFIG.gs_combine = False
+
+    rows: list[MagicMock] = []
+    for value in ("Value1", "Value2", "Value3"):
+        row = MagicMock()
+        row.model_dump.return_value = {"Header1": value}
+        rows.append(row)
+
+    for row in rows:
+        await on_row_completed(row, run_index=1)
+
+    mock_client.ensure_sheet_exists.assert_called_once_with("123", "Run 2")
+    mock_client.append_rows.assert_called_once_with(
+        "123", "'Run 2'!A1", [["Header1"], ["Value1"], ["Value2"]]
+    )
+
+    await publish_results(rows, run_index=1)
+
+    mock_client_class.assert_called_once_with("creds.json")
+    mock_client.append_rows.assert_called_with("123", "'Run 2'!A1", [["Value3"]])
+    assert mock_client.append_rows.call_count == 2
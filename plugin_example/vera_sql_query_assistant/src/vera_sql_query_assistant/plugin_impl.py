@@ -107,6 +107,17 @@ def get_csv_row_class() -> type[SqlQueryRow]:
     return SqlQueryRow
 
 
+@vera.hook_impl
+def get_output_class() -> type[SqlQueryOutput]:
+    """Returns the output class of the SQL Query Assistant, to judge recorded outputs again.
+
+    Returns:
+        type[SqlQueryOutput]: The feature output class.
+
+    """
+    return SqlQueryOutput
+
+
 @vera.hook_impl
 def get_llm_csv_columns_class() -> type[LlmChecksColumn]:
     """Returns the custom LLM evaluation columns for the SQL Query Assistant.
@@ -0,0 +1,255 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import contextlib
+import json
+import logging
+import random
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+import httpx
+from google.genai.errors import APIError
+from platformdirs import user_state_dir
+
+from vera.project_name import PROJECT_NAME
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from google.genai.batches import AsyncBatches
+    from google.genai.types import BatchJob
+
+logger: logging.Logger = logging.getLogger(PROJECT_NAME)
+
+BATCH_JOBS_FILE_NAME: str = "batch_jobs.json"
+MAX_JOB_AGE_SEC: int = 7 * 24 * 60 * 60
+INITIAL_POLL_DELAY_SEC: float = 5.0
+MAX_POLL_DELAY_SEC: float = 60.0
+POLL_BACKOFF_FACTOR: float = 1.5
+ACTIVE_JOB_STATES: frozenset[str] = frozenset({
+    "JOB_STATE_UNSPECIFIED",
+    "JOB_STATE_QUEUED",
+    "JOB_STATE_PENDING",
+    "JOB_STATE_RUNNING",
+    "JOB_STATE_PAUSED",
+    "JOB_STATE_UPDATING",
+    "JOB_STATE_CANCELLING",
+})
+RATE_LIMIT_STATUS_CODE: int = 429
+SERVER_ERROR_STATUS_CODE: int = 500
+
+
+class BatchJobStore:
+    """Records the submitted batch jobs whose results were not retrieved yet in a local file.
+
+    Each job is stored with the fingerprints of its requests, in request order, so a later
+    process can match the results of the job to its own prompts. The jobs found in the file
+    when it is first read are the resumable ones, and stay resumable for the whole process
+    even after their results are retrieved. Jobs older than ``MAX_JOB_AGE_SEC`` are dropped.
+    """
+
+    __slots__ = ("_jobs", "_lock", "_resumable", "path")
+
+    def __init__(self, path: Path) -> None:
+        self.path: Path = path
+        self._lock: asyncio.Lock = asyncio.Lock()
+        self._jobs: dict[str, dict[str, Any]] | None = None
+        self._resumable: dict[str, list[str]] = {}
+
+    async def find(self, fingerprints: Iterable[str]) -> dict[str, list[str]]:
+        """Find the resumable jobs that contain any of the given requests.
+
+        Args:
+            fingerprints: The fingerprints of the requests to look for.
+
+        Returns:
+            dict[str, list[str]]: The request fingerprints of each found job, by job name.
+
+        """
+        await self._load()
+        wanted: set[str] = set(fingerprints)
+        return {
+            name: job_fingerprints
+            for name, job_fingerprints in self._resumable.items()
+            if not wanted.isdisjoint(job_fingerprints)
+        }
+
+    async def add(self, name: str, fingerprints: list[str]) -> None:
+        """Record a submitted job."""
+        jobs: dict[str, dict[str, Any]] = await self._load()
+        async with self._lock:
+            jobs[name] = {"fingerprints": fingerprints, "created_at": time.time()}
+            await asyncio.to_thread(self._write, dict(jobs))
+
+    async def remove(self, name: str) -> None:
+        """Forget a job once its results were retrieved or it can not be resumed."""
+        jobs: dict[str, dict[str, Any]] = await self._load()
+        async with self._lock:
+            if jobs.pop(name, None) is not None:
+                await asyncio.to_thread(self._write, dict(jobs))
+
+    async def _load(self) -> dict[str, dict[str, Any]]:
+        async with self._lock:
+            if self._jobs is None:
+                self._jobs = await asyncio.to_thread(self._read)
+                self._resumable = {name: job["fingerprints"] for name, job in self._jobs.items()}
+
+            return self._jobs
+
+    def _read(self) -> dict[str, dict[str, Any]]:
+        try:
+            data: Any = json.loads(self.path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as e:
+            logger.warning("Ignoring unreadable batch jobs file %s: %s", self.path, e)
+            return {}
+
+        if not isinstance(data, dict):
+            return {}
+
+        oldest: float = time.time() - MAX_JOB_AGE_SEC
+        return {
+            name: job
+            for name, job in data.items()
+            if isinstance(job, dict)
+            and isinstance(job.get("fingerprints"), list)
+            and job.get("created_at", 0) >= oldest
+        }
+
+    def _write(self, jobs: dict[str, dict[str, Any]]) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path: Path = self.path.with_suffix(".tmp")
+        temp_path.write_text(json.dumps(jobs), encoding="utf-8")
+        temp_path.replace(self.path)
+
+
+class BatchJobPoller:
+    """Waits for batch jobs to finish, polling all outstanding jobs of a client from one task.
+
+    The jobs are polled together, and the delay between polls grows with jittered exponential
+    backoff from ``INITIAL_POLL_DELAY_SEC`` to ``MAX_POLL_DELAY_SEC``. Rate limit, server and
+    network errors are logged and the job is polled again, while other errors fail its waiters.
+    """
+
+    __slots__ = ("_batches", "_task", "_waiters")
+
+    def __init__(self, batches: AsyncBatches) -> None:
+        self._batches: AsyncBatches = batches
+        self._waiters: dict[str, asyncio.Future[BatchJob]] = {}
+        self._task: asyncio.Task[None] | None = None
+
+    async def wait(self, name: str) -> BatchJob:
+        """Wait until a batch job is no longer active.
+
+        Args:
+            name: The name of the batch job.
+
+        Returns:
+            BatchJob: The job in its final state.
+
+        """
+        future: asyncio.Future[BatchJob] | None = self._waiters.get(name)
+        if future is None:
+            future = asyncio.get_running_loop().create_future()
+            self._waiters[name] = future
+
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._poll())
+
+        return await asyncio.shield(future)
+
+    async def aclose(self) -> None:
+        """Stop polling and cancel the remaining waiters."""
+        if self._task is not None:
+            self._task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+
+            self._task = None
+
+        for future in self._waiters.values():
+            future.cancel()
+
+        self._waiters.clear()
+
+    async def _poll(self) -> None:
+        attempt: int = 0
+        while self._waiters:
+            names: list[str] = list(self._waiters)
+            jobs: list[BatchJob | BaseException] = await asyncio.gather(
+                *(self._batches.get(name=name) for name in names),
+                return_exceptions=True,
+            )
+            for name, job in zip(names, jobs, strict=True):
+                self._update(name, job)
+
+            if self._waiters:
+                await asyncio.sleep(_get_poll_delay(attempt))
+                attempt += 1
+
+    def _update(self, name: str, job: BatchJob | BaseException) -> None:
+        if isinstance(job, BaseException) and not isinstance(job, Exception):
+            raise job
+
+        if isinstance(job, Exception):
+            if _is_transient_error(job):
+                logger.warning("Failed to poll batch job %s, polling again: %s", name, job)
+                return
+
+            self._waiters.pop(name).set_exception(job)
+            return
+
+        if job.state in ACTIVE_JOB_STATES:
+            logger.debug("Batch job %s is in state %s", name, job.state)
+            return
+
+        logger.info("Batch job %s finished with state %s", name, job.state)
+        self._waiters.pop(name).set_result(job)
+
+
+def _get_poll_delay(attempt: int) -> float:
+    delay: float = min(MAX_POLL_DELAY_SEC, INITIAL_POLL_DELAY_SEC * POLL_BACKOFF_FACTOR**attempt)
+    return delay * random.uniform(0.5, 1.0)  # noqa: S311
+
+
+def _is_transient_error(e: Exception) -> bool:
+    if isinstance(e, APIError):
+        return e.code == RATE_LIMIT_STATUS_CODE or e.code >= SERVER_ERROR_STATUS_CODE
+
+    return isinstance(e, OSError | httpx.TransportError)
+
+
+def get_state_path() -> Path:
+    return Path(user_state_dir(appname=PROJECT_NAME)) / BATCH_JOBS_FILE_NAME
+
+
+_batch_job_store: BatchJobStore | None = None
+
+
+def get_batch_job_store() -> BatchJobStore:
+    """Returns the process-wide store of submitted batch jobs.
+
+    Returns:
+        BatchJobStore: The store, created on first use.
+
+    """
+    global _batch_job_store  # noqa: PLW0603
+    if _batch_job_store is None:
+        _batch_job_store = BatchJobStore(get_state_path())
+
+    return _batch_job_store
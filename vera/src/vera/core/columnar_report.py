@@ -0,0 +1,263 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import importlib
+import json
+import logging
+import os
+from enum import StrEnum
+from typing import TYPE_CHECKING, Any, BinaryIO, override
+
+from pydantic_core import to_jsonable_python
+
+from vera.project_name import PROJECT_NAME
+
+from .configuration import CONFIG
+from .write_results_to_file import ReportWriter, new_report_path
+
+if TYPE_CHECKING:
+    import pathlib
+    from collections.abc import Iterable
+    from types import ModuleType
+
+    from .data_models.csv import CsvRow
+
+logger: logging.Logger = logging.getLogger(PROJECT_NAME)
+
+PYARROW_MISSING_MESSAGE: str = (
+    "Columnar reports require pyarrow, install it with: uv pip install 'vera[columnar]'"
+)
+JSON_COLUMN: str = "json"
+
+
+class ColumnarFormat(StrEnum):
+    PARQUET = "parquet"
+    ARROW = "arrow"
+
+
+REPORT_SUFFIXES: dict[ColumnarFormat, str] = {
+    ColumnarFormat.PARQUET: ".parquet",
+    ColumnarFormat.ARROW: ".arrow",
+}
+
+
+def import_pyarrow() -> ModuleType:
+    """Imports pyarrow, which is only installed with the ``columnar`` extra.
+
+    Returns:
+        ModuleType: The pyarrow module.
+
+    Raises:
+        ImportError: If pyarrow is not installed.
+
+    """
+    try:
+        return importlib.import_module("pyarrow")
+    except ImportError as e:
+        raise ImportError(PYARROW_MISSING_MESSAGE) from e
+
+
+def get_column_types(row_class: type[CsvRow]) -> dict[str, str]:
+    """Reads the type of each report column from the serialization schema of a row class.
+
+    Args:
+        row_class: The plugin's row class.
+
+    Returns:
+        dict[str, str]: The JSON schema type of each column, by column name. Columns that are
+            not a single integer, number, boolean or string are ``"json"`` columns, whose
+            values are stored as JSON text.
+
+    """
+    schema: dict[str, Any] = row_class.model_json_schema(mode="serialization", by_alias=True)
+    return {name: _get_column_type(prop) for name, prop in schema.get("properties", {}).items()}
+
+
+def _get_column_type(prop: dict[str, Any]) -> str:
+    types: set[str] = set()
+    for option in prop.get("anyOf", [prop]):
+        option_type: str | list[str] | None = option.get("type")
+        if isinstance(option_type, list):
+            types.update(option_type)
+        else:
+            types.add(option_type or JSON_COLUMN)
+
+    types.discard("null")
+    if types and types <= {"integer", "number"}:
+        return "number" if "number" in types else "integer"
+
+    if types in ({"boolean"}, {"string"}):
+        return types.pop()
+
+    return JSON_COLUMN
+
+
+def _to_column_value(value: Any, column_type: str) -> Any:  # noqa: ANN401
+    if value is None or column_type in {"integer", "number", "boolean"}:
+        return value
+
+    jsonable: Any = to_jsonable_python(value)
+    return jsonable if isinstance(jsonable, str) else json.dumps(jsonable)
+
+
+class ColumnarReportWriter(ReportWriter):
+    """Writes rows to a Parquet or Arrow IPC stream report file.
+
+    Column types come from the row class of the first row. Each flush writes the pending rows
+    as one Parquet row group or Arrow record batch. An Arrow stream can be read up to its last
+    flush after a crash, while a Parquet file is only readable once it is closed.
+    """
+
+    __slots__ = ("_columns", "_file", "_format", "_pa", "_pending", "_schema", "_writer")
+
+    def __init__(
+        self,
+        path: pathlib.Path,
+        columnar_format: ColumnarFormat,
+        *,
+        flush_rows: int,
+        flush_interval: float,
+        fsync: bool = False,
+    ) -> None:
+        self._pa: ModuleType = import_pyarrow()
+        self._format: ColumnarFormat = columnar_format
+        self._file: BinaryIO | None = None
+        self._columns: dict[str, str] | None = None
+        self._schema: Any = None
+        self._writer: Any = None
+        self._pending: list[dict[str, Any]] = []
+        super().__init__(path, flush_rows=flush_rows, flush_interval=flush_interval, fsync=fsync)
+
+    @override
+    def _open(self) -> None:
+        self._file = self.path.open("wb")
+
+    @override
+    def _write_row(self, row: CsvRow) -> None:
+        data: dict[str, Any] = row.model_dump(by_alias=True)
+        if self._columns is None:
+            types: dict[str, str] = get_column_types(type(row))
+            self._columns = {name: types.get(name, JSON_COLUMN) for name in data}
+            self._schema = self._pa.schema([
+                (name, self._get_arrow_type(column_type))
+                for name, column_type in self._columns.items()
+            ])
+
+        self._pending.append({
+            name: _to_column_value(data.get(name), column_type)
+            for name, column_type in self._columns.items()
+        })
+
+    @override
+    def _flush(self) -> None:
+        if not self._pending or self._file is None:
+            return
+
+        table: Any = self._pa.Table.from_pylist(self._pending, schema=self._schema)
+        if self._writer is None:
+            self._writer = self._create_writer(self._file)
+
+        self._writer.write_table(table)
+        self._pending.clear()
+        self._file.flush()
+        if self.fsync:
+            os.fsync(self._file.fileno())
+
+    @override
+    def _close(self) -> None:
+        if self._writer is not None:
+            self._writer.close()
+
+        if self._file is not None:
+            self._file.close()
+
+    def _create_writer(self, file: BinaryIO) -> Any:  # noqa: ANN401
+        if self._format == ColumnarFormat.PARQUET:
+            parquet: ModuleType = importlib.import_module("pyarrow.parquet")
+            return parquet.ParquetWriter(file, self._schema)
+
+        ipc: ModuleType = importlib.import_module("pyarrow.ipc")
+        return ipc.new_stream(file, self._schema)
+
+    def _get_arrow_type(self, column_type: str) -> Any:  # noqa: ANN401
+        match column_type:
+            case "integer":
+                return self._pa.int64()
+            case "number":
+                return self._pa.float64()
+            case "boolean":
+                return self._pa.bool_()
+            case _:
+                return self._pa.string()
+
+
+_streamed_reports: dict[int, ColumnarReportWriter] = {}
+_streamed_reports_lock = asyncio.Lock()
+
+
+async def open_columnar_report() -> ColumnarReportWriter:
+    """Create a new columnar report file in the configured format and start its writer thread.
+
+    Returns:
+        ColumnarReportWriter: The writer of the new report file.
+
+    """
+    columnar_format: ColumnarFormat = ColumnarFormat(CONFIG.columnar_report)
+    return ColumnarReportWriter(
+        await new_report_path(REPORT_SUFFIXES[columnar_format]),
+        columnar_format,
+        flush_rows=CONFIG.columnar_row_group_size,
+        flush_interval=CONFIG.columnar_flush_interval_sec,
+    )
+
+
+async def write_columnar_report(rows: Iterable[CsvRow]) -> None:
+    if not rows:
+        logger.warning("No rows to write, skipping columnar report file creation")
+        return
+
+    writer: ColumnarReportWriter = await open_columnar_report()
+    try:
+        for row in rows:
+            await writer.write(row)
+    finally:
+        await writer.aclose()
+
+
+async def append_columnar_row(row: CsvRow, run_index: int) -> None:
+    """Append a row to the columnar report file of a suite run, creating it for its first row."""
+    writer: ColumnarReportWriter | None = _streamed_reports.get(run_index)
+    if writer is None:
+        async with _streamed_reports_lock:
+            writer = _streamed_reports.get(run_index)
+            if writer is None:
+                writer = _streamed_reports[run_index] = await open_columnar_report()
+
+    await writer.write(row)
+
+
+async def close_columnar_report(run_index: int) -> bool:
+    """Close the columnar report file that the rows of a suite run were appended to.
+
+    Returns:
+        bool: True if rows of the run were appended to a columnar report file, False otherwise.
+
+    """
+    writer: ColumnarReportWriter | None = _streamed_reports.pop(run_index, None)
+    if writer is None:
+        return False
+
+    await writer.aclose()
+    return True
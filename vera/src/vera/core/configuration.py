@@ -13,11 +13,11 @@
 # limitations under the License.
 
 from pathlib import Path
-from typing import Any, Self, cast
+from typing import Any, Literal, Self, cast
 
 import yaml
 from platformdirs import user_config_dir
-from pydantic import BaseModel, ConfigDict
+from pydantic import BaseModel, ConfigDict, PositiveFloat, PositiveInt
 from pydantic_core import PydanticUndefined
 
 from vera.project_name import PROJECT_NAME
@@ -32,8 +32,32 @@ class VeraConfig[T](BaseModel):
     gemini_api_key: str | None = None
     report_name: str = "report"
     enable_csv_report: bool = True
+    csv_flush_rows: PositiveInt = 50
+    csv_flush_interval_sec: PositiveFloat = 2.0
+    csv_fsync: bool = False
+    columnar_report: Literal["parquet", "arrow"] | None = None
+    columnar_row_group_size: PositiveInt = 1000
+    columnar_flush_interval_sec: PositiveFloat = 60.0
     log_level: str = "INFO"
     verbose: bool = False
+    feature_concurrency: PositiveInt = 16
+    static_concurrency: PositiveInt = 8
+    llm_concurrency: PositiveInt = 16
+    workers: PositiveInt = 1
+    repeat: Literal["suite", "judge"] = "suite"
+    max_runs: PositiveInt = 10
+    ci_width: PositiveFloat = 0.25
+    enable_llm_cache: bool = False
+    refresh_llm_cache: bool = False
+    llm_cache_max_size_mb: PositiveInt = 512
+    llm_cache_ttl_days: PositiveInt | None = 30
+    enable_feature_cache: bool = False
+    feature_cache_max_size_mb: PositiveInt = 1024
+    feature_cache_ttl_days: PositiveInt | None = 30
+    judge_mode: Literal["interactive", "batch"] = "interactive"
+    judge_batch_size: PositiveInt = 500
+    resume_batch: bool = False
+    enable_results_store: bool = True
 
     @classmethod
     def get(cls) -> Self:
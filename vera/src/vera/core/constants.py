@@ -18,3 +18,4 @@ GOLDEN_DATASET_FILE: str = "golden_dataset.md"
 SAFETY_CONSTRAINTS_FILE: str = "safety_constraints.md"
 SCORING_RUBRIC_FILE: str = "scoring_rubric.md"
 STYLE_GUIDELINES_FILE: str = "style_guidelines.md"
+EVALUATION_TASK_TEMPLATE_FILE: str = "test_task.md"
@@ -0,0 +1,173 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import dataclasses
+import hashlib
+import json
+import logging
+import time
+from typing import TYPE_CHECKING
+
+from google.genai.errors import ClientError
+from google.genai.types import (
+    CachedContent,
+    CreateCachedContentConfig,
+    Tool,
+    UpdateCachedContentConfig,
+)
+
+from vera.project_name import PROJECT_NAME
+
+from .throttling import estimate_tokens
+
+if TYPE_CHECKING:
+    from google.genai.caches import AsyncCaches
+
+logger: logging.Logger = logging.getLogger(PROJECT_NAME)
+
+MIN_CACHED_TOKENS: int = 1024
+EXPIRY_MARGIN_SEC: float = 30.0
+
+
+@dataclasses.dataclass(slots=True)
+class _CachedContext:
+    lock: asyncio.Lock = dataclasses.field(default_factory=asyncio.Lock)
+    name: str | None = None
+    expires_at: float = 0.0
+    refresh_at: float = 0.0
+    disabled: bool = False
+
+
+class ContextCacheRegistry:
+    """Shares Gemini cached contents between requests that use the same system instruction.
+
+    The first request for a system instruction creates a cached content holding it and the tools,
+    and later requests reference it by name instead of resending it. Once half of the time to live
+    has passed, the next request extends it, and an expired cached content is created again.
+    Contents that the API refuses to cache, for example because they are too small, are sent
+    inline from then on.
+    """
+
+    __slots__ = ("_caches", "_contexts")
+
+    def __init__(self, caches: AsyncCaches) -> None:
+        self._caches: AsyncCaches = caches
+        self._contexts: dict[str, _CachedContext] = {}
+
+    async def get(
+        self,
+        *,
+        model: str,
+        system_instruction: str,
+        tools: list[Tool],
+        ttl_seconds: int,
+    ) -> str | None:
+        """Returns the name of a live cached content for the system instruction and tools.
+
+        Args:
+            model: The model the cached content is used with.
+            system_instruction: The system instruction to cache.
+            tools: The tools to cache with the system instruction.
+            ttl_seconds: How long the cached content lives after its last refresh.
+
+        Returns:
+            str | None: The cached content name, or None if the content should be sent inline.
+
+        """
+        if estimate_tokens(system_instruction) < MIN_CACHED_TOKENS:
+            return None
+
+        key: str = _context_key(model, system_instruction, tools)
+        context: _CachedContext = self._contexts.setdefault(key, _CachedContext())
+        if context.disabled:
+            return None
+
+        async with context.lock:
+            now: float = time.monotonic()
+            if context.name is None or now >= context.expires_at - EXPIRY_MARGIN_SEC:
+                await self._create(context, model, system_instruction, tools, ttl_seconds)
+            elif now >= context.refresh_at:
+                await self._refresh(context, ttl_seconds)
+
+            return context.name
+
+    async def aclose(self) -> None:
+        """Delete all cached contents created by the registry."""
+        names: list[str] = [c.name for c in self._contexts.values() if c.name is not None]
+        self._contexts.clear()
+        results: list[BaseException | None] = await asyncio.gather(
+            *(self._caches.delete(name=name) for name in names),
+            return_exceptions=True,
+        )
+        for name, result in zip(names, results, strict=True):
+            if isinstance(result, Exception):
+                logger.warning("Failed to delete cached content %s: %s", name, result)
+
+    async def _create(
+        self,
+        context: _CachedContext,
+        model: str,
+        system_instruction: str,
+        tools: list[Tool],
+        ttl_seconds: int,
+    ) -> None:
+        try:
+            cached: CachedContent = await self._caches.create(
+                model=model,
+                config=CreateCachedContentConfig(
+                    system_instruction=system_instruction,
+                    tools=tools,
+                    ttl=f"{ttl_seconds}s",
+                    display_name=PROJECT_NAME,
+                ),
+            )
+        except ClientError as e:
+            logger.warning("Could not cache the system prompt, sending it inline: %s", e)
+            context.name = None
+            context.disabled = True
+            return
+
+        logger.debug("Created cached content %s", cached.name)
+        context.name = cached.name
+        self._extend(context, ttl_seconds)
+
+    async def _refresh(self, context: _CachedContext, ttl_seconds: int) -> None:
+        try:
+            await self._caches.update(
+                name=context.name,
+                config=UpdateCachedContentConfig(ttl=f"{ttl_seconds}s"),
+            )
+        except ClientError as e:
+            # The content is still usable until it expires, so try again on the next request
+            logger.warning("Failed to refresh cached content %s: %s", context.name, e)
+            return
+
+        logger.debug("Refreshed cached content %s", context.name)
+        self._extend(context, ttl_seconds)
+
+    @staticmethod
+    def _extend(context: _CachedContext, ttl_seconds: int) -> None:
+        now: float = time.monotonic()
+        context.expires_at = now + ttl_seconds
+        context.refresh_at = now + ttl_seconds / 2
+
+
+def _context_key(model: str, system_instruction: str, tools: list[Tool]) -> str:
+    data: str = json.dumps({
+        "model": model,
+        "system_instruction": system_instruction,
+        "tools": [tool.model_dump(mode="json", exclude_none=True) for tool in tools],
+    })
+    return hashlib.sha256(data.encode()).hexdigest()
@@ -86,12 +86,16 @@ class LlmSdk[T_LlmConfig: LlmConfig](AbstractAsyncContextManager, abc.ABC):
         /,
         *,
         response_json_schema: type[T_Schema] | None = None,
+        request_keys: list[str] | None = None,
     ) -> list[T_Schema | str]:
         """Send multiple messages to the LLM provider in bulk.
 
         Args:
             prompts: The prompts to send to the LLM provider.
             response_json_schema: The JSON schema to validate the responses against.
+            request_keys: Stable identities of the prompts, such as the test case run each one
+                evaluates, used to resume requests sent by an earlier process even if their
+                prompts changed since.
 
         Returns:
             The responses from the LLM provider.
@@ -18,3 +18,4 @@ from pydantic import BaseModel
 class TestCaseConfig(BaseModel):
     timeout_seconds: int = 600
     strict_mode: bool = False
+    cacheable: bool = True
@@ -13,28 +13,30 @@
 # limitations under the License.
 
 import asyncio
-import io
 import logging
 from collections.abc import Iterable  # noqa: TC003
-from string import Template
+from string import Template  # noqa: TC003
 
 import anyio
 from rich.progress import Progress, TaskID  # noqa: TC002
 
-from vera.core.data_models.llm_sdk import LlmConfig
+from vera.core.data_models.llm_sdk import LlmConfig, LlmSdk
 from vera.hook_impl import hook_impl
 from vera.project_name import PROJECT_NAME
 
 from . import constants
+from .columnar_report import append_columnar_row, close_columnar_report, write_columnar_report
 from .configuration import CONFIG
 from .data_models.csv import CsvColumn, CsvRow
 from .data_models.test_case import TestCase  # noqa: TC001
 from .data_models.test_case.input import TestCaseInput
 from .data_models.test_case.output import TestCaseOutput
-from .gemini import Gemini, GeminiConfig
+from .gemini import CLIENT_POOL, Gemini, GeminiConfig
 from .hook_specs import PluginService  # noqa: TC001
+from .llm_cache import LlmResponseCache, get_llm_cache
+from .prompt_cache import PromptBundle, PromptCache  # noqa: TC001
 from .rich_cli_service import RichCliService
-from .write_results_to_file import write_to_file
+from .write_results_to_file import append_row, close_report, write_to_file
 
 logger: logging.Logger = logging.getLogger(PROJECT_NAME)
 
@@ -49,23 +51,24 @@ async def llm_evaluation[T_Input: TestCaseInput, T_Output: TestCaseOutput, T_Llm
     test_case: TestCase[T_Input],
     test_output: T_Output,
     plugin_service: PluginService,
+    prompt_cache: PromptCache,
 ) -> CsvColumn:
-    specs_path: anyio.Path = plugin_service.get_llm_specs_dir()
-    specs: tuple[str, ...] = await plugin_service.get_spec_files(specs_dir=specs_path)
+    prompts: PromptBundle = await prompt_cache.get()
     llm_config: T_LlmConfig = plugin_service.get_llm_configuration()
-    async with plugin_service.get_llm_sdk(config=llm_config) as llm:
-        system_prompt: io.StringIO = io.StringIO()
-        for s in specs:
-            system_prompt.write(s)
-            system_prompt.write("\n\n")
+    sdk: LlmSdk[T_LlmConfig] = plugin_service.get_llm_sdk(config=llm_config)
+    cache: LlmResponseCache | None = get_llm_cache()
+    if cache is not None:
+        sdk = cache.wrap(sdk)
 
-        llm.set_system_prompt_to_session(system_prompt.getvalue())
+    async with sdk as llm:
+        llm.set_system_prompt_to_session(prompts.system_prompt)
 
         resources_dir: anyio.Path = plugin_service.get_resources_dir()
         prompt: str = await plugin_service.create_evaluation_task_prompt(
             resources_dir=resources_dir,
             test_case=test_case,
             test_output=test_output,
+            task_template=prompts.task_template,
         )
         schema: type[CsvColumn] = plugin_service.get_llm_csv_columns_class()
         return await llm.send_message(
@@ -82,7 +85,7 @@ def get_llm_configuration() -> GeminiConfig:
 
 @hook_impl
 def get_llm_sdk(config: GeminiConfig) -> Gemini:
-    return Gemini(config)
+    return CLIENT_POOL.session(config)
 
 
 @hook_impl
@@ -91,14 +94,36 @@ async def publish_results[
     T_Out: TestCaseOutput,
     T_Col1: CsvColumn,
     T_Col2: CsvColumn,
-](rows: Iterable[CsvRow[T_In, T_Out, T_Col1, T_Col2]], _: int = 0) -> None:
+](rows: Iterable[CsvRow[T_In, T_Out, T_Col1, T_Col2]], run_index: int) -> None:
+    if CONFIG.columnar_report is not None and not await close_columnar_report(run_index):
+        await write_columnar_report(rows)
+
     if not CONFIG.enable_csv_report:
         logger.debug("CSV report generation is disabled")
         return
 
+    if await close_report(run_index):
+        return
+
     await write_to_file(rows)
 
 
+@hook_impl
+async def on_row_completed[
+    T_In: TestCaseInput,
+    T_Out: TestCaseOutput,
+    T_Col1: CsvColumn,
+    T_Col2: CsvColumn,
+](row: CsvRow[T_In, T_Out, T_Col1, T_Col2], run_index: int) -> None:
+    if CONFIG.columnar_report is not None:
+        await append_columnar_row(row, run_index)
+
+    if not CONFIG.enable_csv_report:
+        return
+
+    await append_row(row, run_index)
+
+
 @hook_impl
 async def create_evaluation_task_prompt[
     T_Input: TestCaseInput,
@@ -107,21 +132,24 @@ async def create_evaluation_task_prompt[
     resources_dir: anyio.Path,
     test_case: TestCase[T_Input],
     test_output: T_Output,
+    task_template: Template,
 ) -> str:
-    prompt_file: anyio.Path = anyio.Path(__file__).parent / "prompts" / "test_task.md"
-    task_prompt: str = await prompt_file.read_text(encoding="utf-8")
-
     example_output: str = "N/A"
     if test_case.expected_output is not None:
         example_output = str(await test_case.expected_output.get_expected_output(resources_dir))
 
-    return Template(task_prompt).substitute(
+    return task_template.substitute(
         formatted_input_string=test_case.input.to_description_prompt(),
         actual_output_string=test_output.to_output_description_prompt(),
         example_output=example_output,
     )
 
 
+@hook_impl
+def get_evaluation_task_template_path() -> anyio.Path:
+    return anyio.Path(__file__).parent / "prompts" / constants.EVALUATION_TASK_TEMPLATE_FILE
+
+
 @hook_impl
 async def get_spec_files(specs_dir: anyio.Path) -> tuple[str, ...]:
     return await asyncio.gather(
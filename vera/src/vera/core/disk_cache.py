@@ -0,0 +1,166 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import logging
+import sqlite3
+import threading
+import time
+import zlib
+from typing import TYPE_CHECKING
+
+from vera.project_name import PROJECT_NAME
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+logger: logging.Logger = logging.getLogger(PROJECT_NAME)
+
+SQLITE_TIMEOUT_SEC: float = 30.0
+EVICTION_BATCH_SIZE: int = 256
+
+_SCHEMA: str = """
+CREATE TABLE IF NOT EXISTS entries (
+    key TEXT PRIMARY KEY,
+    value BLOB NOT NULL,
+    size INTEGER NOT NULL,
+    created_at REAL NOT NULL,
+    accessed_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS entries_accessed_at ON entries (accessed_at);
+"""
+
+
+class DiskCache:
+    """A size-capped key-value store in a SQLite file.
+
+    Values are compressed with zlib. When the total size goes over the cap, the least recently
+    used entries are evicted. Entries older than the time to live are treated as missing.
+    The blocking SQLite calls run in a worker thread.
+    """
+
+    __slots__ = ("_connection", "_lock", "_size", "max_size_bytes", "path", "ttl_seconds")
+
+    def __init__(self, path: Path, max_size_bytes: int, ttl_seconds: float | None = None) -> None:
+        self.path: Path = path
+        self.max_size_bytes: int = max_size_bytes
+        self.ttl_seconds: float | None = ttl_seconds
+        self._lock: threading.Lock = threading.Lock()
+        self._connection: sqlite3.Connection | None = None
+        self._size: int = 0
+
+    async def get(self, key: str) -> bytes | None:
+        return await asyncio.to_thread(self._get, key)
+
+    async def set(self, key: str, value: bytes) -> None:
+        await asyncio.to_thread(self._set, key, value)
+
+    def close(self) -> None:
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._connection is not None:
+            return self._connection
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        connection: sqlite3.Connection = sqlite3.connect(
+            self.path,
+            timeout=SQLITE_TIMEOUT_SEC,
+            check_same_thread=False,
+            isolation_level=None,
+        )
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute("PRAGMA synchronous=NORMAL")
+        connection.executescript(_SCHEMA)
+        if self.ttl_seconds is not None:
+            connection.execute(
+                "DELETE FROM entries WHERE created_at < ?", (time.time() - self.ttl_seconds,)
+            )
+
+        self._size = connection.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+        logger.debug("Opened cache %s (%s bytes)", self.path, self._size)
+        self._connection = connection
+        return connection
+
+    def _get(self, key: str) -> bytes | None:
+        with self._lock:
+            connection: sqlite3.Connection = self._connect()
+            entry: tuple[bytes, float] | None = connection.execute(
+                "SELECT value, created_at FROM entries WHERE key = ?", (key,)
+            ).fetchone()
+            if entry is None:
+                return None
+
+            value, created_at = entry
+            now: float = time.time()
+            if self.ttl_seconds is not None and now - created_at > self.ttl_seconds:
+                self._delete(connection, [key])
+                return None
+
+            connection.execute("UPDATE entries SET accessed_at = ? WHERE key = ?", (now, key))
+
+        return zlib.decompress(value)
+
+    def _set(self, key: str, value: bytes) -> None:
+        compressed: bytes = zlib.compress(value)
+        now: float = time.time()
+        with self._lock:
+            connection: sqlite3.Connection = self._connect()
+            self._delete(connection, [key])
+            connection.execute(
+                "INSERT INTO entries (key, value, size, created_at, accessed_at)"
+                " VALUES (?, ?, ?, ?, ?)",
+                (key, compressed, len(compressed), now, now),
+            )
+            self._size += len(compressed)
+            if self._size > self.max_size_bytes:
+                self._evict(connection)
+
+    def _evict(self, connection: sqlite3.Connection) -> None:
+        # Other processes may share the file, so start from the real size
+        self._size = connection.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+        while self._size > self.max_size_bytes:
+            oldest: list[tuple[str, int]] = connection.execute(
+                "SELECT key, size FROM entries ORDER BY accessed_at LIMIT ?",
+                (EVICTION_BATCH_SIZE,),
+            ).fetchall()
+            if not oldest:
+                break
+
+            keys: list[str] = []
+            remaining_size: int = self._size
+            for key, size in oldest:
+                if remaining_size <= self.max_size_bytes:
+                    break
+
+                keys.append(key)
+                remaining_size -= size
+
+            logger.debug("Evicting %s entries from cache %s", len(keys), self.path)
+            connection.execute("BEGIN")
+            try:
+                self._delete(connection, keys)
+            finally:
+                connection.execute("COMMIT")
+
+    def _delete(self, connection: sqlite3.Connection, keys: list[str]) -> None:
+        for key in keys:
+            deleted: tuple[int] | None = connection.execute(
+                "DELETE FROM entries WHERE key = ? RETURNING size", (key,)
+            ).fetchone()
+            if deleted is not None:
+                self._size -= deleted[0]
@@ -19,3 +19,7 @@ class ApiKeyNotFoundError(Exception):
 
 class TestCaseTestingError(Exception):
     """An error occurred during evaluation."""
+
+
+class WorkerError(Exception):
+    """A test case failed in a worker process, or the worker process failed."""
@@ -0,0 +1,160 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import hashlib
+import json
+import logging
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from platformdirs import user_cache_dir
+
+from vera.project_name import PROJECT_NAME
+
+from .configuration import CONFIG
+from .disk_cache import DiskCache
+from .llm_cache import BYTES_PER_MB, SECONDS_PER_DAY
+from .serialization import dump_model_state, load_model_state
+
+if TYPE_CHECKING:
+    import anyio
+
+    from .data_models.test_case import TestCase
+    from .data_models.test_case.output import TestCaseOutput
+    from .hook_specs import PluginService
+
+logger: logging.Logger = logging.getLogger(PROJECT_NAME)
+
+FEATURE_CACHE_FILE_NAME: str = "feature_cache.sqlite"
+
+
+class FeatureOutputCache[T_Output: TestCaseOutput]:
+    """Persistent cache of feature outputs, for features that are deterministic.
+
+    The key covers the plugin's feature version, the test case input and the content of the
+    resource file the input refers to. Files the feature reads on its own are not covered, so
+    plugins should change their feature version when they or the feature change.
+    """
+
+    __slots__ = ("_resource_hashes", "output_class", "store", "version")
+
+    def __init__(self, store: DiskCache, output_class: type[T_Output], version: str) -> None:
+        """Create a feature output cache.
+
+        Args:
+            store: The store holding the cached outputs.
+            output_class: The plugin's output class, used to recreate the cached outputs.
+            version: The plugin's feature version.
+
+        """
+        self.store: DiskCache = store
+        self.output_class: type[T_Output] = output_class
+        self.version: str = version
+        self._resource_hashes: dict[str, str] = {}
+
+    async def key(self, test_case: TestCase, resources_dir: anyio.Path) -> str:
+        """Computes the cache key of the output of a test case.
+
+        Returns:
+            str: The hex digest identifying the output.
+
+        """
+        key: dict[str, Any] = {
+            "version": self.version,
+            "input": test_case.input.model_dump_json(),
+            "resource": await self._hash_resource(resources_dir, test_case.input.file_name),
+        }
+        return hashlib.sha256(json.dumps(key, sort_keys=True).encode()).hexdigest()
+
+    async def get(self, key: str) -> T_Output | None:
+        value: bytes | None = await self.store.get(key)
+        if value is None:
+            return None
+
+        try:
+            return load_model_state(self.output_class, json.loads(value))
+        except (ValueError, TypeError) as e:
+            logger.debug("Ignoring unreadable cached feature output %s: %s", key, e)
+            return None
+
+    async def set(self, key: str, output: T_Output) -> None:
+        await self.store.set(key, json.dumps(dump_model_state(output)).encode())
+
+    def close(self) -> None:
+        self.store.close()
+
+    async def _hash_resource(self, resources_dir: anyio.Path, file_name: str | None) -> str | None:
+        if file_name is None:
+            return None
+
+        path: anyio.Path = resources_dir / file_name
+        if (digest := self._resource_hashes.get(str(path))) is None:
+            try:
+                digest = hashlib.sha256(await path.read_bytes()).hexdigest()
+            except FileNotFoundError:
+                digest = "missing"
+
+            self._resource_hashes[str(path)] = digest
+
+        return digest
+
+
+def get_feature_cache_path() -> Path:
+    return Path(user_cache_dir(appname=PROJECT_NAME)) / FEATURE_CACHE_FILE_NAME
+
+
+_feature_cache: FeatureOutputCache[Any] | None = None
+
+
+def get_feature_cache(plugin_service: PluginService) -> FeatureOutputCache[Any] | None:
+    """Returns the process-wide feature output cache.
+
+    Returns:
+        FeatureOutputCache | None: The cache, created on first use, or None if it is disabled
+            or the plugin does not provide its feature version and output class.
+
+    """
+    global _feature_cache  # noqa: PLW0603
+    if not CONFIG.enable_feature_cache:
+        return None
+
+    if _feature_cache is None:
+        version: str | None = plugin_service.get_feature_version()
+        output_class: type[TestCaseOutput] | None = plugin_service.get_output_class()
+        if version is None or output_class is None:
+            logger.warning(
+                "Not caching feature outputs, the plugin does not implement "
+                "get_feature_version and get_output_class"
+            )
+            return None
+
+        ttl_days: int | None = CONFIG.feature_cache_ttl_days
+        _feature_cache = FeatureOutputCache(
+            DiskCache(
+                get_feature_cache_path(),
+                max_size_bytes=CONFIG.feature_cache_max_size_mb * BYTES_PER_MB,
+                ttl_seconds=ttl_days * SECONDS_PER_DAY if ttl_days is not None else None,
+            ),
+            output_class,
+            version,
+        )
+
+    return _feature_cache
+
+
+def close_feature_cache() -> None:
+    global _feature_cache  # noqa: PLW0603
+    if _feature_cache is not None:
+        _feature_cache.close()
+        _feature_cache = None
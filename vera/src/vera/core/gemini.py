@@ -13,9 +13,12 @@
 # limitations under the License.
 
 import asyncio
+import hashlib
+import inspect
 import io
 import json
 import logging
+import tempfile
 from typing import TYPE_CHECKING, Annotated, Any, Literal, Self, overload, override
 
 from google import genai
@@ -24,20 +27,21 @@ from google.genai.types import (
     BatchJob,
     Content,
     GenerateContentConfig,
+    GenerateContentResponseUsageMetadata,
     GoogleSearch,
     HarmBlockThreshold,
     HarmCategory,
     InlinedRequest,
     InlinedResponse,
+    JobError,
     Part,
     SafetySetting,
     ThinkingConfig,
     ThinkingLevel,
     Tool,
-    ToolListUnion,
     UrlContext,
 )
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PositiveInt, ValidationError
 from tenacity import (
     RetryCallState,
     after_log,
@@ -50,24 +54,30 @@ from tenacity import (
 )
 
 from vera.core import exceptions
-from vera.core.configuration import VeraConfig
+from vera.core.configuration import CONFIG, VeraConfig
 from vera.project_name import PROJECT_NAME
 
+from .batch_jobs import ACTIVE_JOB_STATES, BatchJobPoller, BatchJobStore, get_batch_job_store
+from .context_cache import ContextCacheRegistry
 from .data_models.llm_config import LlmConfig
 from .data_models.llm_sdk import LlmSdk
+from .throttling import RateLimiter, estimate_tokens, get_llm_limiter, get_rate_limiter
 
 if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable, Iterable, Iterator
     from types import TracebackType
 
     from google.genai.client import AsyncClient
 
 
-POLL_BATCH_DELAY_SEC: int = 10
+BATCH_KEY_METADATA: str = "key"
 SERVER_ERROR_STATUS_CODE: int = 500
 RATE_LIMIT_STATUS_CODE: int = 429
 
 logger: logging.Logger = logging.getLogger(PROJECT_NAME)
 
+type BatchItemResult[T_Schema: BaseModel] = T_Schema | str | Exception
+
 
 class GeminiConfig(LlmConfig):
     model_name: str = "gemini-3-pro-preview"
@@ -83,6 +93,22 @@ class GeminiConfig(LlmConfig):
         bool,
         Field(description="Whether to add a response validate instruction in the system prompt"),
     ] = True
+    requests_per_minute: Annotated[
+        PositiveInt | None,
+        Field(description="Requests per minute quota shared by all clients of this model"),
+    ] = None
+    tokens_per_minute: Annotated[
+        PositiveInt | None,
+        Field(description="Input tokens per minute quota shared by all clients of this model"),
+    ] = None
+    context_caching: Annotated[
+        bool,
+        Field(description="Whether to send the system prompt once as cached content"),
+    ] = True
+    context_cache_ttl_seconds: Annotated[
+        PositiveInt,
+        Field(description="How long the cached system prompt lives after its last use"),
+    ] = 900
 
     @override
     @property
@@ -121,11 +147,41 @@ def _should_retry_exception(e: BaseException) -> bool:
 
 
 class Gemini(LlmSdk[GeminiConfig]):
-    def __init__(self, config: GeminiConfig) -> None:
+    def __init__(
+        self,
+        config: GeminiConfig,
+        client: AsyncClient | None = None,
+        context_caches: ContextCacheRegistry | None = None,
+        batch_poller: BatchJobPoller | None = None,
+    ) -> None:
+        """Create a Gemini session.
+
+        Args:
+            config: The Gemini configuration.
+            client: A shared client to send requests with. The session does not close a shared
+                client. If None, the session creates its own client and closes it on exit.
+            context_caches: The cached contents shared with the other sessions of the client.
+                If None, the session keeps its own and deletes them on exit.
+            batch_poller: The poller shared with the other sessions of the client. If None,
+                the session polls its own batch jobs.
+
+        """
         super().__init__(config)
-        self.client: AsyncClient = genai.client.Client(api_key=self.config.api_key).aio
+        self.owns_client: bool = client is None
+        self.client: AsyncClient = client or genai.client.Client(api_key=self.config.api_key).aio
+        self.owns_context_caches: bool = context_caches is None
+        self.context_caches: ContextCacheRegistry = context_caches or ContextCacheRegistry(
+            self.client.caches
+        )
+        self.owns_batch_poller: bool = batch_poller is None
+        self.batch_poller: BatchJobPoller = batch_poller or BatchJobPoller(self.client.batches)
         self.content: Content = Content(role="user", parts=[])
         self.bulk_threshold: int = 4
+        self.rate_limiter: RateLimiter | None = get_rate_limiter(
+            self.config.model_name,
+            self.config.requests_per_minute,
+            self.config.tokens_per_minute,
+        )
 
     @override
     async def __aenter__(self) -> Self:
@@ -209,21 +265,30 @@ class Gemini(LlmSdk[GeminiConfig]):
         if response_json_schema is not None:
             schema = response_json_schema.model_json_schema()
 
-        config: GenerateContentConfig = self.create_generate_content_config(schema)
+        config: GenerateContentConfig = self.create_generate_content_config(
+            schema, cached_content=await self._get_cached_content()
+        )
         logger.debug("Sending prompt: %s", prompt)
         if not self.content.parts:
             self.content.parts = []
 
         self.content.parts.append(Part.from_text(text=prompt))
 
+        charged_tokens: int = await self._wait_for_quota(self.content.parts)
+        usage: GenerateContentResponseUsageMetadata | None = None
         response: io.StringIO = io.StringIO()
-        async for chunk in await self.client.models.generate_content_stream(
-            model=self.config.model_name,
-            contents=self.content,
-            config=config,
-        ):
-            if chunk.text:
-                response.write(chunk.text)
+        async with get_llm_limiter().slot(is_overload=_should_retry_exception):
+            async for chunk in await self.client.models.generate_content_stream(
+                model=self.config.model_name,
+                contents=self.content,
+                config=config,
+            ):
+                if chunk.text:
+                    response.write(chunk.text)
+
+                usage = chunk.usage_metadata or usage
+
+        self._reconcile_quota(charged_tokens, usage)
 
         text: str = response.getvalue()
         logger.debug("Response text: %s", text)
@@ -240,9 +305,16 @@ class Gemini(LlmSdk[GeminiConfig]):
         return text
 
     async def close(self) -> None:
-        """Close the client."""
+        """Close the session, and the client if the session owns it."""
         self.clean_session_history()
-        await self.client.aclose()
+        if self.owns_context_caches:
+            await self.context_caches.aclose()
+
+        if self.owns_batch_poller:
+            await self.batch_poller.aclose()
+
+        if self.owns_client:
+            await self.client.aclose()
 
     @override
     def clean_session_history(self) -> None:
@@ -256,12 +328,16 @@ class Gemini(LlmSdk[GeminiConfig]):
         /,
         *,
         response_json_schema: type[T_Schema] | None = None,
+        request_keys: list[str] | None = None,
     ) -> list[T_Schema | str]:
         """Send multiple messages to the LLM and get responses.
 
         Args:
             prompts: The prompts to send to the LLM.
             response_json_schema: The JSON schema to use for validation.
+            request_keys: Stable identities of the prompts. With ``resume_batch``, requests
+                are matched to the jobs of an earlier process by these keys instead of by their
+                prompts, which may embed nondeterministic content such as a feature output.
 
         Returns:
             The LLM responses as a list of strings or Pydantic models.
@@ -277,9 +353,193 @@ class Gemini(LlmSdk[GeminiConfig]):
             ])
 
         requests: list[InlinedRequest] = self._prepare_batch_requests(prompts, response_json_schema)
-        batch_job: BatchJob = await self._create_batch_job(requests)
-        await self._poll_batch_job(batch_job)
-        return await self._get_batch_results(batch_job, response_json_schema)
+        keys: list[str | None] = list(request_keys) if request_keys else [None] * len(requests)
+        fingerprints: list[str] = [
+            _fingerprint_request(request, key) for request, key in zip(requests, keys, strict=True)
+        ]
+        store: BatchJobStore = get_batch_job_store()
+        resumable: dict[str, list[str]] = {}
+        if CONFIG.resume_batch:
+            resumable = await store.find(fingerprints)
+
+        resumed: set[str] = {f for job_fingerprints in resumable.values() for f in job_fingerprints}
+        new_requests: list[tuple[InlinedRequest, str]] = [
+            (request, fingerprint)
+            for request, fingerprint in zip(requests, fingerprints, strict=True)
+            if fingerprint not in resumed
+        ]
+        jobs: list[Awaitable[dict[str, BatchItemResult[T_Schema]]]] = [
+            self._resume_batch_job(
+                store,
+                name,
+                job_fingerprints,
+                [
+                    (r, f)
+                    for r, f in zip(requests, fingerprints, strict=True)
+                    if f in job_fingerprints
+                ],
+                response_json_schema,
+            )
+            for name, job_fingerprints in resumable.items()
+        ]
+        if new_requests:
+            jobs.append(self._run_batch_job(store, new_requests, response_json_schema))
+
+        results: dict[str, BatchItemResult[T_Schema]] = {}
+        for job_results in await asyncio.gather(*jobs):
+            results.update(job_results)
+
+        return await self._order_batch_results(prompts, fingerprints, results, response_json_schema)
+
+    async def _run_batch_job[T_Schema: BaseModel](
+        self,
+        store: BatchJobStore,
+        requests: list[tuple[InlinedRequest, str]],
+        response_json_schema: type[T_Schema] | None,
+    ) -> dict[str, BatchItemResult[T_Schema]]:
+        """Submit a batch job, record it in the store and wait for its results.
+
+        Args:
+            store: The store to record the job in.
+            requests: The requests of the job, each with its fingerprint.
+            response_json_schema: Optional schema for JSON responses.
+
+        Returns:
+            dict[str, BatchItemResult[T_Schema]]: The result of each request, by fingerprint.
+
+        """
+        fingerprints: list[str] = [fingerprint for _, fingerprint in requests]
+        batch_job: BatchJob = await self._create_batch_job([request for request, _ in requests])
+        name: str = batch_job.name or ""
+        await store.add(name, fingerprints)
+        if batch_job.state in ACTIVE_JOB_STATES:
+            batch_job = await self.batch_poller.wait(name)
+
+        return await self._collect_batch_job(store, batch_job, fingerprints, response_json_schema)
+
+    async def _resume_batch_job[T_Schema: BaseModel](
+        self,
+        store: BatchJobStore,
+        name: str,
+        fingerprints: list[str],
+        requests: list[tuple[InlinedRequest, str]],
+        response_json_schema: type[T_Schema] | None,
+    ) -> dict[str, BatchItemResult[T_Schema]]:
+        """Wait for the results of a job submitted by an earlier process.
+
+        If the job can not be resumed, the given requests are submitted again in a new job.
+
+        Args:
+            store: The store the job was recorded in.
+            name: The name of the job.
+            fingerprints: The fingerprints of all requests of the job, in request order.
+            requests: The requests of the current batch that are part of the job, each with its
+                fingerprint.
+            response_json_schema: Optional schema for JSON responses.
+
+        Returns:
+            dict[str, BatchItemResult[T_Schema]]: The result of each request, by fingerprint.
+
+        """
+        logger.info("Resuming batch job %s", name)
+        try:
+            batch_job: BatchJob = await self.batch_poller.wait(name)
+            return await self._collect_batch_job(
+                store, batch_job, fingerprints, response_json_schema
+            )
+        except (ClientError, RuntimeError) as e:
+            logger.warning("Could not resume batch job %s, sending it again: %s", name, e)
+            return await self._run_batch_job(store, requests, response_json_schema)
+
+    async def _collect_batch_job[T_Schema: BaseModel](
+        self,
+        store: BatchJobStore,
+        batch_job: BatchJob,
+        fingerprints: list[str],
+        response_json_schema: type[T_Schema] | None,
+    ) -> dict[str, BatchItemResult[T_Schema]]:
+        """Retrieve the results of a finished batch job.
+
+        The job is removed from the store once it failed or its results were retrieved.
+
+        Returns:
+            dict[str, BatchItemResult[T_Schema]]: The result of each request, by fingerprint.
+
+        Raises:
+            RuntimeError: If the job did not succeed.
+
+        """
+        name: str = batch_job.name or ""
+        if batch_job.state != "JOB_STATE_SUCCEEDED":
+            await store.remove(name)
+            msg: str = f"Batch job {name} failed with state {batch_job.state}"
+            if batch_job.error:
+                msg += f": {batch_job.error}"
+
+            raise RuntimeError(msg)
+
+        results: dict[str, BatchItemResult[T_Schema]] = await self._get_batch_results(
+            batch_job, response_json_schema
+        )
+        await store.remove(name)
+        by_fingerprint: dict[str, BatchItemResult[T_Schema]] = {}
+        for key, result in results.items():
+            index: int = int(key) if key.isdigit() else -1
+            if not 0 <= index < len(fingerprints):
+                logger.warning("Ignoring result with unknown key %s of batch job %s", key, name)
+                continue
+
+            by_fingerprint[fingerprints[index]] = result
+
+        return by_fingerprint
+
+    async def _order_batch_results[T_Schema: BaseModel](
+        self,
+        prompts: list[str],
+        fingerprints: list[str],
+        results: dict[str, BatchItemResult[T_Schema]],
+        response_json_schema: type[T_Schema] | None,
+    ) -> list[T_Schema | str]:
+        """Order batch results by their requests and resend the failed requests one by one.
+
+        Args:
+            prompts: The prompts of the batch, in request order.
+            fingerprints: The fingerprints of the requests, in request order.
+            results: The batch results, by request fingerprint.
+            response_json_schema: Optional schema for JSON responses.
+
+        Returns:
+            list[T_Schema | str]: The responses in the order of the prompts. Requests that failed
+                again when resent have an empty response.
+
+        """
+        responses: list[T_Schema | str] = []
+        failed: list[int] = []
+        for index in range(len(prompts)):
+            result: BatchItemResult[T_Schema] | None = results.get(fingerprints[index])
+            if result is None or isinstance(result, Exception):
+                logger.warning("Batch request %s failed, resending it: %s", index, result)
+                failed.append(index)
+                result = ""
+
+            responses.append(result)
+
+        retried: list[T_Schema | str | BaseException] = await asyncio.gather(
+            *(
+                self._send_single_message_independent(prompts[index], response_json_schema)
+                for index in failed
+            ),
+            return_exceptions=True,
+        )
+        for index, response in zip(failed, retried, strict=True):
+            if isinstance(response, Exception):
+                logger.error("Resent batch request %s failed", index, exc_info=response)
+            elif isinstance(response, BaseException):
+                raise response
+            else:
+                responses[index] = response
+
+        return responses
 
     @retry(
         retry=retry_if_exception_type(ClientError),
@@ -306,19 +566,24 @@ class Gemini(LlmSdk[GeminiConfig]):
         if response_json_schema is not None:
             schema = response_json_schema.model_json_schema()
 
-        config: GenerateContentConfig = self.create_generate_content_config(schema)
+        config: GenerateContentConfig = self.create_generate_content_config(
+            schema, cached_content=await self._get_cached_content()
+        )
 
         parts: list[Part] = []
         if self.content.parts:
             parts.extend(self.content.parts)
         parts.append(Part.from_text(text=prompt))
 
-        response = await self.client.models.generate_content(
-            model=self.config.model_name,
-            contents=[Content(role="user", parts=parts)],
-            config=config,
-        )
+        charged_tokens: int = await self._wait_for_quota(parts)
+        async with get_llm_limiter().slot(is_overload=_should_retry_exception):
+            response = await self.client.models.generate_content(
+                model=self.config.model_name,
+                contents=[Content(role="user", parts=parts)],
+                config=config,
+            )
 
+        self._reconcile_quota(charged_tokens, response.usage_metadata)
         text: str = response.text or ""
         if response_json_schema is not None and text:
             return response_json_schema.model_validate_json(text, by_alias=True)
@@ -357,6 +622,7 @@ class Gemini(LlmSdk[GeminiConfig]):
                 InlinedRequest(
                     model=self.config.model_name,
                     contents=[Content(role="user", parts=parts)],
+                    metadata={BATCH_KEY_METADATA: str(len(inlined_requests))},
                     config=config,
                 )
             )
@@ -376,6 +642,10 @@ class Gemini(LlmSdk[GeminiConfig]):
             RuntimeError: If job creation fails.
 
         """
+        # Batch jobs have their own token quota, so only the job creation request is counted
+        if self.rate_limiter is not None:
+            await self.rate_limiter.acquire()
+
         batch_job: BatchJob = await self.client.batches.create(
             model=self.config.model_name,
             src=requests,
@@ -388,43 +658,11 @@ class Gemini(LlmSdk[GeminiConfig]):
         logger.info("Created batch job: %s", batch_job.name)
         return batch_job
 
-    async def _poll_batch_job(self, batch_job: BatchJob) -> None:
-        """Poll the batch job until it completes or fails.
-
-        Args:
-            batch_job: The job to poll.
-
-        Raises:
-            RuntimeError: If the job fails or loses its name.
-
-        """
-        while batch_job.state in {
-            "JOB_STATE_PENDING",
-            "JOB_STATE_RUNNING",
-            "JOB_STATE_QUEUED",
-            "JOB_STATE_UNSPECIFIED",
-        }:
-            logger.info("Batch job %s is in state %s, waiting...", batch_job.name, batch_job.state)
-            await asyncio.sleep(POLL_BATCH_DELAY_SEC)
-            if not batch_job.name:
-                msg: str = "Batch job lost name during polling"
-                raise RuntimeError(msg)
-
-            batch_job = await self.client.batches.get(name=batch_job.name)
-            logger.debug("Batch job %s state: %s", batch_job.name, batch_job.state)
-
-        if batch_job.state != "JOB_STATE_SUCCEEDED":
-            msg: str = f"Batch job {batch_job.name} failed with state {batch_job.state}"
-            if batch_job.error:
-                msg += f": {batch_job.error}"
-
-            raise RuntimeError(msg)
-
     async def _get_batch_results[T_Schema: BaseModel](
         self,
         batch_job: BatchJob,
         response_json_schema: type[T_Schema] | None,
-    ) -> list[T_Schema | str]:
+    ) -> dict[str, BatchItemResult[T_Schema]]:
         """Extract results from a completed batch job.
 
         Args:
@@ -432,7 +670,8 @@ class Gemini(LlmSdk[GeminiConfig]):
             response_json_schema: Optional schema for result validation.
 
         Returns:
-            list[T_Schema | str]: The parsed results.
+            dict[str, BatchItemResult[T_Schema]]: The parsed result or the error of each request,
+                by request key.
 
         Raises:
             RuntimeError: If no results are found.
@@ -455,34 +694,64 @@ class Gemini(LlmSdk[GeminiConfig]):
         self,
         file_name: str,
         response_json_schema: type[T_Schema] | None,
-    ) -> list[T_Schema | str]:
+    ) -> dict[str, BatchItemResult[T_Schema]]:
         """Parse file-based responses from a batch job.
 
+        The file is streamed to a temporary file and parsed one line at a time in a worker
+        thread, so only the parsed results are held in memory. SDK versions that can not
+        download to a destination return the file as bytes, which are parsed the same way
+        without decoding them as a whole. Lines without a key are matched to requests by their
+        position among the non-blank lines.
+
         Returns:
-            list[T_Schema | str]: The parsed results.
+            dict[str, BatchItemResult[T_Schema]]: The parsed results, by request key.
 
         """
-        results: list[T_Schema | str] = []
-        output_bytes: bytes = await self.client.files.download(file=file_name)
-        for line in output_bytes.decode().splitlines():
-            if not line.strip():
-                continue
+        if not _supports_download_destination(self.client.files.download):
+            output_bytes: bytes = await self.client.files.download(file=file_name)
+            return await asyncio.to_thread(
+                _parse_response_lines, io.BytesIO(output_bytes), response_json_schema
+            )
 
-            text: str = _parse_response_line_to_text(line)
-            if response_json_schema is not None and text:
-                results.append(response_json_schema.model_validate_json(text, by_alias=True))
-            else:
-                results.append(text)
+        with tempfile.TemporaryFile() as output_file:
+            await self.client.files.download(file=file_name, destination=output_file)
+            output_file.seek(0)
+            return await asyncio.to_thread(_parse_response_lines, output_file, response_json_schema)
 
-        return results
+    async def _wait_for_quota(self, parts: list[Part]) -> int:
+        """Wait until a request with the given parts fits in the configured quotas.
+
+        Returns:
+            int: The estimated number of tokens charged against the tokens quota.
+
+        """
+        if self.rate_limiter is None:
+            return 0
+
+        texts: list[str] = [part.text for part in parts if part.text]
+        return await self.rate_limiter.acquire(estimate_tokens(self.system_prompt, *texts))
+
+    def _reconcile_quota(
+        self,
+        charged_tokens: int,
+        usage: GenerateContentResponseUsageMetadata | None,
+    ) -> None:
+        if self.rate_limiter is None or usage is None or usage.prompt_token_count is None:
+            return
+
+        self.rate_limiter.reconcile(charged_tokens, usage.prompt_token_count)
 
     def create_generate_content_config(
-        self, response_json_schema: str | None = None
+        self,
+        response_json_schema: str | None = None,
+        cached_content: str | None = None,
     ) -> GenerateContentConfig:
         """Create a GenerateContentConfig object for the Gemini API.
 
         Args:
             response_json_schema: The JSON schema to validate the response against.
+            cached_content: The name of a cached content holding the system instruction and
+                the tools. If None, they are sent with the request.
 
         Returns:
             The GenerateContentConfig object.
@@ -492,16 +761,16 @@ class Gemini(LlmSdk[GeminiConfig]):
         if response_json_schema is not None:
             response_mime_type = "application/json"
 
-        tools: ToolListUnion = self._get_tools()
         safety_settings: list[SafetySetting] = self._get_safety_settings()
         thinking_config: ThinkingConfig | None = self._get_thinking_config()
-        system_prompt: str = self.system_prompt
-        if self.config.request_response_validation:
-            system_prompt = (
-                f"{system_prompt}"
-                " Before providing the final results, perform a mental validation pass."
-                " Check for schema inconsistencies and factual inaccuracies."
-                " If you find an error, correct it in the final output."
+        if cached_content is not None:
+            return GenerateContentConfig(
+                temperature=self.config.temperature,
+                response_mime_type=response_mime_type,
+                thinking_config=thinking_config,
+                response_json_schema=response_json_schema,
+                safety_settings=safety_settings,
+                cached_content=cached_content,
             )
 
         return GenerateContentConfig(
@@ -509,9 +778,39 @@ class Gemini(LlmSdk[GeminiConfig]):
             response_mime_type=response_mime_type,
             thinking_config=thinking_config,
             response_json_schema=response_json_schema,
-            tools=tools,
+            tools=self._get_tools(),
             safety_settings=safety_settings,
-            system_instruction=system_prompt,
+            system_instruction=self._get_system_instruction(),
+        )
+
+    async def _get_cached_content(self) -> str | None:
+        """Returns the cached content holding the system instruction, creating it if needed.
+
+        Batch requests do not use it, since a batch job may outlive the cached content.
+
+        Returns:
+            str | None: The cached content name, or None if the system instruction is sent inline.
+
+        """
+        if not self.config.context_caching or not self.system_prompt:
+            return None
+
+        return await self.context_caches.get(
+            model=self.config.model_name,
+            system_instruction=self._get_system_instruction(),
+            tools=self._get_tools(),
+            ttl_seconds=self.config.context_cache_ttl_seconds,
+        )
+
+    def _get_system_instruction(self) -> str:
+        if not self.config.request_response_validation:
+            return self.system_prompt
+
+        return (
+            f"{self.system_prompt}"
+            " Before providing the final results, perform a mental validation pass."
+            " Check for schema inconsistencies and factual inaccuracies."
+            " If you find an error, correct it in the final output."
         )
 
     def _get_safety_settings(self) -> list[SafetySetting]:
@@ -542,8 +841,8 @@ class Gemini(LlmSdk[GeminiConfig]):
             )
             raise ValueError(msg) from e
 
-    def _get_tools(self) -> ToolListUnion:
-        results: ToolListUnion = []
+    def _get_tools(self) -> list[Tool]:
+        results: list[Tool] = []
         if self.config.google_search:
             results.append(Tool(google_search=GoogleSearch()))
 
@@ -558,38 +857,177 @@ class Gemini(LlmSdk[GeminiConfig]):
         )
 
 
-def _parse_response_line_to_text(line: str) -> str:
-    data: dict[str, Any] = json.loads(line)
-    response_data: dict[str, Any] = data.get("response")
+class GeminiClientPool:
+    """Shares long-lived Gemini clients between the sessions of a test suite.
+
+    Sessions handed out by the pool keep their own history and system prompt, but send their
+    requests through one client per API key, so connections are reused across test cases.
+    """
+
+    __slots__ = ("_batch_pollers", "_clients", "_context_caches")
+
+    def __init__(self) -> None:
+        self._clients: dict[str, AsyncClient] = {}
+        self._context_caches: dict[str, ContextCacheRegistry] = {}
+        self._batch_pollers: dict[str, BatchJobPoller] = {}
+
+    def session(self, config: GeminiConfig) -> Gemini:
+        """Create a session that sends its requests through the pooled client.
+
+        Returns:
+            Gemini: A new session with an empty history.
+
+        """
+        api_key: str = config.api_key
+        client: AsyncClient | None = self._clients.get(api_key)
+        if client is None:
+            logger.debug("Creating pooled Gemini client")
+            client = genai.client.Client(api_key=api_key).aio
+            self._clients[api_key] = client
+            self._context_caches[api_key] = ContextCacheRegistry(client.caches)
+            self._batch_pollers[api_key] = BatchJobPoller(client.batches)
+
+        return Gemini(
+            config,
+            client=client,
+            context_caches=self._context_caches[api_key],
+            batch_poller=self._batch_pollers[api_key],
+        )
+
+    async def aclose(self) -> None:
+        """Delete the cached contents created by the sessions and close all pooled clients."""
+        clients: list[AsyncClient] = list(self._clients.values())
+        context_caches: list[ContextCacheRegistry] = list(self._context_caches.values())
+        batch_pollers: list[BatchJobPoller] = list(self._batch_pollers.values())
+        self._clients.clear()
+        self._context_caches.clear()
+        self._batch_pollers.clear()
+        await asyncio.gather(*(poller.aclose() for poller in batch_pollers))
+        await asyncio.gather(*(registry.aclose() for registry in context_caches))
+        await asyncio.gather(*(client.aclose() for client in clients))
+
+
+CLIENT_POOL: GeminiClientPool = GeminiClientPool()
+
+
+def _fingerprint_request(request: InlinedRequest, request_key: str | None = None) -> str:
+    """Computes a digest of everything a batch request sends, except its key.
+
+    With a request key from the caller, the contents of the request are replaced by the key,
+    so the request is identified the same way when its prompt changes.
+
+    Returns:
+        str: The hex digest identifying the request.
+
+    """
+    if request_key is None:
+        data: str = request.model_dump_json(exclude={"metadata"}, exclude_none=True)
+    else:
+        data = request_key + request.model_dump_json(
+            exclude={"metadata", "contents"}, exclude_none=True
+        )
+    return hashlib.sha256(data.encode()).hexdigest()
+
+
+def _supports_download_destination(download: Callable[..., Any]) -> bool:
+    try:
+        return "destination" in inspect.signature(download).parameters
+    except TypeError, ValueError:
+        return False
+
+
+def _parse_response_lines[T_Schema: BaseModel](
+    lines: Iterable[bytes],
+    response_json_schema: type[T_Schema] | None,
+) -> dict[str, BatchItemResult[T_Schema]]:
+    """Parse the lines of a batch results file as they are read.
+
+    Returns:
+        dict[str, BatchItemResult[T_Schema]]: The parsed results, by request key.
+
+    """
+    results: dict[str, BatchItemResult[T_Schema]] = {}
+    non_blank: Iterator[bytes] = (line for line in lines if line.strip())
+    for index, line in enumerate(non_blank):
+        key, result = _parse_response_line(line.decode(), str(index), response_json_schema)
+        results[key] = result
+
+    return results
+
+
+def _parse_response_line[T_Schema: BaseModel](
+    line: str,
+    default_key: str,
+    response_json_schema: type[T_Schema] | None,
+) -> tuple[str, BatchItemResult[T_Schema]]:
+    """Parse one line of a batch results file.
+
+    Returns:
+        tuple[str, BatchItemResult[T_Schema]]: The request key and its result or error.
+
+    """
+    try:
+        data: dict[str, Any] = json.loads(line)
+    except json.JSONDecodeError as e:
+        return default_key, e
+
+    metadata: dict[str, str] = data.get("metadata") or {}
+    key: str = str(data.get("key") or metadata.get(BATCH_KEY_METADATA) or default_key)
+    if data.get("error"):
+        return key, RuntimeError(f"Batch request {key} failed: {data['error']}")
+
+    response_data: dict[str, Any] | None = data.get("response")
+    if not response_data:
+        return key, RuntimeError(f"Batch request {key} has no response")
+
     text: str = ""
-    if response_data and response_data.get("candidates"):
+    if response_data.get("candidates"):
         resp_content: dict[str, Any] = response_data["candidates"][0].get("content", {})
         parts: list[dict[str, Any]] = resp_content.get("parts", [])
         if parts:
             text: str = parts[0].get("text", "")
 
-    return text
+    return key, _parse_batch_text(text, response_json_schema)
 
 
 def _parse_inlined_responses[T_Schema: BaseModel](
     inline_responses: list[InlinedResponse],
     response_json_schema: type[T_Schema] | None,
-) -> list[T_Schema | str]:
+) -> dict[str, BatchItemResult[T_Schema]]:
     """Parse inlined responses from a batch job.
 
+    Inlined responses are returned in request order, which is used for responses without a key.
+
     Returns:
-        list[T_Schema | str]: The parsed results.
+        dict[str, BatchItemResult[T_Schema]]: The parsed results, by request key.
 
     """
-    results: list[T_Schema | str] = []
-    for inline_response in inline_responses:
-        if not inline_response.response:
-            continue
-
-        text: str = inline_response.response.text or ""
-        if response_json_schema is not None and text:
-            results.append(response_json_schema.model_validate_json(text, by_alias=True))
+    results: dict[str, BatchItemResult[T_Schema]] = {}
+    for index, inline_response in enumerate(inline_responses):
+        metadata: dict[str, str] = inline_response.metadata or {}
+        key: str = metadata.get(BATCH_KEY_METADATA, str(index))
+        if inline_response.error:
+            error: JobError = inline_response.error
+            results[key] = RuntimeError(
+                f"Batch request {key} failed with code {error.code}: {error.message}"
+            )
+        elif not inline_response.response:
+            results[key] = RuntimeError(f"Batch request {key} has no response")
         else:
-            results.append(text)
+            text: str = inline_response.response.text or ""
+            results[key] = _parse_batch_text(text, response_json_schema)
 
     return results
+
+
+def _parse_batch_text[T_Schema: BaseModel](
+    text: str,
+    response_json_schema: type[T_Schema] | None,
+) -> BatchItemResult[T_Schema]:
+    if response_json_schema is None or not text:
+        return text
+
+    try:
+        return response_json_schema.model_validate_json(text, by_alias=True)
+    except ValidationError as e:
+        return e
@@ -14,6 +14,7 @@
 
 from collections.abc import Iterable  # noqa: TC003
 from contextlib import AbstractAsyncContextManager  # noqa: TC003
+from string import Template  # noqa: TC003
 from typing import Protocol
 
 import anyio  # noqa: TC002
@@ -31,6 +32,7 @@ from .data_models.llm_sdk import LlmSdk  # noqa: TC001
 from .data_models.test_case import TestCase  # noqa: TC001
 from .data_models.test_case.input import TestCaseInput
 from .data_models.test_case.output import TestCaseOutput
+from .prompt_cache import PromptCache  # noqa: TC001
 
 hook_spec: HookspecMarker = pluggy.HookspecMarker(PROJECT_NAME)
 
@@ -78,6 +80,22 @@ class PluginService[T_Input: TestCaseInput, T_Output: TestCaseOutput, T_Row: Csv
     def get_csv_row_class() -> type[T_Row]:
         """Returns the Pydantic class used to represent a row in the final CSV report."""
 
+    @staticmethod
+    @hook_spec(firstresult=True)
+    def get_output_class() -> type[T_Output]:
+        """Returns the Pydantic class of the feature output.
+
+        Needed to judge the feature outputs recorded by a run again, with ``vera test --rejudge``.
+        """
+
+    @staticmethod
+    @hook_spec(firstresult=True)
+    def get_feature_version() -> str:
+        """Returns the version of the feature, which changes whenever its outputs may change.
+
+        Needed to cache feature outputs. Cached outputs of other versions are never reused.
+        """
+
     @staticmethod
     @hook_spec(firstresult=True)
     def get_llm_csv_columns_class() -> type[CsvColumn]:
@@ -89,10 +107,12 @@ class PluginService[T_Input: TestCaseInput, T_Output: TestCaseOutput, T_Row: Csv
         test_case: TestCase[T_Input],
         test_output: T_Output,
         plugin_service: PluginService,
+        prompt_cache: PromptCache,
     ) -> CsvColumn:
         """Performs the LLM-as-a-Judge evaluation.
 
-        The default implementation sends a prompt to Gemini using the provided specs.
+        The default implementation sends a prompt to Gemini using the specs and the task prompt
+        template from the suite's prompt cache.
         """
 
     @staticmethod
@@ -120,7 +140,18 @@ class PluginService[T_Input: TestCaseInput, T_Output: TestCaseOutput, T_Row: Csv
     async def publish_results(rows: Iterable[T_Row], run_index: int) -> None:
         """Called after all evaluations are complete for a single suite run.
 
-        Used to save results to a file, database, or external service.
+        Used to save results to a file, database, or external service. Implementations of
+        ``on_row_completed`` have already received the rows, and should only finalize their
+        destination here.
+        """
+
+    @staticmethod
+    @hook_spec
+    async def on_row_completed(row: T_Row, run_index: int) -> None:
+        """Called with the row of each test case of a suite run as soon as it finishes.
+
+        Used to stream results to their destination during the run. Rows arrive one at a time,
+        in completion order, and the test cases wait while earlier rows are being handled.
         """
 
     @staticmethod
@@ -180,8 +211,14 @@ class PluginService[T_Input: TestCaseInput, T_Output: TestCaseOutput, T_Row: Csv
         resources_dir: anyio.Path,
         test_case: TestCase[T_Input],
         test_output: T_Output,
+        task_template: Template,
     ) -> str:
-        """Constructs the prompt that will be sent to the LLM Judge."""
+        """Constructs the prompt that will be sent to the LLM Judge from the task template."""
+
+    @staticmethod
+    @hook_spec(firstresult=True)
+    def get_evaluation_task_template_path() -> anyio.Path:
+        """Returns the path to the template of the prompt that is sent to the LLM Judge."""
 
     @staticmethod
     @hook_spec(firstresult=True)
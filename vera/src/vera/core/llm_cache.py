@@ -0,0 +1,315 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import collections
+import hashlib
+import json
+import logging
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Literal, Self, overload, override
+
+from platformdirs import user_cache_dir
+from pydantic import BaseModel
+
+from vera.project_name import PROJECT_NAME
+
+from .configuration import CONFIG
+from .data_models.llm_config import LlmConfig
+from .data_models.llm_sdk import LlmSdk
+from .disk_cache import DiskCache
+
+if TYPE_CHECKING:
+    from types import TracebackType
+
+logger: logging.Logger = logging.getLogger(PROJECT_NAME)
+
+LLM_CACHE_FILE_NAME: str = "llm_cache.sqlite"
+BYTES_PER_MB: int = 1024 * 1024
+SECONDS_PER_DAY: int = 24 * 60 * 60
+
+
+class LlmResponseCache:
+    """Persistent cache of LLM responses, keyed by everything that determines a response.
+
+    The key covers the SDK class, its configuration, the system prompt, the session history,
+    the prompt and the response schema. Identical requests made within one process are told
+    apart by their occurrence number, so repeated runs of a test suite replay the responses
+    of the previous repeated runs instead of all receiving the first response.
+    """
+
+    __slots__ = ("_occurrences", "refresh", "store")
+
+    def __init__(self, store: DiskCache, *, refresh: bool = False) -> None:
+        """Create a response cache.
+
+        Args:
+            store: The store holding the cached responses.
+            refresh: If True, never read cached responses but still store new ones.
+
+        """
+        self.store: DiskCache = store
+        self.refresh: bool = refresh
+        self._occurrences: collections.Counter[str] = collections.Counter()
+
+    def wrap[T_LlmConfig: LlmConfig](self, sdk: LlmSdk[T_LlmConfig]) -> CachedLlmSdk[T_LlmConfig]:
+        return CachedLlmSdk(sdk, self)
+
+    def key(self, request: dict[str, Any]) -> str:
+        """Computes the cache key of the next occurrence of a request.
+
+        Returns:
+            str: The hex digest identifying the request.
+
+        """
+        digest: str = hashlib.sha256(
+            json.dumps(request, sort_keys=True, default=str).encode()
+        ).hexdigest()
+        occurrence: int = self._occurrences[digest]
+        self._occurrences[digest] += 1
+        return f"{digest}:{occurrence}"
+
+    async def get(self, key: str) -> str | None:
+        if self.refresh:
+            return None
+
+        value: bytes | None = await self.store.get(key)
+        return value.decode() if value is not None else None
+
+    async def set(self, key: str, value: str) -> None:
+        await self.store.set(key, value.encode())
+
+    def close(self) -> None:
+        self.store.close()
+
+
+class CachedLlmSdk[T_LlmConfig: LlmConfig](LlmSdk[T_LlmConfig]):
+    """Wraps an LLM SDK and answers repeated requests from an ``LlmResponseCache``.
+
+    Responses served from the cache are not added to the session history of the wrapped SDK,
+    so mixing cache hits and misses in a multi-turn conversation sends the wrapped SDK an
+    incomplete history. The judge sends a single message per session, which is not affected.
+    Empty responses are never cached.
+    """
+
+    def __init__(self, sdk: LlmSdk[T_LlmConfig], cache: LlmResponseCache) -> None:
+        super().__init__(sdk.config)
+        self.sdk: LlmSdk[T_LlmConfig] = sdk
+        self.cache: LlmResponseCache = cache
+        self.system_prompt = sdk.system_prompt
+        self._history: list[str] = []
+
+    @override
+    async def __aenter__(self) -> Self:
+        await self.sdk.__aenter__()
+        return self
+
+    @override
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        await self.sdk.__aexit__(exc_type, exc_value, traceback)
+
+    @overload
+    async def send_message[T_Schema: BaseModel](
+        self,
+        prompt: str,
+        /,
+        *,
+        raise_error_if_empty_response: Literal[True],
+        response_json_schema: type[T_Schema],
+    ) -> T_Schema: ...
+
+    @overload
+    async def send_message[T_Schema: BaseModel](
+        self,
+        prompt: str,
+        /,
+        *,
+        raise_error_if_empty_response: Literal[False],
+        response_json_schema: type[T_Schema],
+    ) -> T_Schema | Literal[""]: ...
+
+    @overload
+    async def send_message[T_Schema: BaseModel](
+        self,
+        prompt: str,
+        /,
+        *,
+        raise_error_if_empty_response: bool,
+        response_json_schema: None = None,
+    ) -> str: ...
+
+    @override
+    async def send_message[T_Schema: BaseModel](
+        self,
+        prompt: str,
+        /,
+        *,
+        raise_error_if_empty_response: bool,
+        response_json_schema: type[T_Schema] | None = None,
+    ) -> T_Schema | str:
+        """Send a message, or return the cached response to an identical earlier message.
+
+        Args:
+            prompt: The prompt to send to the LLM provider.
+            raise_error_if_empty_response: Whether to raise an error if the response is empty.
+            response_json_schema: The JSON schema to validate the response against.
+
+        Returns:
+            The response from the cache or from the LLM provider.
+
+        """
+        key: str = self.cache.key(self._request(prompt, response_json_schema))
+        cached: str | None = await self.cache.get(key)
+        if cached is not None:
+            logger.debug("LLM cache hit for prompt: %s", prompt)
+            self._history.extend((prompt, cached))
+            return _parse(cached, response_json_schema)
+
+        response: T_Schema | str = await self.sdk.send_message(
+            prompt,
+            raise_error_if_empty_response=raise_error_if_empty_response,
+            response_json_schema=response_json_schema,
+        )
+        text: str = _serialize(response)
+        self._history.append(prompt)
+        if text:
+            self._history.append(text)
+            await self.cache.set(key, text)
+
+        return response
+
+    @override
+    async def send_bulk_messages[T_Schema: BaseModel](
+        self,
+        prompts: list[str],
+        /,
+        *,
+        response_json_schema: type[T_Schema] | None = None,
+        request_keys: list[str] | None = None,
+    ) -> list[T_Schema | str]:
+        """Send the prompts that have no cached response in bulk.
+
+        Args:
+            prompts: The prompts to send to the LLM provider.
+            response_json_schema: The JSON schema to validate the responses against.
+            request_keys: Stable identities of the prompts, passed on with the prompts that
+                have no cached response.
+
+        Returns:
+            The responses, in the order of the prompts.
+
+        """
+        keys: list[str] = [
+            self.cache.key(self._request(prompt, response_json_schema)) for prompt in prompts
+        ]
+        cached: list[str | None] = await asyncio.gather(*(self.cache.get(key) for key in keys))
+        responses: list[T_Schema | str] = [
+            _parse(text, response_json_schema) if text is not None else "" for text in cached
+        ]
+        misses: list[int] = [i for i, text in enumerate(cached) if text is None]
+        logger.debug(
+            "LLM cache hits for %s of %s prompts", len(prompts) - len(misses), len(prompts)
+        )
+        if not misses:
+            return responses
+
+        sent: list[T_Schema | str] = await self.sdk.send_bulk_messages(
+            [prompts[i] for i in misses],
+            response_json_schema=response_json_schema,
+            request_keys=None if request_keys is None else [request_keys[i] for i in misses],
+        )
+        for i, response in zip(misses, sent, strict=True):
+            responses[i] = response
+            if text := _serialize(response):
+                await self.cache.set(keys[i], text)
+
+        return responses
+
+    @override
+    def clean_session_history(self) -> None:
+        self._history.clear()
+        self.sdk.clean_session_history()
+
+    @override
+    def set_system_prompt_to_session(self, prompt: str) -> None:
+        super().set_system_prompt_to_session(prompt)
+        self.sdk.set_system_prompt_to_session(prompt)
+
+    def _request(self, prompt: str, schema: type[BaseModel] | None) -> dict[str, Any]:
+        return {
+            "sdk": f"{type(self.sdk).__module__}.{type(self.sdk).__qualname__}",
+            "config": self.config.model_dump(mode="json"),
+            "system_prompt": self.system_prompt,
+            "history": self._history,
+            "prompt": prompt,
+            "schema": schema.model_json_schema() if schema is not None else None,
+        }
+
+
+def _serialize(response: BaseModel | str) -> str:
+    if isinstance(response, BaseModel):
+        return response.model_dump_json(by_alias=True)
+
+    return response
+
+
+def _parse[T_Schema: BaseModel](text: str, schema: type[T_Schema] | None) -> T_Schema | str:
+    if schema is not None:
+        return schema.model_validate_json(text, by_alias=True)
+
+    return text
+
+
+def get_cache_path() -> Path:
+    return Path(user_cache_dir(appname=PROJECT_NAME)) / LLM_CACHE_FILE_NAME
+
+
+_llm_cache: LlmResponseCache | None = None
+
+
+def get_llm_cache() -> LlmResponseCache | None:
+    """Returns the process-wide LLM response cache.
+
+    Returns:
+        LlmResponseCache | None: The cache, created on first use, or None if it is disabled.
+
+    """
+    global _llm_cache  # noqa: PLW0603
+    if not CONFIG.enable_llm_cache:
+        return None
+
+    if _llm_cache is None:
+        ttl_days: int | None = CONFIG.llm_cache_ttl_days
+        _llm_cache = LlmResponseCache(
+            DiskCache(
+                get_cache_path(),
+                max_size_bytes=CONFIG.llm_cache_max_size_mb * BYTES_PER_MB,
+                ttl_seconds=ttl_days * SECONDS_PER_DAY if ttl_days is not None else None,
+            ),
+            refresh=CONFIG.refresh_llm_cache,
+        )
+
+    return _llm_cache
+
+
+def close_llm_cache() -> None:
+    global _llm_cache  # noqa: PLW0603
+    if _llm_cache is not None:
+        _llm_cache.close()
+        _llm_cache = None
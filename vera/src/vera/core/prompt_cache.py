@@ -0,0 +1,117 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import contextlib
+import dataclasses
+import logging
+import time
+from pathlib import Path
+from string import Template
+from typing import TYPE_CHECKING
+
+from vera.project_name import PROJECT_NAME
+
+if TYPE_CHECKING:
+    import os
+
+    import anyio
+
+    from .hook_specs import PluginService
+
+logger: logging.Logger = logging.getLogger(PROJECT_NAME)
+
+CHANGE_CHECK_INTERVAL_SEC: float = 1.0
+
+type _Fingerprint = tuple[tuple[str, int, int], ...]
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class PromptBundle:
+    """The judge specs and the task prompt template shared by all test cases of a suite."""
+
+    specs: tuple[str, ...]
+    system_prompt: str
+    task_template: Template
+
+
+class PromptCache:
+    """Loads the judge specs and the task prompt template once and reuses them across test cases.
+
+    The files are loaded through the plugin hooks. The modification times of the specs directory
+    and the template file are checked at most once per ``CHANGE_CHECK_INTERVAL_SEC``, and the
+    bundle is loaded again when any of them changed.
+    """
+
+    __slots__ = ("_bundle", "_checked_at", "_fingerprint", "_lock", "plugin_service")
+
+    def __init__(self, plugin_service: PluginService) -> None:
+        self.plugin_service: PluginService = plugin_service
+        self._lock: asyncio.Lock = asyncio.Lock()
+        self._bundle: PromptBundle | None = None
+        self._fingerprint: _Fingerprint = ()
+        self._checked_at: float = 0.0
+
+    async def get(self) -> PromptBundle:
+        """Returns the current prompt bundle, loading it if it is missing or out of date.
+
+        Returns:
+            PromptBundle: The loaded specs and task prompt template.
+
+        """
+        recently_checked: bool = time.monotonic() - self._checked_at < CHANGE_CHECK_INTERVAL_SEC
+        if self._bundle is not None and recently_checked:
+            return self._bundle
+
+        specs_dir: anyio.Path = self.plugin_service.get_llm_specs_dir()
+        template_path: anyio.Path = self.plugin_service.get_evaluation_task_template_path()
+        fingerprint: _Fingerprint = await asyncio.to_thread(
+            _get_fingerprint, Path(specs_dir), Path(template_path)
+        )
+        async with self._lock:
+            self._checked_at = time.monotonic()
+            if self._bundle is None or fingerprint != self._fingerprint:
+                self._bundle = await self._load(specs_dir, template_path)
+                self._fingerprint = fingerprint
+
+            return self._bundle
+
+    async def _load(self, specs_dir: anyio.Path, template_path: anyio.Path) -> PromptBundle:
+        logger.debug("Loading specs from %s and task template from %s", specs_dir, template_path)
+        specs: tuple[str, ...] = tuple(
+            await self.plugin_service.get_spec_files(specs_dir=specs_dir)
+        )
+        template: str = await template_path.read_text(encoding="utf-8")
+        return PromptBundle(
+            specs=specs,
+            system_prompt="".join(f"{spec}\n\n" for spec in specs),
+            task_template=Template(template),
+        )
+
+
+def _get_fingerprint(specs_dir: Path, template_path: Path) -> _Fingerprint:
+    paths: list[Path] = [template_path]
+    with contextlib.suppress(FileNotFoundError):
+        paths.extend(path for path in specs_dir.iterdir() if path.is_file())
+
+    fingerprint: list[tuple[str, int, int]] = []
+    for path in sorted(paths):
+        try:
+            stat: os.stat_result = path.stat()
+        except FileNotFoundError:
+            continue
+
+        fingerprint.append((str(path), stat.st_mtime_ns, stat.st_size))
+
+    return tuple(fingerprint)
@@ -0,0 +1,137 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import csv
+import dataclasses
+from collections import Counter
+from typing import TYPE_CHECKING
+
+from .data_models.csv import CsvRow
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from pathlib import Path
+
+    from .data_models.csv import ScoreRange
+
+ID_COLUMN: str = CsvRow.model_fields["identifier"].alias or "identifier"
+SCORE_COLUMN: str = CsvRow.model_fields["final_score"].alias or "final_score"
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class MergedReport:
+    """The columns and rows of CSV reports, combined in the order they were read."""
+
+    columns: list[str]
+    rows: list[dict[str, str]]
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class MergedRow:
+    """What the report summary needs from a row of a merged report."""
+
+    identifier: int
+    final_score: float
+    score_range: ScoreRange | None
+
+
+def read_reports(paths: Iterable[Path]) -> MergedReport:
+    """Read CSV reports, such as the reports of the shards of a test suite.
+
+    Columns are combined in the order they first appear, so reports of plugin versions with
+    different columns can be merged. Rows keep the values of the columns they have.
+
+    Returns:
+        MergedReport: The combined columns and rows.
+
+    Raises:
+        ValueError: If a report has no test case ID or final score column.
+
+    """
+    columns: dict[str, None] = {}
+    rows: list[dict[str, str]] = []
+    for path in paths:
+        with path.open(encoding="utf-8", newline="") as f:
+            reader: csv.DictReader[str] = csv.DictReader(f)
+            fieldnames: list[str] = list(reader.fieldnames or [])
+            if ID_COLUMN not in fieldnames or SCORE_COLUMN not in fieldnames:
+                msg: str = f"{path} is not a report, it has no {ID_COLUMN} or {SCORE_COLUMN} column"
+                raise ValueError(msg)
+
+            columns.update(dict.fromkeys(fieldnames))
+            rows.extend(reader)
+
+    return MergedReport(list(columns), rows)
+
+
+def write_report(path: Path, report: MergedReport) -> None:
+    with path.open("w", encoding="utf-8", newline="") as f:
+        writer: csv.DictWriter[str] = csv.DictWriter(f, fieldnames=report.columns, restval="")
+        writer.writeheader()
+        writer.writerows(report.rows)
+
+
+def group_runs(
+    report: MergedReport, row_class: type[CsvRow] | None = None
+) -> list[list[MergedRow]]:
+    """Group the rows of a merged report into the runs of the test suite.
+
+    Reports do not record which run a row belongs to, so the n-th row of each test case is
+    taken to belong to the n-th run. Merging the shards of a suite that ran ``--runs-count``
+    times therefore restores its runs.
+
+    Args:
+        report: The merged report.
+        row_class: The plugin's row class, to read the score range of the rows from.
+
+    Returns:
+        list[list[MergedRow]]: The rows of each run.
+
+    Raises:
+        ValueError: If a row has an invalid test case ID or final score.
+
+    """
+    runs: list[list[MergedRow]] = []
+    seen: Counter[int] = Counter()
+    for data in report.rows:
+        try:
+            identifier: int = int(data[ID_COLUMN])
+            final_score: float = float(data[SCORE_COLUMN])
+        except ValueError as e:
+            msg: str = f"Invalid row in merged report: {e}"
+            raise ValueError(msg) from e
+
+        run_index: int = seen[identifier]
+        seen[identifier] += 1
+        if run_index == len(runs):
+            runs.append([])
+
+        runs[run_index].append(
+            MergedRow(identifier, final_score, _get_score_range(row_class, identifier, final_score))
+        )
+
+    return runs
+
+
+def _get_score_range(
+    row_class: type[CsvRow] | None, identifier: int, final_score: float
+) -> ScoreRange | None:
+    if row_class is None:
+        return None
+
+    # Score ranges are defined by the row class, and rarely depend on the row's other columns
+    try:
+        return row_class.model_construct(identifier=identifier, final_score=final_score).score_range
+    except AttributeError, TypeError, ValueError:
+        return None
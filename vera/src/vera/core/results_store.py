@@ -0,0 +1,501 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import contextlib
+import dataclasses
+import json
+import logging
+import sqlite3
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from platformdirs import user_state_dir
+
+from vera.project_name import PROJECT_NAME
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Mapping
+
+    from .data_models.csv import CsvRow
+    from .data_models.test_case import TestCase
+
+logger: logging.Logger = logging.getLogger(PROJECT_NAME)
+
+RESULTS_DB_FILE_NAME: str = "results.sqlite3"
+WRITE_BATCH_SIZE: int = 100
+WRITE_BATCH_INTERVAL_SEC: float = 5.0
+
+SCHEMA: str = """
+CREATE TABLE IF NOT EXISTS runs (
+    run_id TEXT PRIMARY KEY,
+    plugin TEXT NOT NULL,
+    tags TEXT NOT NULL,
+    runs_count INTEGER NOT NULL,
+    test_case_count INTEGER NOT NULL,
+    started_at REAL NOT NULL,
+    finished_at REAL
+);
+CREATE TABLE IF NOT EXISTS rows (
+    run_id TEXT NOT NULL,
+    run_index INTEGER NOT NULL,
+    test_case_id INTEGER NOT NULL,
+    test_case_name TEXT NOT NULL,
+    final_score REAL NOT NULL,
+    columns TEXT NOT NULL,
+    recorded_at REAL NOT NULL,
+    PRIMARY KEY (run_id, run_index, test_case_id)
+);
+CREATE TABLE IF NOT EXISTS stage_durations (
+    run_id TEXT NOT NULL,
+    run_index INTEGER NOT NULL,
+    test_case_id INTEGER NOT NULL,
+    stage TEXT NOT NULL,
+    duration_sec REAL NOT NULL,
+    PRIMARY KEY (run_id, run_index, test_case_id, stage)
+);
+CREATE TABLE IF NOT EXISTS failures (
+    run_id TEXT NOT NULL,
+    run_index INTEGER NOT NULL,
+    test_case_id INTEGER NOT NULL,
+    error_type TEXT NOT NULL,
+    error TEXT NOT NULL,
+    recorded_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS test_case_tags (
+    run_id TEXT NOT NULL,
+    test_case_id INTEGER NOT NULL,
+    tag TEXT NOT NULL,
+    PRIMARY KEY (run_id, test_case_id, tag)
+);
+CREATE TABLE IF NOT EXISTS test_case_hashes (
+    plugin TEXT NOT NULL,
+    test_case_id INTEGER NOT NULL,
+    hash TEXT NOT NULL,
+    run_id TEXT NOT NULL,
+    recorded_at REAL NOT NULL,
+    PRIMARY KEY (plugin, test_case_id)
+);
+CREATE INDEX IF NOT EXISTS runs_started_at ON runs (started_at);
+CREATE INDEX IF NOT EXISTS runs_plugin ON runs (plugin, started_at);
+CREATE INDEX IF NOT EXISTS rows_test_case_id ON rows (test_case_id, recorded_at);
+CREATE INDEX IF NOT EXISTS stage_durations_test_case_id
+    ON stage_durations (test_case_id, stage);
+CREATE INDEX IF NOT EXISTS failures_run_id ON failures (run_id, run_index);
+CREATE INDEX IF NOT EXISTS failures_test_case_id ON failures (test_case_id, recorded_at);
+CREATE INDEX IF NOT EXISTS test_case_tags_tag ON test_case_tags (tag, run_id);
+"""
+
+type _Statement = tuple[str, tuple[Any, ...]]
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class RunSummary:
+    """A recorded run, with the number and average score of its rows."""
+
+    run_id: str
+    plugin: str
+    tags: list[str]
+    runs_count: int
+    started_at: float
+    finished_at: float | None
+    rows: int
+    failures: int
+    average_score: float | None
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class HistoryEntry:
+    """The recorded outcome of one run of a test case."""
+
+    run_id: str
+    run_index: int
+    started_at: float
+    final_score: float | None
+    total_duration: float | None
+    error: str | None
+
+
+def connect(path: Path) -> sqlite3.Connection:
+    """Open the results database, creating its tables and indexes if needed.
+
+    Returns:
+        sqlite3.Connection: The connection, which can be used from any thread.
+
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    connection: sqlite3.Connection = sqlite3.connect(path, check_same_thread=False)
+    connection.execute("PRAGMA journal_mode=WAL")
+    connection.executescript(SCHEMA)
+    return connection
+
+
+class ResultsStore:
+    """Records the rows, stage durations and failures of a run in the results database.
+
+    Records are buffered and written in one transaction once ``WRITE_BATCH_SIZE`` of them are
+    pending or the oldest one has waited ``WRITE_BATCH_INTERVAL_SEC`` seconds. Database errors
+    are logged and never fail the run, since the run journal is the source for resuming it.
+    """
+
+    __slots__ = ("_connection", "_lock", "_oldest_pending", "_pending", "run_id")
+
+    def __init__(self, connection: sqlite3.Connection, run_id: str) -> None:
+        self.run_id: str = run_id
+        self._connection: sqlite3.Connection = connection
+        self._lock: asyncio.Lock = asyncio.Lock()
+        self._pending: list[_Statement] = []
+        self._oldest_pending: float = 0.0
+
+    @classmethod
+    async def open(cls, run_id: str, path: Path | None = None) -> ResultsStore | None:
+        """Open the results database for recording a run.
+
+        Args:
+            run_id: The ID of the run, as used by the run journal.
+            path: The database file. Defaults to the one in the user state directory.
+
+        Returns:
+            ResultsStore | None: The store, or None if the database can not be opened.
+
+        """
+        db_path: Path = path or get_results_db_path()
+        try:
+            connection: sqlite3.Connection = await asyncio.to_thread(connect, db_path)
+        except (sqlite3.Error, OSError) as e:
+            logger.warning("Not recording results, failed to open %s: %s", db_path, e)
+            return None
+
+        return cls(connection, run_id)
+
+    async def start_run(
+        self,
+        plugin: str,
+        tags: Iterable[str],
+        runs_count: int,
+        test_cases: Iterable[TestCase],
+    ) -> None:
+        """Record the start of the run, or its restart when it is resumed."""
+        test_cases = list(test_cases)
+        self._add(
+            "INSERT INTO runs VALUES (?, ?, ?, ?, ?, ?, NULL) ON CONFLICT (run_id) DO UPDATE"
+            " SET runs_count = excluded.runs_count, finished_at = NULL",
+            (self.run_id, plugin, json.dumps(list(tags)), runs_count, len(test_cases), time.time()),
+        )
+        for test_case in test_cases:
+            for tag in test_case.tags:
+                self._add(
+                    "INSERT OR IGNORE INTO test_case_tags VALUES (?, ?, ?)",
+                    (self.run_id, test_case.id, tag),
+                )
+
+        await self.flush()
+
+    async def record_row(
+        self, run_index: int, test_case: TestCase, row: CsvRow, durations: dict[str, float]
+    ) -> None:
+        """Record the row and stage durations of a finished test case run."""
+        self._add(
+            "INSERT OR REPLACE INTO rows VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (
+                self.run_id,
+                run_index,
+                test_case.id,
+                test_case.name,
+                row.final_score,
+                row.model_dump_json(by_alias=True),
+                time.time(),
+            ),
+        )
+        for stage, duration in durations.items():
+            self._add(
+                "INSERT OR REPLACE INTO stage_durations VALUES (?, ?, ?, ?, ?)",
+                (self.run_id, run_index, test_case.id, stage, duration),
+            )
+
+        await self._flush_if_due()
+
+    async def record_failure(self, run_index: int, test_case: TestCase, error: Exception) -> None:
+        """Record the error of a failed test case run."""
+        self._add(
+            "INSERT INTO failures VALUES (?, ?, ?, ?, ?, ?)",
+            (self.run_id, run_index, test_case.id, type(error).__name__, str(error), time.time()),
+        )
+        await self._flush_if_due()
+
+    async def record_test_case_hashes(self, plugin: str, hashes: Mapping[int, str]) -> None:
+        """Record the content hashes of the test cases that passed in this run."""
+        for test_case_id, digest in hashes.items():
+            self._add(
+                "INSERT OR REPLACE INTO test_case_hashes VALUES (?, ?, ?, ?, ?)",
+                (plugin, test_case_id, digest, self.run_id, time.time()),
+            )
+
+        await self.flush()
+
+    async def finish_run(self) -> None:
+        """Record the end of the run and write the pending records."""
+        self._add("UPDATE runs SET finished_at = ? WHERE run_id = ?", (time.time(), self.run_id))
+        await self.flush()
+
+    async def flush(self) -> None:
+        """Write the pending records in one transaction."""
+        async with self._lock:
+            statements: list[_Statement] = self._pending
+            self._pending = []
+            if not statements:
+                return
+
+            try:
+                await asyncio.to_thread(self._execute, statements)
+            except sqlite3.Error as e:
+                logger.warning("Failed to record %s results: %s", len(statements), e)
+
+    async def aclose(self) -> None:
+        await self.flush()
+        await asyncio.to_thread(self._connection.close)
+
+    def _add(self, sql: str, parameters: tuple[Any, ...]) -> None:
+        if not self._pending:
+            self._oldest_pending = time.monotonic()
+
+        self._pending.append((sql, parameters))
+
+    async def _flush_if_due(self) -> None:
+        if (
+            len(self._pending) >= WRITE_BATCH_SIZE
+            or time.monotonic() - self._oldest_pending >= WRITE_BATCH_INTERVAL_SEC
+        ):
+            await self.flush()
+
+    def _execute(self, statements: list[_Statement]) -> None:
+        with self._connection:
+            for sql, parameters in statements:
+                self._connection.execute(sql, parameters)
+
+
+def query_runs(
+    connection: sqlite3.Connection,
+    *,
+    plugin: str | None = None,
+    tag: str | None = None,
+    limit: int = 20,
+) -> list[RunSummary]:
+    """Read the most recent runs, newest first.
+
+    Args:
+        connection: The results database.
+        plugin: Only read runs of this plugin.
+        tag: Only read runs that included a test case with this tag.
+        limit: The maximum number of runs to read.
+
+    Returns:
+        list[RunSummary]: The runs.
+
+    """
+    cursor: sqlite3.Cursor = connection.execute(
+        "SELECT runs.run_id, plugin, tags, runs_count, started_at, finished_at,"
+        " (SELECT COUNT(*) FROM rows WHERE rows.run_id = runs.run_id),"
+        " (SELECT COUNT(*) FROM failures WHERE failures.run_id = runs.run_id),"
+        " (SELECT AVG(final_score) FROM rows WHERE rows.run_id = runs.run_id)"
+        " FROM runs WHERE (:plugin IS NULL OR plugin = :plugin)"
+        " AND (:tag IS NULL OR run_id IN (SELECT run_id FROM test_case_tags WHERE tag = :tag))"
+        " ORDER BY started_at DESC LIMIT :limit",
+        {"plugin": plugin, "tag": tag, "limit": limit},
+    )
+    return [
+        RunSummary(
+            run_id=run_id,
+            plugin=run_plugin,
+            tags=json.loads(tags),
+            runs_count=runs_count,
+            started_at=started_at,
+            finished_at=finished_at,
+            rows=rows,
+            failures=failures,
+            average_score=average_score,
+        )
+        for (
+            run_id,
+            run_plugin,
+            tags,
+            runs_count,
+            started_at,
+            finished_at,
+            rows,
+            failures,
+            average_score,
+        ) in cursor
+    ]
+
+
+def query_test_case(
+    connection: sqlite3.Connection, test_case_id: int, *, limit: int = 20
+) -> list[HistoryEntry]:
+    """Read the most recent runs of a test case, newest first, including failed ones.
+
+    Args:
+        connection: The results database.
+        test_case_id: The ID of the test case.
+        limit: The maximum number of test case runs to read.
+
+    Returns:
+        list[HistoryEntry]: The outcomes of the test case runs.
+
+    """
+    cursor: sqlite3.Cursor = connection.execute(
+        "SELECT rows.run_id, rows.run_index, runs.started_at, rows.final_score,"
+        " stage_durations.duration_sec, NULL, rows.recorded_at"
+        " FROM rows JOIN runs USING (run_id) LEFT JOIN stage_durations"
+        " ON stage_durations.run_id = rows.run_id AND stage_durations.run_index = rows.run_index"
+        " AND stage_durations.test_case_id = rows.test_case_id AND stage_durations.stage = 'total'"
+        " WHERE rows.test_case_id = :id"
+        " UNION ALL"
+        " SELECT failures.run_id, failures.run_index, runs.started_at, NULL, NULL,"
+        " failures.error_type || ': ' || failures.error, failures.recorded_at"
+        " FROM failures JOIN runs USING (run_id) WHERE failures.test_case_id = :id"
+        " ORDER BY 7 DESC LIMIT :limit",
+        {"id": test_case_id, "limit": limit},
+    )
+    return [
+        HistoryEntry(
+            run_id=run_id,
+            run_index=run_index,
+            started_at=started_at,
+            final_score=final_score,
+            total_duration=total_duration,
+            error=error,
+        )
+        for run_id, run_index, started_at, final_score, total_duration, error, _ in cursor
+    ]
+
+
+def query_mean_durations(
+    connection: sqlite3.Connection, *, plugin: str | None = None
+) -> dict[int, dict[str, float]]:
+    """Read the mean recorded duration of each stage of each test case.
+
+    Args:
+        connection: The results database.
+        plugin: Only read durations recorded by runs of this plugin.
+
+    Returns:
+        dict[int, dict[str, float]]: The mean duration in seconds of each stage, such as
+            ``feature`` or ``total``, by test case ID.
+
+    """
+    cursor: sqlite3.Cursor = connection.execute(
+        "SELECT test_case_id, stage, AVG(duration_sec) FROM stage_durations"
+        " WHERE :plugin IS NULL OR run_id IN (SELECT run_id FROM runs WHERE plugin = :plugin)"
+        " GROUP BY test_case_id, stage",
+        {"plugin": plugin},
+    )
+    durations: dict[int, dict[str, float]] = {}
+    for test_case_id, stage, duration in cursor:
+        durations.setdefault(test_case_id, {})[stage] = duration
+
+    return durations
+
+
+def load_mean_durations(*, plugin: str | None = None) -> dict[int, dict[str, float]]:
+    """Read the mean recorded duration of each stage of each test case from the results database.
+
+    Returns:
+        dict[int, dict[str, float]]: The mean duration in seconds of each stage, by test case
+            ID. Empty if no results were recorded yet or the database cannot be read.
+
+    """
+    path: Path = get_results_db_path()
+    if not path.is_file():
+        return {}
+
+    try:
+        with contextlib.closing(connect(path)) as connection:
+            return query_mean_durations(connection, plugin=plugin)
+    except (sqlite3.Error, OSError) as e:
+        logger.warning("Failed to read recorded durations from %s: %s", path, e)
+        return {}
+
+
+def write_durations_file(path: Path, durations: Mapping[int, float]) -> None:
+    """Write the expected duration of test cases to a JSON file, for balancing shards."""
+    path.write_text(
+        json.dumps({str(test_case_id): duration for test_case_id, duration in durations.items()}),
+        encoding="utf-8",
+    )
+
+
+def read_durations_file(path: Path) -> dict[int, float]:
+    """Read the expected duration of test cases written by ``write_durations_file``.
+
+    Args:
+        path: The JSON file.
+
+    Returns:
+        dict[int, float]: The expected duration in seconds, by test case ID.
+
+    Raises:
+        ValueError: If the file is not a JSON object of durations by test case ID.
+
+    """
+    content: Any = json.loads(path.read_text(encoding="utf-8"))
+    if not isinstance(content, dict):
+        msg: str = f"Expected a JSON object of durations by test case ID in {path}"
+        raise ValueError(msg)  # noqa: TRY004
+
+    return {int(test_case_id): float(duration) for test_case_id, duration in content.items()}
+
+
+def query_test_case_hashes(
+    connection: sqlite3.Connection, *, plugin: str
+) -> dict[int, tuple[str, str]]:
+    """Read the content hash of each test case at the last run it passed in.
+
+    Args:
+        connection: The results database.
+        plugin: Only read hashes recorded by runs of this plugin.
+
+    Returns:
+        dict[int, tuple[str, str]]: The content hash and the run ID, by test case ID.
+
+    """
+    cursor: sqlite3.Cursor = connection.execute(
+        "SELECT test_case_id, hash, run_id FROM test_case_hashes WHERE plugin = ?", (plugin,)
+    )
+    return {test_case_id: (digest, run_id) for test_case_id, digest, run_id in cursor}
+
+
+def load_test_case_hashes(*, plugin: str) -> dict[int, tuple[str, str]]:
+    """Read the content hash of each test case at the last run it passed in from the database.
+
+    Returns:
+        dict[int, tuple[str, str]]: The content hash and the run ID, by test case ID. Empty if
+            no hashes were recorded yet or the database cannot be read.
+
+    """
+    path: Path = get_results_db_path()
+    if not path.is_file():
+        return {}
+
+    try:
+        with contextlib.closing(connect(path)) as connection:
+            return query_test_case_hashes(connection, plugin=plugin)
+    except (sqlite3.Error, OSError) as e:
+        logger.warning("Failed to read recorded test case hashes from %s: %s", path, e)
+        return {}
+
+
+def get_results_db_path() -> Path:
+    return Path(user_state_dir(appname=PROJECT_NAME)) / RESULTS_DB_FILE_NAME
@@ -0,0 +1,64 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from typing import Any
+
+from pydantic import BaseModel
+from pydantic_core import to_jsonable_python
+
+
+def dump_model_state(model: BaseModel) -> dict[str, Any]:
+    """Dumps the field values of a model so that ``load_model_state`` can recreate it.
+
+    Unlike ``model_dump``, custom serializers are not applied, since plugins use them to shape
+    report columns, for example to write only one field of a nested model.
+
+    Returns:
+        dict[str, Any]: The JSON-compatible field values, by field name.
+
+    """
+    return {name: _dump_value(value) for name, value in _iter_fields(model)}
+
+
+def load_model_state[T: BaseModel](model_class: type[T], state: dict[str, Any]) -> T:
+    """Recreates a model from the field values dumped by ``dump_model_state``.
+
+    Returns:
+        T: The validated model.
+
+    """
+    return model_class.model_validate(state, by_name=True)
+
+
+def _iter_fields(model: BaseModel) -> list[tuple[str, Any]]:
+    fields: list[tuple[str, Any]] = [
+        (name, getattr(model, name)) for name in type(model).model_fields
+    ]
+    if model.__pydantic_extra__:
+        fields.extend(model.__pydantic_extra__.items())
+
+    return fields
+
+
+def _dump_value(value: Any) -> Any:  # noqa: ANN401
+    if isinstance(value, BaseModel):
+        return dump_model_state(value)
+
+    if isinstance(value, dict):
+        return {key: _dump_value(item) for key, item in value.items()}
+
+    if isinstance(value, list | tuple | set | frozenset):
+        return [_dump_value(item) for item in value]
+
+    return to_jsonable_python(value)
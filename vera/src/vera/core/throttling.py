@@ -0,0 +1,305 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import collections
+import contextlib
+import logging
+import math
+import time
+from typing import TYPE_CHECKING
+
+from vera.project_name import PROJECT_NAME
+
+from .configuration import CONFIG
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncGenerator, Callable
+
+logger: logging.Logger = logging.getLogger(PROJECT_NAME)
+
+DEFAULT_DECREASE_FACTOR: float = 0.5
+CHARS_PER_TOKEN: int = 4
+SECONDS_PER_MINUTE: int = 60
+
+
+class AdaptiveConcurrencyLimiter:
+    """Limits in-flight requests with an additive-increase/multiplicative-decrease window.
+
+    Every successful request grows the window by ``1 / window``, so a full window of successes
+    grows it by one slot. A request that fails because the service is overloaded halves the
+    window. Requests that were already in flight when the window shrank do not shrink it again,
+    so a burst of rejections caused by the same overload counts as a single congestion event.
+    """
+
+    __slots__ = (
+        "_decrease_factor",
+        "_epoch",
+        "_in_flight",
+        "_waiters",
+        "_window",
+        "max_window",
+        "min_window",
+    )
+
+    def __init__(
+        self,
+        max_window: int,
+        min_window: int = 1,
+        decrease_factor: float = DEFAULT_DECREASE_FACTOR,
+    ) -> None:
+        if not 1 <= min_window <= max_window:
+            msg: str = f"Expected 1 <= min_window <= max_window, got {min_window}, {max_window}"
+            raise ValueError(msg)
+
+        if not 0 < decrease_factor < 1:
+            msg: str = f"Decrease factor must be between 0 and 1, got {decrease_factor}"
+            raise ValueError(msg)
+
+        self.max_window: int = max_window
+        self.min_window: int = min_window
+        self._decrease_factor: float = decrease_factor
+        self._window: float = float(max_window)
+        self._in_flight: int = 0
+        self._epoch: int = 0
+        self._waiters: collections.deque[asyncio.Future[None]] = collections.deque()
+
+    @property
+    def window(self) -> int:
+        """The number of requests currently allowed to be in flight."""
+        return max(self.min_window, math.floor(self._window))
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    @contextlib.asynccontextmanager
+    async def slot(
+        self,
+        is_overload: Callable[[BaseException], bool],
+    ) -> AsyncGenerator[None]:
+        """Hold a request slot for the duration of the block and adjust the window by its outcome.
+
+        Args:
+            is_overload: Decides whether an exception raised inside the block means that the
+                service is overloaded and the window should shrink.
+
+        """
+        await self._acquire()
+        epoch: int = self._epoch
+        try:
+            yield
+        except Exception as e:
+            if is_overload(e):
+                self._decrease(epoch)
+
+            raise
+        else:
+            self._increase()
+        finally:
+            self._in_flight -= 1
+            self._wake_waiters()
+
+    async def _acquire(self) -> None:
+        loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
+        while self._in_flight >= self.window:
+            waiter: asyncio.Future[None] = loop.create_future()
+            self._waiters.append(waiter)
+            try:
+                await waiter
+            except asyncio.CancelledError:
+                if waiter in self._waiters:
+                    self._waiters.remove(waiter)
+                else:
+                    # We were woken up, pass the free slot on to the next waiter
+                    self._wake_waiters()
+
+                raise
+
+        self._in_flight += 1
+
+    def _wake_waiters(self) -> None:
+        free_slots: int = self.window - self._in_flight
+        while free_slots > 0 and self._waiters:
+            waiter: asyncio.Future[None] = self._waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                free_slots -= 1
+
+    def _increase(self) -> None:
+        self._window = min(float(self.max_window), self._window + 1 / self._window)
+        self._wake_waiters()
+
+    def _decrease(self, epoch: int) -> None:
+        if epoch != self._epoch:
+            return
+
+        self._epoch += 1
+        self._window = max(float(self.min_window), self._window * self._decrease_factor)
+        logger.warning("LLM service is overloaded, reducing concurrency to %s", self.window)
+
+
+_llm_limiter: AdaptiveConcurrencyLimiter | None = None
+
+
+def get_llm_limiter() -> AdaptiveConcurrencyLimiter:
+    """Returns the process-wide limiter shared by all LLM requests.
+
+    Returns:
+        AdaptiveConcurrencyLimiter: The limiter, created on first use.
+
+    """
+    global _llm_limiter  # noqa: PLW0603
+    if _llm_limiter is None:
+        _llm_limiter = AdaptiveConcurrencyLimiter(max_window=CONFIG.llm_concurrency)
+
+    return _llm_limiter
+
+
+class TokenBucket:
+    """A bucket that holds up to ``per_minute`` units and refills continuously at that rate."""
+
+    __slots__ = ("_level", "_updated_at", "capacity", "rate")
+
+    def __init__(self, per_minute: int) -> None:
+        if per_minute < 1:
+            msg: str = f"Token bucket rate must be greater than 0, got {per_minute}"
+            raise ValueError(msg)
+
+        self.capacity: float = float(per_minute)
+        self.rate: float = per_minute / SECONDS_PER_MINUTE
+        self._level: float = self.capacity
+        self._updated_at: float = time.monotonic()
+
+    def delay_for(self, amount: float) -> float:
+        """Computes how long to wait until ``amount`` units are available.
+
+        Returns:
+            float: The number of seconds to wait, 0 if the units are available now.
+
+        """
+        self._refill()
+        if self._level >= amount:
+            return 0.0
+
+        return (amount - self._level) / self.rate
+
+    def take(self, amount: float) -> None:
+        self._refill()
+        self._level -= amount
+
+    def give_back(self, amount: float) -> None:
+        """Returns units to the bucket, or takes more when ``amount`` is negative."""
+        self._refill()
+        self._level = min(self.capacity, self._level + amount)
+
+    def _refill(self) -> None:
+        now: float = time.monotonic()
+        self._level = min(self.capacity, self._level + (now - self._updated_at) * self.rate)
+        self._updated_at = now
+
+
+class RateLimiter:
+    """Keeps requests within requests-per-minute and tokens-per-minute quotas.
+
+    Callers are served in arrival order, so a large request is not starved by a stream of small
+    ones. Token counts are estimated before sending and corrected once the real usage is known.
+    """
+
+    __slots__ = ("_lock", "requests", "tokens")
+
+    def __init__(self, requests_per_minute: int | None, tokens_per_minute: int | None) -> None:
+        self.requests: TokenBucket | None = (
+            TokenBucket(requests_per_minute) if requests_per_minute else None
+        )
+        self.tokens: TokenBucket | None = (
+            TokenBucket(tokens_per_minute) if tokens_per_minute else None
+        )
+        self._lock: asyncio.Lock = asyncio.Lock()
+
+    async def acquire(self, tokens: int = 0) -> int:
+        """Wait until one more request with ``tokens`` input tokens fits in the quotas.
+
+        Args:
+            tokens: The estimated number of input tokens of the request.
+
+        Returns:
+            int: The number of tokens charged, to be passed to ``reconcile``.
+
+        """
+        if self.tokens is not None:
+            tokens = min(tokens, int(self.tokens.capacity))
+
+        async with self._lock:
+            while (delay := self._delay_for(tokens)) > 0:
+                logger.debug("Rate limit reached, waiting %.2f seconds", delay)
+                await asyncio.sleep(delay)
+
+            if self.requests is not None:
+                self.requests.take(1)
+
+            if self.tokens is not None:
+                self.tokens.take(tokens)
+
+        return tokens
+
+    def reconcile(self, charged: int, actual: int) -> None:
+        """Correct the token bucket once the actual token usage of a request is known."""
+        if self.tokens is not None and actual != charged:
+            self.tokens.give_back(charged - actual)
+
+    def _delay_for(self, tokens: int) -> float:
+        request_delay: float = self.requests.delay_for(1) if self.requests is not None else 0
+        token_delay: float = self.tokens.delay_for(tokens) if self.tokens is not None else 0
+        return max(request_delay, token_delay)
+
+
+def estimate_tokens(*texts: str) -> int:
+    """Roughly estimates the number of tokens in the given texts without calling the model.
+
+    Returns:
+        int: The estimated number of tokens.
+
+    """
+    return math.ceil(sum(len(text) for text in texts) / CHARS_PER_TOKEN)
+
+
+_rate_limiters: dict[tuple[str, int | None, int | None], RateLimiter] = {}
+
+
+def get_rate_limiter(
+    key: str,
+    requests_per_minute: int | None,
+    tokens_per_minute: int | None,
+) -> RateLimiter | None:
+    """Returns the process-wide rate limiter for a quota, if the quota has any limits.
+
+    All callers that pass the same key and limits share one limiter.
+
+    Returns:
+        RateLimiter | None: The shared limiter, or None if no limit is configured.
+
+    """
+    if not requests_per_minute and not tokens_per_minute:
+        return None
+
+    limiter_key: tuple[str, int | None, int | None] = (
+        key,
+        requests_per_minute,
+        tokens_per_minute,
+    )
+    if limiter_key not in _rate_limiters:
+        _rate_limiters[limiter_key] = RateLimiter(requests_per_minute, tokens_per_minute)
+
+    return _rate_limiters[limiter_key]
@@ -30,11 +30,11 @@ type ScoreColor = Literal["white", "green", "yellow", "red"]
 
 
 def create_plugin_name_display_repr(names: Iterable[str]) -> str:
-    return "\n".join(
-        f"    [green]- {name}[/green]"
-        for name in names
-        if f"{PROJECT_NAME}.core.default_impl" not in name
-    )
+    return "\n".join(f"    [green]- {name}[/green]" for name in get_plugin_names(names))
+
+
+def get_plugin_names(names: Iterable[str]) -> list[str]:
+    return [name for name in names if f"{PROJECT_NAME}.core.default_impl" not in name]
 
 
 @runtime_checkable
@@ -12,11 +12,17 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import abc
 import asyncio
 import csv
 import logging
+import os
 import pathlib
-from typing import TYPE_CHECKING
+import queue
+import re
+import threading
+import time
+from typing import TYPE_CHECKING, Any, Final, TextIO, cast, override
 
 from anyio import Path
 
@@ -32,6 +38,170 @@ if TYPE_CHECKING:
 logger: logging.Logger = logging.getLogger(PROJECT_NAME)
 _file_lock = asyncio.Lock()
 
+WRITER_QUEUE_SIZE: int = 1024
+_CLOSE: Final = object()
+
+
+class ReportWriter(abc.ABC):
+    """Writes rows to a report file from a dedicated thread.
+
+    Rows are handed over through a bounded queue, so the event loop never serializes rows or
+    touches the file. Each row is dumped exactly once on the writer thread, and the file is
+    flushed once ``flush_rows`` rows are pending or the oldest pending row has waited
+    ``flush_interval`` seconds, so a crash loses at most one flush window. With ``fsync`` each
+    flush is also synced to disk.
+    """
+
+    __slots__ = ("_error", "_queue", "_thread", "flush_interval", "flush_rows", "fsync", "path")
+
+    def __init__(
+        self,
+        path: pathlib.Path,
+        *,
+        flush_rows: int,
+        flush_interval: float,
+        fsync: bool = False,
+    ) -> None:
+        self.path: pathlib.Path = path
+        self.flush_rows: int = flush_rows
+        self.flush_interval: float = flush_interval
+        self.fsync: bool = fsync
+        self._queue: queue.Queue[Any] = queue.Queue(maxsize=WRITER_QUEUE_SIZE)
+        self._error: Exception | None = None
+        self._thread: threading.Thread = threading.Thread(
+            target=self._run, name=f"{PROJECT_NAME}-report-writer", daemon=True
+        )
+        self._thread.start()
+
+    async def write(self, row: CsvRow) -> None:
+        """Queue a row to be written, waiting off the event loop only when the queue is full.
+
+        An ``OSError`` is raised if the writer thread already failed to write the report file.
+        """
+        self._raise_error()
+        try:
+            self._queue.put_nowait(row)
+        except queue.Full:
+            await asyncio.to_thread(self._queue.put, row)
+
+    async def aclose(self) -> None:
+        """Write and flush the queued rows and stop the writer thread.
+
+        An ``OSError`` is raised if the writer thread failed to write the report file.
+        """
+        await asyncio.to_thread(self._queue.put, _CLOSE)
+        await asyncio.to_thread(self._thread.join)
+        self._raise_error()
+
+    @abc.abstractmethod
+    def _open(self) -> None: ...
+
+    @abc.abstractmethod
+    def _write_row(self, row: CsvRow) -> None: ...
+
+    @abc.abstractmethod
+    def _flush(self) -> None: ...
+
+    @abc.abstractmethod
+    def _close(self) -> None: ...
+
+    def _raise_error(self) -> None:
+        if self._error is not None:
+            msg: str = f"Failed to write the report file {self.path}: {self._error}"
+            raise OSError(msg) from self._error
+
+    def _run(self) -> None:
+        try:
+            self._open()
+            try:
+                self._write_rows()
+            finally:
+                self._close()
+        except Exception as e:
+            logger.exception("Failed to write the report file %s", self.path)
+            self._error = e
+            self._drain()
+
+    def _write_rows(self) -> None:
+        pending: int = 0
+        deadline: float = 0.0
+        while True:
+            timeout: float | None = max(0.0, deadline - time.monotonic()) if pending else None
+            try:
+                item: Any = self._queue.get(timeout=timeout)
+            except queue.Empty:
+                item = None
+
+            if item is _CLOSE:
+                break
+
+            if item is not None:
+                self._write_row(item)
+                if not pending:
+                    deadline = time.monotonic() + self.flush_interval
+
+                pending += 1
+
+            if pending and (pending >= self.flush_rows or time.monotonic() >= deadline):
+                self._flush()
+                pending = 0
+
+        self._flush()
+
+    def _drain(self) -> None:
+        # Keeps producers blocked on a full queue from waiting forever after a failure.
+        while self._queue.get() is not _CLOSE:
+            pass
+
+
+class CsvReportWriter(ReportWriter):
+    """Writes rows to a CSV report file, with the header taken from the first row."""
+
+    __slots__ = ("_file", "_writer")
+
+    def __init__(
+        self,
+        path: pathlib.Path,
+        *,
+        flush_rows: int,
+        flush_interval: float,
+        fsync: bool = False,
+    ) -> None:
+        self._file: TextIO | None = None
+        self._writer: csv.DictWriter[str] | None = None
+        super().__init__(path, flush_rows=flush_rows, flush_interval=flush_interval, fsync=fsync)
+
+    @override
+    def _open(self) -> None:
+        self._file = self.path.open("w", encoding="utf-8", newline="")
+
+    @override
+    def _write_row(self, row: CsvRow) -> None:
+        data: dict[str, Any] = row.model_dump(by_alias=True)
+        if self._writer is None:
+            self._writer = csv.DictWriter(cast("TextIO", self._file), fieldnames=list(data))
+            self._writer.writeheader()
+
+        self._writer.writerow(data)
+
+    @override
+    def _flush(self) -> None:
+        if self._file is None:
+            return
+
+        self._file.flush()
+        if self.fsync:
+            os.fsync(self._file.fileno())
+
+    @override
+    def _close(self) -> None:
+        if self._file is not None:
+            self._file.close()
+
+
+_streamed_reports: dict[int, CsvReportWriter] = {}
+_streamed_reports_lock = asyncio.Lock()
+
 
 async def write_to_file(rows: Iterable[CsvRow]) -> None:
     if not rows:
@@ -39,27 +209,77 @@ async def write_to_file(rows: Iterable[CsvRow]) -> None:
         return
 
     logger.debug("Writing results to file")
-    first_row: bool = True
+    writer: CsvReportWriter = await open_report()
+    try:
+        for row in rows:
+            await writer.write(row)
+    finally:
+        await writer.aclose()
+
+
+async def open_report() -> CsvReportWriter:
+    """Create a new CSV report file and start its writer thread.
+
+    Returns:
+        CsvReportWriter: The writer of the new report file.
+
+    """
+    return CsvReportWriter(
+        await new_report_path(".csv"),
+        flush_rows=CONFIG.csv_flush_rows,
+        flush_interval=CONFIG.csv_flush_interval_sec,
+        fsync=CONFIG.csv_fsync,
+    )
+
+
+async def new_report_path(suffix: str) -> pathlib.Path:
+    """Create a new, empty report file in the report directory.
+
+    Args:
+        suffix: The file name suffix of the report format, such as ``.csv``.
+
+    Returns:
+        pathlib.Path: The absolute path of the new report file.
+
+    """
     report_dir: Path = await get_report_dir()
     logger.debug("Ensuring report directory exists: %s", report_dir)
     await report_dir.mkdir(exist_ok=True, parents=True)
 
     async with _file_lock:
         logger.debug("Acquired file lock, creating report file")
-        report_file: Path = await create_report_file(report_dir)
+        report_file: Path = await create_report_file(report_dir, suffix)
 
-    logger.info("Writing results to the specified file path: %s", await report_file.absolute())
+    path: pathlib.Path = pathlib.Path(await report_file.absolute())
+    logger.info("Writing results to the specified file path: %s", path)
+    return path
+
+
+async def append_row(row: CsvRow, run_index: int) -> None:
+    """Append a row to the report file of a suite run, creating the file for its first row."""
+    writer: CsvReportWriter | None = _streamed_reports.get(run_index)
+    if writer is None:
+        async with _streamed_reports_lock:
+            writer = _streamed_reports.get(run_index)
+            if writer is None:
+                writer = _streamed_reports[run_index] = await open_report()
+
+    await writer.write(row)
 
-    with pathlib.Path(await report_file.absolute()).open("w", encoding="utf-8", newline="") as f:  # noqa: ASYNC230
-        writer: csv.DictWriter[str] | None = None
-        for row in rows:
-            if first_row:
-                writer = csv.DictWriter(f, fieldnames=row.model_dump(by_alias=True).keys())
-                writer.writeheader()
-                first_row = False
 
-            if writer:
-                writer.writerow(row.model_dump(by_alias=True))
+async def close_report(run_index: int) -> bool:
+    """Close the report file that the rows of a suite run were appended to.
+
+    Returns:
+        bool: True if rows of the run were appended to a report file, False otherwise.
+
+    """
+    writer: CsvReportWriter | None = _streamed_reports.pop(run_index, None)
+    if writer is None:
+        return False
+
+    await writer.aclose()
+    return True
 
 
 async def get_report_dir() -> Path:
@@ -75,16 +295,29 @@ async def get_report_dir() -> Path:
     return path
 
 
-async def create_report_file(report_dir: Path) -> Path:
+async def create_report_file(report_dir: Path, suffix: str = ".csv") -> Path:
+    """Create the next numbered report file, after the highest numbered one in the directory.
+
+    The directory is listed once, instead of checking each numbered file name in turn.
+
+    Returns:
+        Path: The new, empty report file.
+
+    """
+    pattern: re.Pattern[str] = re.compile(
+        rf"{re.escape(CONFIG.report_name)}_(\d+){re.escape(suffix)}"
+    )
     count: int = 1
-    file_name_template: str = f"{CONFIG.report_name}_{{0}}.csv"
-    while await (report_dir / file_name_template.format(count)).exists():
-        logger.debug(
-            "Report file %s already exists, incrementing counter",
-            file_name_template.format(count),
-        )
-        count += 1
+    async for path in report_dir.iterdir():
+        if match := pattern.fullmatch(path.name):
+            count = max(count, int(match.group(1)) + 1)
 
-    f: Path = report_dir / file_name_template.format(count)
-    await f.touch()
-    return f
+    while True:
+        f: Path = report_dir / f"{CONFIG.report_name}_{count}{suffix}"
+        try:
+            await f.touch(exist_ok=False)
+        except FileExistsError:
+            logger.debug("Report file %s already exists, incrementing counter", f.name)
+            count += 1
+        else:
+            return f
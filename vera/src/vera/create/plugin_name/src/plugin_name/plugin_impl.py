@@ -66,6 +66,12 @@ def get_csv_row_class() -> type[Row]:
     return Row
 
 
+@vera.hook_impl
+def get_output_class() -> type[Output]:
+    """Return the Pydantic class of the feature output, to judge recorded outputs again."""
+    return Output
+
+
 @vera.hook_impl
 def get_llm_csv_columns_class() -> type[CsvColumn]:
     """Return the Pydantic class used for the LLM Judge's evaluation columns."""
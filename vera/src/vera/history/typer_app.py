@@ -0,0 +1,153 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import contextlib
+import datetime as dt
+import logging
+import sqlite3
+from pathlib import Path  # noqa: TC003
+from typing import TYPE_CHECKING, Annotated
+
+import typer
+from rich.console import Console
+from rich.table import Table
+
+from vera.core import results_store
+from vera.project_name import PROJECT_NAME
+
+if TYPE_CHECKING:
+    from vera.core.results_store import HistoryEntry, RunSummary
+
+app: typer.Typer = typer.Typer(help="Query past results.")
+logger: logging.Logger = logging.getLogger(PROJECT_NAME)
+
+
+@app.command(name="history", help="Show recorded runs, or the recorded runs of one test case")
+def history(
+    test_case_id: Annotated[
+        int | None,
+        typer.Option("--test-case", help="Show the recorded runs of this test case"),
+    ] = None,
+    plugin: Annotated[str | None, typer.Option(help="Only show runs of this plugin")] = None,
+    tag: Annotated[
+        str | None,
+        typer.Option(help="Only show runs that included a test case with this tag"),
+    ] = None,
+    limit: Annotated[int, typer.Option(min=1, help="The maximum number of rows to show")] = 20,
+    export_durations: Annotated[
+        Path | None,
+        typer.Option(
+            metavar="FILE",
+            help="Write the mean duration of each test case to a JSON file "
+            "for vera test --durations, instead of showing runs",
+        ),
+    ] = None,
+) -> None:
+    path: Path = results_store.get_results_db_path()
+    if not path.is_file():
+        logger.info("No results recorded yet")
+        return
+
+    if export_durations is not None:
+        _export_durations(path, export_durations, plugin)
+        return
+
+    try:
+        with contextlib.closing(results_store.connect(path)) as connection:
+            table: Table = (
+                _build_runs_table(
+                    results_store.query_runs(connection, plugin=plugin, tag=tag, limit=limit)
+                )
+                if test_case_id is None
+                else _build_test_case_table(
+                    test_case_id,
+                    results_store.query_test_case(connection, test_case_id, limit=limit),
+                )
+            )
+    except sqlite3.Error as e:
+        logger.error("Failed to read the results database %s: %s", path, e)  # noqa: TRY400
+        raise typer.Exit(1) from e
+
+    Console().print(table)
+
+
+def _export_durations(db_path: Path, path: Path, plugin: str | None) -> None:
+    try:
+        with contextlib.closing(results_store.connect(db_path)) as connection:
+            stages: dict[int, dict[str, float]] = results_store.query_mean_durations(
+                connection, plugin=plugin
+            )
+        durations: dict[int, float] = {
+            test_case_id: stage_durations["total"]
+            for test_case_id, stage_durations in stages.items()
+            if "total" in stage_durations
+        }
+        results_store.write_durations_file(path, durations)
+    except (sqlite3.Error, OSError) as e:
+        logger.error("Failed to export the recorded durations to %s: %s", path, e)  # noqa: TRY400
+        raise typer.Exit(1) from e
+
+    logger.info("Wrote the mean durations of %s test cases to %s", len(durations), path)
+
+
+def _build_runs_table(runs: list[RunSummary]) -> Table:
+    table: Table = Table(title="Runs", header_style="bold magenta")
+    table.add_column("Run ID", style="cyan")
+    table.add_column("Started")
+    table.add_column("Plugin")
+    table.add_column("Tags")
+    table.add_column("Rows", justify="right")
+    table.add_column("Failures", justify="right")
+    table.add_column("Avg Score", justify="right")
+    for run in runs:
+        table.add_row(
+            run.run_id,
+            _format_time(run.started_at),
+            run.plugin,
+            ", ".join(run.tags),
+            str(run.rows),
+            str(run.failures),
+            _format_number(run.average_score),
+        )
+
+    return table
+
+
+def _build_test_case_table(test_case_id: int, entries: list[HistoryEntry]) -> Table:
+    table: Table = Table(title=f"Test {test_case_id}", header_style="bold magenta")
+    table.add_column("Run ID", style="cyan")
+    table.add_column("Run", justify="right")
+    table.add_column("Started")
+    table.add_column("Score", justify="right")
+    table.add_column("Total Time", justify="right")
+    table.add_column("Error")
+    for entry in entries:
+        table.add_row(
+            entry.run_id,
+            str(entry.run_index + 1),
+            _format_time(entry.started_at),
+            _format_number(entry.final_score),
+            "N/A" if entry.total_duration is None else f"{entry.total_duration:.2f}s",
+            f"[red]{entry.error}[/red]" if entry.error else "",
+        )
+
+    return table
+
+
+def _format_time(timestamp: float) -> str:
+    return dt.datetime.fromtimestamp(timestamp).astimezone().strftime("%Y-%m-%d %H:%M:%S")
+
+
+def _format_number(value: float | None) -> str:
+    return "N/A" if value is None else f"{value:.2f}"
@@ -17,7 +17,7 @@ from typing import TYPE_CHECKING
 import typer
 from typer import Typer
 
-from . import config, create, vtest
+from . import config, create, history, merge, vtest
 from . import list as list_plugins
 from .core import plugin_service
 from .core.configuration import CONFIG
@@ -31,6 +31,8 @@ app.add_typer(vtest.app)
 app.add_typer(create.app)
 app.add_typer(list_plugins.app)
 app.add_typer(config.app)
+app.add_typer(history.app)
+app.add_typer(merge.app)
 
 
 @app.callback()
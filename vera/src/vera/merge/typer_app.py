@@ -0,0 +1,66 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import logging
+from pathlib import Path  # noqa: TC003
+from typing import TYPE_CHECKING, Annotated
+
+import typer
+
+from vera.core import plugin_service, utils
+from vera.core.report_merge import group_runs, read_reports, write_report
+from vera.core.write_results_to_file import new_report_path
+from vera.project_name import PROJECT_NAME
+from vera.vtest.vtest_summary import ReportSummary
+
+if TYPE_CHECKING:
+    from vera.core.data_models.csv import CsvRow
+    from vera.core.plugin_service import PluginCreation
+    from vera.core.report_merge import MergedReport, MergedRow
+
+app: typer.Typer = typer.Typer(help="Merge reports.")
+logger: logging.Logger = logging.getLogger(PROJECT_NAME)
+
+
+@app.command(name="merge", help="Merge the CSV reports of test suite shards into one report")
+@utils.syncify
+async def merge(
+    reports: Annotated[
+        list[Path],
+        typer.Argument(exists=True, dir_okay=False, help="The CSV reports to merge"),
+    ],
+    output: Annotated[
+        Path | None,
+        typer.Option(
+            "--output",
+            "-o",
+            help="The merged report file. Defaults to a new report file in the destination "
+            "directory",
+        ),
+    ] = None,
+) -> None:
+    try:
+        report: MergedReport = await asyncio.to_thread(read_reports, reports)
+        pc: PluginCreation = plugin_service.create_service()
+        row_class: type[CsvRow] | None = pc.plugin_service.get_csv_row_class()
+        runs: list[list[MergedRow]] = group_runs(report, row_class)
+        path: Path = output or await new_report_path(".csv")
+        await asyncio.to_thread(write_report, path, report)
+    except (OSError, ValueError) as e:
+        logger.error("Failed to merge the reports: %s", e)  # noqa: TRY400
+        raise typer.Exit(1) from e
+
+    logger.info("Merged %s rows of %s reports into %s", len(report.rows), len(reports), path)
+    ReportSummary(runs).display()
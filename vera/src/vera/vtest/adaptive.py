@@ -0,0 +1,112 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import dataclasses
+import math
+from collections import defaultdict
+
+AUTO_RUNS_COUNT: str = "auto"
+MIN_ADAPTIVE_RUNS: int = 2
+
+# Two-sided 95% quantiles of Student's t distribution, by degrees of freedom from 1
+_T_QUANTILES_95: tuple[float, ...] = (
+    12.706, 4.303, 3.182, 2.776, 2.571, 2.447, 2.365, 2.306, 2.262, 2.228,
+    2.201, 2.179, 2.160, 2.145, 2.131, 2.120, 2.110, 2.101, 2.093, 2.086,
+    2.080, 2.074, 2.069, 2.064, 2.060, 2.056, 2.052, 2.048, 2.045, 2.042,
+)  # fmt: skip
+_Z_95: float = 1.96
+
+
+@dataclasses.dataclass(slots=True)
+class RunningStats:
+    """The mean and variance of scores, updated one score at a time with Welford's algorithm."""
+
+    count: int = 0
+    mean: float = 0.0
+    m2: float = 0.0
+
+    def add(self, value: float) -> None:
+        self.count += 1
+        delta: float = value - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (value - self.mean)
+
+    @property
+    def variance(self) -> float:
+        """The sample variance of the scores, 0 with fewer than two scores."""
+        if self.count < MIN_ADAPTIVE_RUNS:
+            return 0.0
+
+        return self.m2 / (self.count - 1)
+
+    def ci_width(self) -> float:
+        """The width of the 95% confidence interval of the mean score.
+
+        Returns:
+            float: The width, infinite with fewer than two scores.
+
+        """
+        if self.count < MIN_ADAPTIVE_RUNS:
+            return math.inf
+
+        degrees: int = self.count - 1
+        quantile: float = _T_QUANTILES_95[degrees - 1] if degrees <= len(_T_QUANTILES_95) else _Z_95
+        return 2 * quantile * math.sqrt(self.variance / self.count)
+
+
+class AdaptiveRuns:
+    """Decides which runs of each test case are needed for its final score to be stable.
+
+    The first two runs of every test case always run. Each later run of a test case waits for
+    the runs before it, and only runs if the confidence interval of the test case's final score
+    is still wider than the target. Runs that failed do not add a score.
+    """
+
+    __slots__ = ("_finished", "_stats", "skipped", "target_width")
+
+    def __init__(self, target_width: float) -> None:
+        self.target_width: float = target_width
+        self.skipped: int = 0
+        self._stats: defaultdict[int, RunningStats] = defaultdict(RunningStats)
+        self._finished: defaultdict[tuple[int, int], asyncio.Event] = defaultdict(asyncio.Event)
+
+    def add_score(self, test_case_id: int, score: float) -> None:
+        self._stats[test_case_id].add(score)
+
+    def finish(self, run_index: int, test_case_id: int) -> None:
+        """Record that a run of a test case finished, was skipped or failed."""
+        self._finished[run_index, test_case_id].set()
+
+    def is_stable(self, test_case_id: int) -> bool:
+        return self._stats[test_case_id].ci_width() < self.target_width
+
+    async def should_run(self, run_index: int, test_case_id: int) -> bool:
+        """Wait for the earlier runs of a test case and decide if this run is needed.
+
+        Returns:
+            bool: Whether the run is needed, which is counted as skipped otherwise.
+
+        """
+        if run_index < MIN_ADAPTIVE_RUNS:
+            return True
+
+        for earlier in range(run_index):
+            await self._finished[earlier, test_case_id].wait()
+
+        if self.is_stable(test_case_id):
+            self.skipped += 1
+            return False
+
+        return True
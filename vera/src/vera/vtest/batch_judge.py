@@ -0,0 +1,212 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import dataclasses
+import logging
+from enum import StrEnum
+from typing import TYPE_CHECKING, Any
+
+from vera.core.llm_cache import get_llm_cache
+from vera.project_name import PROJECT_NAME
+
+if TYPE_CHECKING:
+    from collections.abc import Hashable
+
+    import anyio
+
+    from vera.core.data_models.csv import CsvColumn
+    from vera.core.data_models.llm_config import LlmConfig
+    from vera.core.data_models.llm_sdk import LlmSdk
+    from vera.core.data_models.test_case import TestCase
+    from vera.core.data_models.test_case.output import TestCaseOutput
+    from vera.core.llm_cache import LlmResponseCache
+    from vera.core.plugin_service import PluginService
+    from vera.core.prompt_cache import PromptBundle, PromptCache
+
+logger: logging.Logger = logging.getLogger(PROJECT_NAME)
+
+# The Batch API accepts inline requests of up to 20MB, leave room for the request envelopes
+MAX_BATCH_BYTES: int = 16 * 1024 * 1024
+
+
+class JudgeMode(StrEnum):
+    INTERACTIVE = "interactive"
+    BATCH = "batch"
+
+
+@dataclasses.dataclass(slots=True)
+class _PendingEvaluation:
+    prompt: str
+    size: int
+    future: asyncio.Future[CsvColumn]
+
+
+class BatchJudge:
+    """Collects the judge prompts of a suite and evaluates them with batch requests.
+
+    Prompts are queued until a chunk reaches ``max_batch_size`` prompts or ``MAX_BATCH_BYTES``,
+    or until every expected test case has either queued its prompt or given up on it. Each chunk
+    is sent with ``send_bulk_messages`` of the configured LLM SDK, which uses the Batch API for
+    Gemini. The ``llm_evaluation`` hook is not called in this mode.
+    """
+
+    __slots__ = (
+        "_chunks",
+        "_counted",
+        "_pending",
+        "_pending_size",
+        "_remaining",
+        "max_batch_size",
+        "plugin_service",
+        "prompt_cache",
+    )
+
+    def __init__(
+        self,
+        plugin_service: PluginService,
+        prompt_cache: PromptCache,
+        *,
+        expected_evaluations: int,
+        max_batch_size: int,
+    ) -> None:
+        """Create a batch judge.
+
+        Args:
+            plugin_service: The plugin service used to build prompts and to create the LLM SDK.
+            prompt_cache: The suite's specs and task prompt template.
+            expected_evaluations: The number of test case runs that may request an evaluation.
+                Every one of them must call ``release`` once it is done, whether or not it
+                called ``evaluate``, and each one is counted once however often it calls them.
+            max_batch_size: The maximum number of prompts sent in one batch.
+
+        """
+        self.plugin_service: PluginService = plugin_service
+        self.prompt_cache: PromptCache = prompt_cache
+        self.max_batch_size: int = max_batch_size
+        self._remaining: int = expected_evaluations
+        # The test case runs that were subtracted from the remaining evaluations
+        self._counted: set[Hashable] = set()
+        self._pending: list[_PendingEvaluation] = []
+        self._pending_size: int = 0
+        self._chunks: set[asyncio.Task[None]] = set()
+
+    async def evaluate[T_Output: TestCaseOutput](
+        self,
+        key: Hashable,
+        test_case: TestCase[Any],
+        test_output: T_Output,
+    ) -> CsvColumn:
+        """Queue the judge prompt of a test case and wait for its batch to complete.
+
+        Args:
+            key: Identifies the test case run, and is passed to ``release`` when it is done.
+            test_case: The test case to evaluate.
+            test_output: The output of the feature for the test case.
+
+        Returns:
+            CsvColumn: The judge's evaluation columns.
+
+        Raises:
+            RuntimeError: If the test case run was already released or evaluated.
+
+        """
+        prompts: PromptBundle = await self.prompt_cache.get()
+        resources_dir: anyio.Path = self.plugin_service.get_resources_dir()
+        prompt: str = await self.plugin_service.create_evaluation_task_prompt(
+            resources_dir=resources_dir,
+            test_case=test_case,
+            test_output=test_output,
+            task_template=prompts.task_template,
+        )
+
+        if key in self._counted:
+            msg: str = f"The judge evaluation of {key} was already released or requested"
+            raise RuntimeError(msg)
+
+        future: asyncio.Future[CsvColumn] = asyncio.get_running_loop().create_future()
+        size: int = len(prompt.encode()) + len(prompts.system_prompt.encode())
+        if self._pending and self._pending_size + size > MAX_BATCH_BYTES:
+            self._flush()
+
+        self._pending.append(_PendingEvaluation(prompt, size, future))
+        self._pending_size += size
+        self._counted.add(key)
+        self._remaining -= 1
+        if len(self._pending) >= self.max_batch_size or not self._remaining:
+            self._flush()
+
+        return await future
+
+    def release(self, key: Hashable) -> None:
+        """Record that a test case run is done, so its prompt is not waited for anymore."""
+        if key in self._counted:
+            return
+
+        self._counted.add(key)
+        self._remaining -= 1
+        if not self._remaining and self._pending:
+            self._flush()
+
+    async def aclose(self) -> None:
+        """Wait for the batches that were already sent."""
+        if self._pending:
+            self._flush()
+
+        await asyncio.gather(*self._chunks, return_exceptions=True)
+
+    def _flush(self) -> None:
+        chunk: list[_PendingEvaluation] = self._pending
+        self._pending = []
+        self._pending_size = 0
+        task: asyncio.Task[None] = asyncio.create_task(self._send(chunk))
+        self._chunks.add(task)
+        task.add_done_callback(self._chunks.discard)
+
+    async def _send(self, chunk: list[_PendingEvaluation]) -> None:
+        logger.info("Sending %s judge prompts in a batch", len(chunk))
+        try:
+            results: list[CsvColumn | str] = await self._send_bulk([p.prompt for p in chunk])
+            if len(results) != len(chunk):
+                msg: str = f"Expected {len(chunk)} batch results, got {len(results)}"
+                raise RuntimeError(msg)  # noqa: TRY301
+        except Exception as e:  # noqa: BLE001
+            for pending in chunk:
+                if not pending.future.done():
+                    pending.future.set_exception(e)
+
+            return
+
+        for pending, result in zip(chunk, results, strict=True):
+            if pending.future.done():
+                continue
+
+            if result:
+                pending.future.set_result(result)
+            else:
+                msg: str = "Received an empty response from the LLM batch"
+                pending.future.set_exception(ValueError(msg))
+
+    async def _send_bulk[T_LlmConfig: LlmConfig](self, prompts: list[str]) -> list[CsvColumn | str]:
+        bundle: PromptBundle = await self.prompt_cache.get()
+        schema: type[CsvColumn] = self.plugin_service.get_llm_csv_columns_class()
+        llm_config: T_LlmConfig = self.plugin_service.get_llm_configuration()
+        sdk: LlmSdk[T_LlmConfig] = self.plugin_service.get_llm_sdk(config=llm_config)
+        cache: LlmResponseCache | None = get_llm_cache()
+        if cache is not None:
+            sdk = cache.wrap(sdk)
+
+        async with sdk as llm:
+            llm.set_system_prompt_to_session(bundle.system_prompt)
+            return await llm.send_bulk_messages(prompts, response_json_schema=schema)
@@ -0,0 +1,96 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import hashlib
+import json
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    import anyio
+
+    from vera.core.data_models.test_case import TestCase
+    from vera.core.hook_specs import PluginService
+
+MISSING_FILE_HASH: str = "missing"
+
+
+async def hash_test_cases(
+    test_cases: Iterable[TestCase], plugin_service: PluginService
+) -> dict[int, str]:
+    """Compute a hash of everything that decides the result of each test case.
+
+    The hash of a test case covers its definition, the resource files of its input and
+    expected output, and the evaluation specs and judge prompt template shared by all test
+    cases. Files the feature reads on its own are not covered.
+
+    Args:
+        test_cases: The test cases to hash.
+        plugin_service: The plugin service, used to find the resources, specs and template.
+
+    Returns:
+        dict[int, str]: The hex digest of each test case, by test case ID.
+
+    """
+    resources_dir: anyio.Path = plugin_service.get_resources_dir()
+    shared: str = await _hash_shared_files(plugin_service)
+    file_hashes: dict[str, str] = {}
+
+    async def hash_resource(file_name: str | None) -> str | None:
+        if file_name is None:
+            return None
+
+        if file_name not in file_hashes:
+            file_hashes[file_name] = await _hash_file(resources_dir / file_name)
+
+        return file_hashes[file_name]
+
+    hashes: dict[int, str] = {}
+    for test_case in test_cases:
+        expected_file_name: str | None = (
+            test_case.expected_output.file_name if test_case.expected_output is not None else None
+        )
+        parts: dict[str, Any] = {
+            "shared": shared,
+            "definition": test_case.model_dump_json(),
+            "input": await hash_resource(test_case.input.file_name),
+            "expected_output": await hash_resource(expected_file_name),
+        }
+        hashes[test_case.id] = hashlib.sha256(
+            json.dumps(parts, sort_keys=True).encode()
+        ).hexdigest()
+
+    return hashes
+
+
+async def _hash_shared_files(plugin_service: PluginService) -> str:
+    digest = hashlib.sha256()
+    specs_dir: anyio.Path = plugin_service.get_llm_specs_dir()
+    if await specs_dir.is_dir():
+        spec_paths: list[anyio.Path] = sorted([path async for path in specs_dir.iterdir()])
+        for path in spec_paths:
+            if await path.is_file():
+                digest.update(f"{path.name}:{await _hash_file(path)}\n".encode())
+
+    template_path: anyio.Path = plugin_service.get_evaluation_task_template_path()
+    digest.update(f"template:{await _hash_file(template_path)}\n".encode())
+    return digest.hexdigest()
+
+
+async def _hash_file(path: anyio.Path) -> str:
+    try:
+        return hashlib.sha256(await path.read_bytes()).hexdigest()
+    except FileNotFoundError:
+        return MISSING_FILE_HASH
@@ -0,0 +1,518 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Runs test cases on workers that lease them from a coordinator over TCP.
+
+Messages are JSON objects, one per line. A worker sends ``hello`` and receives ``welcome``
+with the coordinator's settings and command line options, then repeatedly sends ``lease``
+requests and receives ``cases`` to run, until it receives ``done``. While it runs test cases
+it sends a ``heartbeat`` to keep their leases, and reports each outcome with the ``row`` and
+``failure`` events of worker processes.
+"""
+
+import asyncio
+import collections
+import contextlib
+import dataclasses
+import itertools
+import json
+import logging
+import os
+import socket
+import time
+from typing import TYPE_CHECKING, Any
+
+from rich.progress import Progress
+
+from vera.core import exceptions, plugin_service
+from vera.core.configuration import CONFIG
+from vera.core.feature_cache import close_feature_cache, get_feature_cache
+from vera.core.gemini import CLIENT_POOL
+from vera.core.llm_cache import close_llm_cache
+from vera.core.prompt_cache import PromptCache
+from vera.project_name import PROJECT_NAME
+
+from .batch_judge import JudgeMode
+from .repeat import RepeatMode, SharedFeatureOutputs
+from .scheduler import StageScheduler
+from .vtest import TestingService
+from .workers import OutcomeCollector, apply_config, failure_event, row_event
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Sequence
+
+    from vera.core.data_models.csv import CsvRow
+    from vera.core.data_models.test_case import TestCase
+    from vera.core.feature_cache import FeatureOutputCache
+    from vera.core.hook_specs import PluginService
+    from vera.core.plugin_service import PluginCreation
+
+    from .journal import RunCaseKey
+
+logger: logging.Logger = logging.getLogger(PROJECT_NAME)
+
+DEFAULT_PORT: int = 8765
+LEASE_TIMEOUT_SEC: float = 60.0
+LEASE_RETRY_SEC: float = 1.0
+CONNECT_TIMEOUT_SEC: float = 30.0
+SHUTDOWN_TIMEOUT_SEC: float = 5.0
+MAX_MESSAGE_SIZE: int = 64 * 1024 * 1024
+# Settings of the coordinator's machine that workers do not take over
+LOCAL_SETTINGS: frozenset[str] = frozenset({"dst_dir", "gemini_api_key", "log_level", "workers"})
+
+
+def parse_address(address: str) -> tuple[str, int]:
+    """Parse a ``host:port`` address. IPv6 hosts are written in brackets, as in ``[::1]:8765``.
+
+    Returns:
+        tuple[str, int]: The host and port.
+
+    Raises:
+        ValueError: If the address has no host or no valid port.
+
+    """
+    host, _, port = address.rpartition(":")
+    host = host.removeprefix("[").removesuffix("]")
+    if not host or not port.isdigit() or not 0 <= int(port) <= 65535:  # noqa: PLR2004
+        msg: str = f"Expected an address as HOST:PORT, got {address!r}"
+        raise ValueError(msg)
+
+    return host, int(port)
+
+
+class Connection:
+    """Sends and receives the JSON line messages of one coordinator connection."""
+
+    __slots__ = ("_lock", "_reader", "_writer")
+
+    def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        self._reader: asyncio.StreamReader = reader
+        self._writer: asyncio.StreamWriter = writer
+        self._lock = asyncio.Lock()
+
+    @property
+    def peer(self) -> str:
+        """The address of the other end of the connection."""
+        return ":".join(str(part) for part in self._writer.get_extra_info("peername")[:2])
+
+    async def send(self, message: dict[str, Any]) -> None:
+        """Send a message, after any message that is being sent by another task."""
+        data: bytes = json.dumps(message, separators=(",", ":")).encode() + b"\n"
+        async with self._lock:
+            self._writer.write(data)
+            await self._writer.drain()
+
+    async def receive(self) -> dict[str, Any] | None:
+        """Receive the next message.
+
+        Returns:
+            dict[str, Any] | None: The message, or None if the connection was closed.
+
+        """
+        line: bytes = await self._reader.readline()
+        if not line:
+            return None
+
+        message: dict[str, Any] = json.loads(line)
+        return message
+
+    async def aclose(self) -> None:
+        self._writer.close()
+        with contextlib.suppress(ConnectionError):
+            await self._writer.wait_closed()
+
+
+@dataclasses.dataclass(slots=True)
+class _Lease:
+    worker: str
+    expires_at: float
+
+
+class Coordinator(OutcomeCollector):
+    """Serves the pending test case runs of a suite to workers that connect over TCP.
+
+    Each worker leases test case runs, up to the number it asks for. A lease is kept alive by
+    the worker's heartbeats. When a worker disconnects its leases are released, and when a
+    lease expires, because its worker stopped responding, it is released as well. Released
+    test case runs are leased again before the others. Rows and failures reported by the
+    workers are added to the testing service of their run, as in a single process run.
+    """
+
+    __slots__ = (
+        "_connections",
+        "_finished",
+        "_ids",
+        "_leases",
+        "_pending",
+        "_server",
+        "extra_args",
+        "host",
+        "lease_timeout",
+        "port",
+    )
+
+    def __init__(
+        self,
+        services: Sequence[TestingService],
+        *,
+        host: str,
+        port: int,
+        extra_args: Iterable[str] = (),
+        lease_timeout: float = LEASE_TIMEOUT_SEC,
+    ) -> None:
+        super().__init__(services)
+        self.host: str = host
+        self.port: int = port
+        self.extra_args: tuple[str, ...] = tuple(extra_args)
+        self.lease_timeout: float = lease_timeout
+        self._pending: collections.deque[RunCaseKey] = collections.deque(self._test_cases)
+        self._leases: dict[RunCaseKey, _Lease] = {}
+        self._connections: dict[str, Connection] = {}
+        self._ids: itertools.count[int] = itertools.count(1)
+        self._finished = asyncio.Event()
+        self._server: asyncio.Server | None = None
+
+    async def start(self) -> tuple[str, int]:
+        """Start listening for workers.
+
+        Returns:
+            tuple[str, int]: The host and port the coordinator listens on. With port 0, the
+                port is chosen by the operating system.
+
+        """
+        self._server = await asyncio.start_server(
+            self._serve, self.host, self.port, limit=MAX_MESSAGE_SIZE
+        )
+        self.host, self.port = self._server.sockets[0].getsockname()[:2]
+        logger.info(
+            "Waiting for workers to run %s test cases. Start them with: %s worker --connect %s:%s",
+            len(self._pending),
+            PROJECT_NAME,
+            self.host,
+            self.port,
+        )
+        return self.host, self.port
+
+    async def run(self) -> None:
+        """Serve the test case runs until the outcome of each of them was reported.
+
+        Strict mode failures are raised as an ``ExceptionGroup`` once the workers are done.
+        """
+        if self._server is None:
+            await self.start()
+
+        if self.finished:
+            self._finished.set()
+
+        expire_task: asyncio.Task[None] = asyncio.create_task(self._expire_leases())
+        try:
+            await self._finished.wait()
+        finally:
+            expire_task.cancel()
+            await self._shutdown()
+
+        self.raise_strict_errors()
+
+    async def _shutdown(self) -> None:
+        # Workers disconnect once they are told that the coordinator is done. Workers that are
+        # still running test cases of expired leases are disconnected after a grace period.
+        for connection in list(self._connections.values()):
+            with contextlib.suppress(ConnectionError):
+                await connection.send({"type": "done"})
+
+        if self._server is None:
+            return
+
+        self._server.close()
+        try:
+            await asyncio.wait_for(self._server.wait_closed(), SHUTDOWN_TIMEOUT_SEC)
+        except TimeoutError:
+            for connection in list(self._connections.values()):
+                await connection.aclose()
+
+            await self._server.wait_closed()
+
+    async def _serve(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        connection: Connection = Connection(reader, writer)
+        worker: str = connection.peer
+        try:
+            hello: dict[str, Any] | None = await connection.receive()
+            if hello is None or hello.get("type") != "hello":
+                logger.warning("Ignoring connection from %s that did not say hello", worker)
+                return
+
+            worker = f"{hello.get('worker', worker)}#{next(self._ids)}"
+            logger.info("Worker %s connected from %s", worker, connection.peer)
+            self._connections[worker] = connection
+            await connection.send({
+                "type": "welcome",
+                "config": {
+                    name: value
+                    for name, value in CONFIG.model_dump(mode="json").items()
+                    if name not in LOCAL_SETTINGS
+                },
+                "extra_args": self.extra_args,
+                "heartbeat_interval": self.lease_timeout / 3,
+            })
+            while (message := await connection.receive()) is not None:
+                await self._handle_message(worker, connection, message)
+        except (ConnectionError, ValueError) as e:
+            logger.warning("Lost connection to worker %s: %s", worker, e)
+        finally:
+            if self._connections.get(worker) is connection:
+                del self._connections[worker]
+                logger.info("Worker %s disconnected", worker)
+
+            self._release_leases(worker)
+            await connection.aclose()
+
+    async def _handle_message(
+        self, worker: str, connection: Connection, message: dict[str, Any]
+    ) -> None:
+        match message.get("type"):
+            case "lease":
+                if self._finished.is_set():
+                    await connection.send({"type": "done"})
+                    return
+
+                keys: list[RunCaseKey] = self._lease(worker, int(message.get("count", 1)))
+                await connection.send({"type": "cases", "cases": keys})
+            case "heartbeat":
+                expires_at: float = time.monotonic() + self.lease_timeout
+                for lease in self._leases.values():
+                    if lease.worker == worker:
+                        lease.expires_at = expires_at
+            case "row" | "failure":
+                self._leases.pop((message["run_index"], message["test_case_id"]), None)
+                await self.add_outcome(message)
+                if self.finished:
+                    self._finished.set()
+            case _:
+                logger.warning("Ignoring unknown message from worker %s: %s", worker, message)
+
+    def _lease(self, worker: str, count: int) -> list[RunCaseKey]:
+        expires_at: float = time.monotonic() + self.lease_timeout
+        keys: list[RunCaseKey] = []
+        while self._pending and len(keys) < count:
+            key: RunCaseKey = self._pending.popleft()
+            if key in self._reported:
+                continue
+
+            self._leases[key] = _Lease(worker, expires_at)
+            keys.append(key)
+
+        return keys
+
+    def _release_leases(self, worker: str, *, expired_before: float | None = None) -> None:
+        released: list[RunCaseKey] = [
+            key
+            for key, lease in self._leases.items()
+            if lease.worker == worker
+            and (expired_before is None or lease.expires_at < expired_before)
+        ]
+        for key in released:
+            del self._leases[key]
+            if key not in self._reported:
+                self._pending.appendleft(key)
+
+        if released:
+            logger.warning("Leasing %s test cases of worker %s again", len(released), worker)
+
+    async def _expire_leases(self) -> None:
+        while True:
+            await asyncio.sleep(min(LEASE_RETRY_SEC, self.lease_timeout / 4))
+            now: float = time.monotonic()
+            expired: set[str] = {
+                lease.worker for lease in self._leases.values() if lease.expires_at < now
+            }
+            for worker in expired:
+                logger.warning("Worker %s stopped sending heartbeats", worker)
+                self._release_leases(worker, expired_before=now)
+
+
+class ConnectionRecorder:
+    """Reports the outcome of each test case run of a worker to its coordinator."""
+
+    __slots__ = ("_connection",)
+
+    def __init__(self, connection: Connection) -> None:
+        self._connection: Connection = connection
+
+    async def record_row(
+        self,
+        run_index: int,
+        row: CsvRow,
+        durations: dict[str, float],
+        output: dict[str, Any] | None = None,
+    ) -> None:
+        await self._connection.send(row_event(run_index, row, durations, output))
+
+    async def record_failure(self, run_index: int, test_case_id: int, error: Exception) -> None:
+        await self._connection.send(failure_event(run_index, test_case_id, error))
+
+
+async def run_remote_worker(
+    host: str, port: int, *, capacity: int | None = None, name: str | None = None
+) -> None:
+    """Connect to a coordinator and run the test cases it leases until it is done.
+
+    The worker takes over the coordinator's settings, apart from local ones such as the API
+    key and the report directory, and applies the coordinator's command line options to its
+    own plugins. Batch judging is not supported, each judge prompt is sent interactively.
+
+    Args:
+        host: The host of the coordinator.
+        port: The port of the coordinator.
+        capacity: The maximum number of test cases to run at the same time. Defaults to the
+            feature concurrency.
+        name: The name of the worker in the coordinator's logs. Defaults to the host name and
+            process ID.
+
+    Raises:
+        WorkerError: If the coordinator closed the connection before welcoming the worker.
+
+    """
+    connection: Connection = await _connect(host, port)
+    try:
+        await connection.send({
+            "type": "hello",
+            "worker": name or f"{socket.gethostname()}-{os.getpid()}",
+        })
+        welcome: dict[str, Any] | None = await connection.receive()
+        if welcome is None:
+            msg: str = f"The coordinator at {host}:{port} closed the connection"
+            raise exceptions.WorkerError(msg)
+
+        apply_config(welcome["config"])
+        if CONFIG.judge_mode == JudgeMode.BATCH:
+            logger.info("Workers send judge prompts interactively instead of in batches")
+
+        pc: PluginCreation = plugin_service.create_service()
+        pc.plugin_service.handle_test_command_extra_args(extra_args=list(welcome["extra_args"]))
+        _ = pc.plugin_service.get_llm_configuration().api_key
+        await run_leased_cases(
+            connection,
+            pc.plugin_service,
+            capacity=capacity or CONFIG.feature_concurrency,
+            heartbeat_interval=welcome["heartbeat_interval"],
+        )
+    finally:
+        await connection.aclose()
+        await CLIENT_POOL.aclose()
+        close_llm_cache()
+        close_feature_cache()
+
+
+async def run_leased_cases(
+    connection: Connection,
+    service: PluginService,
+    *,
+    capacity: int,
+    heartbeat_interval: float,
+) -> None:
+    """Lease test case runs from the coordinator and run them, until it is done.
+
+    Args:
+        connection: The welcomed connection to the coordinator.
+        service: The plugin service that runs the test cases.
+        capacity: The maximum number of test cases to run at the same time.
+        heartbeat_interval: The number of seconds between heartbeats.
+
+    """
+    test_cases: dict[int, TestCase[Any]] = {tc.id: tc for tc in service.get_test_cases()}
+    recorder: ConnectionRecorder = ConnectionRecorder(connection)
+    progress: Progress = Progress(disable=True)
+    cli_service = service.get_cli_service(progress=progress, task_id=progress.add_task(""))
+    scheduler: StageScheduler = StageScheduler.from_config(CONFIG)
+    prompt_cache: PromptCache = PromptCache(service)
+    feature_cache: FeatureOutputCache[Any] | None = get_feature_cache(service)
+    shared_outputs: SharedFeatureOutputs | None = None
+    if CONFIG.repeat == RepeatMode.JUDGE:
+        shared_outputs = SharedFeatureOutputs()
+
+    running: set[asyncio.Task[None]] = set()
+    heartbeat_task: asyncio.Task[None] = asyncio.create_task(
+        _send_heartbeats(connection, heartbeat_interval)
+    )
+    try:
+        while True:
+            if len(running) < capacity:
+                await connection.send({"type": "lease", "count": capacity - len(running)})
+                message: dict[str, Any] | None = await connection.receive()
+                if message is None or message.get("type") == "done":
+                    break
+
+                for run_index, test_case_id in message["cases"]:
+                    test_case: TestCase[Any] | None = test_cases.get(test_case_id)
+                    if test_case is None:
+                        error = exceptions.WorkerError(f"Test case {test_case_id} not found")
+                        await recorder.record_failure(run_index, test_case_id, error)
+                        continue
+
+                    es = TestingService(
+                        [test_case],
+                        service,
+                        cli_service,
+                        scheduler=scheduler,
+                        prompt_cache=prompt_cache,
+                        run_index=run_index,
+                        journal=recorder,
+                        stream_rows=False,
+                        shared_outputs=shared_outputs,
+                        feature_cache=feature_cache,
+                    )
+                    running.add(asyncio.create_task(_run_case(es)))
+
+                if message["cases"]:
+                    continue
+
+            if running:
+                _, running = await asyncio.wait(
+                    running, timeout=LEASE_RETRY_SEC, return_when=asyncio.FIRST_COMPLETED
+                )
+            else:
+                await asyncio.sleep(LEASE_RETRY_SEC)
+    finally:
+        heartbeat_task.cancel()
+        for task in running:
+            task.cancel()
+
+        await asyncio.gather(heartbeat_task, *running, return_exceptions=True)
+
+
+async def _connect(host: str, port: int) -> Connection:
+    # Workers may be started before their coordinator
+    deadline: float = time.monotonic() + CONNECT_TIMEOUT_SEC
+    while True:
+        try:
+            reader, writer = await asyncio.open_connection(host, port, limit=MAX_MESSAGE_SIZE)
+        except OSError:
+            if time.monotonic() >= deadline:
+                raise
+
+            await asyncio.sleep(LEASE_RETRY_SEC)
+        else:
+            return Connection(reader, writer)
+
+
+async def _send_heartbeats(connection: Connection, interval: float) -> None:
+    while True:
+        await asyncio.sleep(interval)
+        await connection.send({"type": "heartbeat"})
+
+
+async def _run_case(es: TestingService) -> None:
+    # Strict mode failures were reported as failures, and are raised by the coordinator
+    with contextlib.suppress(exceptions.TestCaseTestingError):
+        await es.run_tests()
@@ -0,0 +1,231 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import dataclasses
+import json
+import logging
+import os
+import secrets
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Protocol
+
+from platformdirs import user_state_dir
+
+from vera.core.serialization import dump_model_state, load_model_state
+from vera.project_name import PROJECT_NAME
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    from vera.core.data_models.csv import CsvRow
+    from vera.core.data_models.test_case.output import TestCaseOutput
+
+logger: logging.Logger = logging.getLogger(PROJECT_NAME)
+
+RUNS_DIR_NAME: str = "runs"
+JOURNAL_SUFFIX: str = ".jsonl"
+
+type RunCaseKey = tuple[int, int]
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class CompletedCase[T_Row: CsvRow]:
+    """A test case run whose row was recorded in a journal."""
+
+    run_index: int
+    row: T_Row
+    durations: dict[str, float]
+
+
+class RunRecorder(Protocol):
+    """Receives the outcome of each test case run as soon as it finishes."""
+
+    async def record_row(
+        self,
+        run_index: int,
+        row: CsvRow,
+        durations: dict[str, float],
+        output: dict[str, Any] | None = None,
+    ) -> None:
+        """Record the row of a finished test case run, and the state of its feature output."""
+
+    async def record_failure(self, run_index: int, test_case_id: int, error: Exception) -> None:
+        """Record the error of a failed test case run."""
+
+
+class RunJournal:
+    """Append-only record of the test case runs of a ``vera test`` invocation.
+
+    Each finished test case run appends its row and stage durations, and each failed one
+    appends its error, as one JSON line that is flushed to disk before the next test case
+    finishes. A run that was interrupted can be resumed from its journal by skipping the test
+    case runs that already have a row. Failed test case runs are run again on resume.
+    """
+
+    __slots__ = ("_lock", "path", "run_id")
+
+    def __init__(self, run_id: str, path: Path) -> None:
+        self.run_id: str = run_id
+        self.path: Path = path
+        self._lock: asyncio.Lock = asyncio.Lock()
+
+    @classmethod
+    def create(cls) -> RunJournal:
+        """Create the journal of a new run, with a new run ID.
+
+        Returns:
+            RunJournal: The new, empty journal.
+
+        """
+        run_id: str = f"{time.strftime('%Y%m%d-%H%M%S')}-{secrets.token_hex(3)}"
+        return cls(run_id, get_journals_dir() / f"{run_id}{JOURNAL_SUFFIX}")
+
+    @classmethod
+    def open(cls, run_id: str) -> RunJournal:
+        """Open the journal of an earlier run.
+
+        Returns:
+            RunJournal: The journal, which new records are appended to.
+
+        Raises:
+            FileNotFoundError: If there is no journal for the run ID.
+
+        """
+        path: Path = get_journals_dir() / f"{run_id}{JOURNAL_SUFFIX}"
+        if not path.is_file():
+            msg: str = f"No journal found for run {run_id} in {path.parent}"
+            raise FileNotFoundError(msg)
+
+        return cls(run_id, path)
+
+    async def record_row(
+        self,
+        run_index: int,
+        row: CsvRow,
+        durations: dict[str, float],
+        output: dict[str, Any] | None = None,
+    ) -> None:
+        """Append the row of a finished test case run, and the state of its feature output."""
+        await self._append({
+            "type": "row",
+            "run_index": run_index,
+            "test_case_id": row.identifier,
+            "row": dump_model_state(row),
+            "durations": durations,
+            "output": output,
+        })
+
+    async def record_failure(self, run_index: int, test_case_id: int, error: Exception) -> None:
+        """Append the error of a failed test case run."""
+        await self._append({
+            "type": "failure",
+            "run_index": run_index,
+            "test_case_id": test_case_id,
+            "error_type": type(error).__name__,
+            "error": str(error),
+        })
+
+    def load[T_Row: CsvRow](self, row_class: type[T_Row]) -> dict[RunCaseKey, CompletedCase[T_Row]]:
+        """Read the test case runs that finished with a row.
+
+        Lines that can not be parsed, such as a line cut short by a crash, are skipped.
+
+        Args:
+            row_class: The plugin's row class, used to recreate the recorded rows.
+
+        Returns:
+            dict[RunCaseKey, CompletedCase[T_Row]]: The finished test case runs, by run index
+                and test case ID.
+
+        """
+        completed: dict[RunCaseKey, CompletedCase[T_Row]] = {}
+        for number, record in self._read_rows():
+            try:
+                run_index: int = record["run_index"]
+                completed[run_index, record["test_case_id"]] = CompletedCase(
+                    run_index=run_index,
+                    row=load_model_state(row_class, record["row"]),
+                    durations=record.get("durations") or {},
+                )
+            except (ValueError, KeyError, TypeError) as e:
+                logger.warning("Skipping unreadable line %s of %s: %s", number, self.path, e)
+
+        return completed
+
+    def load_outputs[T_Output: TestCaseOutput](
+        self, output_class: type[T_Output]
+    ) -> dict[RunCaseKey, T_Output]:
+        """Read the feature outputs of the test case runs that finished with a row.
+
+        Rows recorded without an output, such as by versions that did not record them, and
+        lines that can not be parsed are skipped.
+
+        Args:
+            output_class: The plugin's output class, used to recreate the recorded outputs.
+
+        Returns:
+            dict[RunCaseKey, T_Output]: The feature outputs, by run index and test case ID.
+
+        """
+        outputs: dict[RunCaseKey, T_Output] = {}
+        for number, record in self._read_rows():
+            if record.get("output") is None:
+                continue
+
+            try:
+                outputs[record["run_index"], record["test_case_id"]] = load_model_state(
+                    output_class, record["output"]
+                )
+            except (ValueError, KeyError, TypeError) as e:
+                logger.warning(
+                    "Skipping unreadable output on line %s of %s: %s", number, self.path, e
+                )
+
+        return outputs
+
+    def _read_rows(self) -> Iterator[tuple[int, dict[str, Any]]]:
+        with self.path.open(encoding="utf-8") as f:
+            for number, line in enumerate(f, start=1):
+                if not line.strip():
+                    continue
+
+                try:
+                    record: dict[str, Any] = json.loads(line)
+                except ValueError as e:
+                    logger.warning("Skipping unreadable line %s of %s: %s", number, self.path, e)
+                    continue
+
+                if isinstance(record, dict) and record.get("type") == "row":
+                    yield number, record
+
+    async def _append(self, record: dict[str, Any]) -> None:
+        line: str = json.dumps(record) + "\n"
+        async with self._lock:
+            try:
+                await asyncio.to_thread(self._write, line)
+            except OSError as e:
+                logger.warning("Failed to write to the run journal %s: %s", self.path, e)
+
+    def _write(self, line: str) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self.path.open("a", encoding="utf-8") as f:
+            f.write(line)
+            f.flush()
+            os.fsync(f.fileno())
+
+
+def get_journals_dir() -> Path:
+    return Path(user_state_dir(appname=PROJECT_NAME)) / RUNS_DIR_NAME
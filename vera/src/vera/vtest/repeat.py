@@ -0,0 +1,95 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import contextlib
+from enum import StrEnum
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+    from contextlib import AbstractAsyncContextManager
+
+
+class RepeatMode(StrEnum):
+    SUITE = "suite"
+    JUDGE = "judge"
+
+
+class _FeatureCancelledError(Exception):
+    """The run that was running the feature of a test case for the others was cancelled."""
+
+
+class SharedFeatureOutputs:
+    """Runs the feature of each test case once for all runs of a suite.
+
+    The first run of a test case that needs the feature output runs the feature, and the other
+    runs wait for its output, and each of them evaluates it on its own. If the run that runs the
+    feature is cancelled, such as by its timeout, a waiting run runs the feature instead. An
+    error of the feature is raised in every run.
+    """
+
+    __slots__ = ("_outputs",)
+
+    def __init__(self) -> None:
+        self._outputs: dict[int, asyncio.Future[Any]] = {}
+
+    async def get_or_run[T](
+        self,
+        test_case_id: int,
+        run_feature: Callable[[], Awaitable[T]],
+        waiting: Callable[[], AbstractAsyncContextManager[None]] = contextlib.nullcontext,
+    ) -> T:
+        """Return the feature output of a test case, running the feature if no run did yet.
+
+        Args:
+            test_case_id: The ID of the test case.
+            run_feature: Runs the feature and returns its output.
+            waiting: Creates a context that is entered while waiting for the output of another
+                run, such as one that stops the clock of the test case timeout.
+
+        Returns:
+            T: The feature output.
+
+        Raises:
+            asyncio.CancelledError: If the run is cancelled while running the feature, after
+                handing the feature over to a waiting run.
+
+        """
+        while (future := self._outputs.get(test_case_id)) is not None:
+            try:
+                async with waiting():
+                    return await asyncio.shield(future)
+            except _FeatureCancelledError:
+                continue
+
+        future = self._outputs[test_case_id] = asyncio.get_running_loop().create_future()
+        try:
+            output: T = await run_feature()
+        except asyncio.CancelledError:
+            del self._outputs[test_case_id]
+            _set_exception(future, _FeatureCancelledError())
+            raise
+        except Exception as e:
+            _set_exception(future, e)
+            raise
+
+        future.set_result(output)
+        return output
+
+
+def _set_exception(future: asyncio.Future[Any], error: Exception) -> None:
+    future.set_exception(error)
+    # Marks the exception as retrieved, for test cases that no other run is waiting for
+    future.exception()
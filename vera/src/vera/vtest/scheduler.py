@@ -0,0 +1,194 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import contextlib
+import dataclasses
+import heapq
+import itertools
+import logging
+import statistics
+from enum import StrEnum
+from typing import TYPE_CHECKING, Self
+
+from vera.project_name import PROJECT_NAME
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncGenerator, Iterable, Mapping
+
+    from vera.core.configuration import VeraConfig
+
+logger: logging.Logger = logging.getLogger(PROJECT_NAME)
+
+
+class Stage(StrEnum):
+    FEATURE = "feature"
+    STATIC = "static"
+    LLM = "llm"
+
+
+def estimate_durations(
+    test_case_ids: Iterable[int], durations: Mapping[int, float]
+) -> dict[int, float]:
+    """Estimate the duration of test cases from their recorded durations.
+
+    Test cases without a recorded duration are expected to take the median recorded duration,
+    or one second if there is none.
+
+    Returns:
+        dict[int, float]: The expected duration in seconds, by test case ID.
+
+    """
+    ids: list[int] = list(test_case_ids)
+    known: list[float] = [durations[i] for i in ids if i in durations]
+    default: float = statistics.median(known) if known else 1.0
+    return {i: durations.get(i, default) for i in ids}
+
+
+class PrioritySemaphore:
+    """A semaphore that wakes its waiters by priority, highest first.
+
+    Waiters of equal priority are woken in order of arrival, as with ``asyncio.Semaphore``.
+    """
+
+    __slots__ = ("_sequence", "_value", "_waiters")
+
+    def __init__(self, value: int) -> None:
+        self._value: int = value
+        self._waiters: list[tuple[float, int, asyncio.Future[None]]] = []
+        self._sequence: itertools.count[int] = itertools.count()
+
+    def locked(self) -> bool:
+        return self._value == 0
+
+    async def acquire(self, priority: float = 0.0) -> None:
+        if self._value > 0:
+            self._value -= 1
+            return
+
+        future: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiters, (-priority, next(self._sequence), future))
+        try:
+            await future
+        except asyncio.CancelledError:
+            # A waiter cancelled after it was woken up hands its slot on
+            if not future.cancelled():
+                self.release()
+            raise
+
+    def release(self) -> None:
+        while self._waiters:
+            _, _, future = heapq.heappop(self._waiters)
+            if not future.done():
+                future.set_result(None)
+                return
+
+        self._value += 1
+
+
+class StageScheduler:
+    """Bounds how many test cases may be in each stage of the testing pipeline at once.
+
+    A single scheduler is shared by every run of a suite, so the limits apply to the whole
+    invocation rather than to each run separately. When a stage is full, queued test cases
+    enter it by priority, so test cases expected to take longest can be started first.
+    """
+
+    __slots__ = ("_pauses", "_semaphores", "limits")
+
+    def __init__(self, limits: Mapping[Stage, int]) -> None:
+        missing: set[Stage] = set(Stage) - set(limits)
+        if missing:
+            msg: str = f"Missing concurrency limits for stages: {sorted(missing)}"
+            raise ValueError(msg)
+
+        for stage, limit in limits.items():
+            if limit < 1:
+                msg: str = f"Concurrency limit for the {stage} stage must be greater than 0"
+                raise ValueError(msg)
+
+        self.limits: dict[Stage, int] = dict(limits)
+        self._semaphores: dict[Stage, PrioritySemaphore] = {
+            stage: PrioritySemaphore(limit) for stage, limit in self.limits.items()
+        }
+        self._pauses: dict[int, _Pause] = {}
+
+    @classmethod
+    def from_config(cls, config: VeraConfig) -> Self:
+        return cls({
+            Stage.FEATURE: config.feature_concurrency,
+            Stage.STATIC: config.static_concurrency,
+            Stage.LLM: config.llm_concurrency,
+        })
+
+    @contextlib.asynccontextmanager
+    async def slot(
+        self,
+        stage: Stage,
+        deadline: asyncio.Timeout | None = None,
+        priority: float = 0.0,
+    ) -> AsyncGenerator[None]:
+        """Wait for a free slot in the given stage and hold it for the duration of the block.
+
+        Args:
+            stage: The pipeline stage to enter.
+            deadline: The test case timeout. Its clock is stopped while the test case is queued,
+                so a test case is timed on the work it does and not on its place in the queue.
+            priority: The priority of the test case in the queue of the stage, such as its
+                expected duration. Test cases of equal priority enter in order of arrival.
+
+        """
+        semaphore: PrioritySemaphore = self._semaphores[stage]
+        if deadline is None or not semaphore.locked():
+            await semaphore.acquire(priority)
+        else:
+            logger.debug("Waiting for a free slot in the %s stage", stage)
+            async with self.paused(deadline):
+                await semaphore.acquire(priority)
+
+        try:
+            yield
+        finally:
+            semaphore.release()
+
+    @contextlib.asynccontextmanager
+    async def paused(self, deadline: asyncio.Timeout) -> AsyncGenerator[None]:
+        """Stop the clock of a test case timeout for the duration of the block.
+
+        Several stages of the same test case may wait at once, so the clock is resumed only when
+        the last of them is done waiting.
+        """
+        loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
+        pause: _Pause | None = self._pauses.get(id(deadline))
+        if pause is None:
+            when: float | None = deadline.when()
+            remaining: float | None = None if when is None else when - loop.time()
+            pause = self._pauses[id(deadline)] = _Pause(remaining=remaining)
+            deadline.reschedule(None)
+
+        pause.waiters += 1
+        try:
+            yield
+        finally:
+            pause.waiters -= 1
+            if not pause.waiters:
+                del self._pauses[id(deadline)]
+                if pause.remaining is not None:
+                    deadline.reschedule(loop.time() + pause.remaining)
+
+
+@dataclasses.dataclass(slots=True)
+class _Pause:
+    remaining: float | None
+    waiters: int = 0
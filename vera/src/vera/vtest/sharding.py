@@ -0,0 +1,131 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import dataclasses
+import hashlib
+import heapq
+from enum import StrEnum
+from typing import TYPE_CHECKING, Self
+
+from .scheduler import estimate_durations
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Mapping
+
+    from vera.core.data_models.test_case import TestCase
+
+
+class ShardStrategy(StrEnum):
+    HASH = "hash"
+    DURATION = "duration"
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class Shard:
+    """One of ``count`` parts of a test suite, numbered from 1."""
+
+    index: int
+    count: int
+
+    @classmethod
+    def parse(cls, value: str) -> Self:
+        """Parse a shard written as ``INDEX/COUNT``, such as ``3/8``.
+
+        Returns:
+            Self: The shard.
+
+        Raises:
+            ValueError: If the value is not a shard of a positive count.
+
+        """
+        index, _, count = value.partition("/")
+        if not index.isdigit() or not count.isdigit() or not 1 <= int(index) <= int(count):
+            msg: str = f"Expected a shard as INDEX/COUNT with 1 <= INDEX <= COUNT, got {value!r}"
+            raise ValueError(msg)
+
+        return cls(int(index), int(count))
+
+    def __str__(self) -> str:
+        return f"{self.index}/{self.count}"
+
+
+def hash_shard(test_case_id: int, count: int) -> int:
+    """Assign a test case to a shard by the hash of its ID.
+
+    The assignment only depends on the ID and the shard count, so it does not change when test
+    cases are added, removed or filtered, and it is the same on every machine.
+
+    Returns:
+        int: The index of the shard, from 1 to ``count``.
+
+    """
+    digest: bytes = hashlib.sha256(str(test_case_id).encode()).digest()
+    return int.from_bytes(digest[:8]) % count + 1
+
+
+def balance_shards(
+    test_case_ids: Iterable[int], count: int, durations: Mapping[int, float]
+) -> dict[int, int]:
+    """Assign test cases to shards so that the shards take about the same time.
+
+    Test cases are assigned longest first, each to the shard with the least expected time so
+    far. Test cases without a recorded duration are expected to take the median duration. Ties
+    are broken by test case ID and shard index, so every shard computes the same assignment
+    from the same durations.
+
+    Args:
+        test_case_ids: The IDs of the test cases.
+        count: The number of shards.
+        durations: The expected duration in seconds of test cases, by ID.
+
+    Returns:
+        dict[int, int]: The index of the shard of each test case, from 1 to ``count``, by ID.
+
+    """
+    ids: list[int] = sorted(set(test_case_ids))
+    expected: dict[int, float] = estimate_durations(ids, durations)
+
+    loads: list[tuple[float, int]] = [(0.0, index) for index in range(1, count + 1)]
+    assignment: dict[int, int] = {}
+    for test_case_id in sorted(ids, key=lambda i: (-expected[i], i)):
+        load, index = heapq.heappop(loads)
+        assignment[test_case_id] = index
+        heapq.heappush(loads, (load + expected[test_case_id], index))
+
+    return assignment
+
+
+def select_shard[T: TestCase](
+    test_cases: Iterable[T], shard: Shard, durations: Mapping[int, float] | None = None
+) -> list[T]:
+    """Select the test cases of a shard, in their original order.
+
+    Args:
+        test_cases: The test cases of the whole suite, after filtering.
+        shard: The shard to select.
+        durations: The expected duration of test cases, by ID, to balance the shards by. The
+            shards are assigned by hash if not given.
+
+    Returns:
+        list[T]: The test cases of the shard.
+
+    """
+    test_cases = list(test_cases)
+    if durations is None:
+        return [tc for tc in test_cases if hash_shard(tc.id, shard.count) == shard.index]
+
+    assignment: dict[int, int] = balance_shards(
+        (tc.id for tc in test_cases), shard.count, durations
+    )
+    return [tc for tc in test_cases if assignment[tc.id] == shard.index]
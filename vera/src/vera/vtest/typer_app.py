@@ -13,6 +13,7 @@
 # limitations under the License.
 
 import asyncio
+import contextlib
 import logging
 from pathlib import Path  # noqa: TC003
 from typing import TYPE_CHECKING, Annotated, Any, override
@@ -31,42 +32,78 @@ from rich.progress import (
 )
 from rich.text import Text
 
-from vera.core import plugin_service, utils
+from vera.core import exceptions, plugin_service, throttling, utils
+from vera.core.columnar_report import ColumnarFormat, import_pyarrow
 from vera.core.configuration import CONFIG
 from vera.core.data_models.test_case import TestCaseInput
+from vera.core.feature_cache import close_feature_cache, get_feature_cache
+from vera.core.gemini import CLIENT_POOL
+from vera.core.llm_cache import close_llm_cache
+from vera.core.prompt_cache import PromptCache
+from vera.core.results_store import (
+    ResultsStore,
+    load_mean_durations,
+    load_test_case_hashes,
+    read_durations_file,
+)
 from vera.logger import setup_logging
 from vera.project_name import PROJECT_NAME
 
+from .adaptive import AUTO_RUNS_COUNT, MIN_ADAPTIVE_RUNS, AdaptiveRuns
+from .batch_judge import BatchJudge, JudgeMode
+from .changes import hash_test_cases
+from .coordinator import DEFAULT_PORT, Coordinator, parse_address, run_remote_worker
+from .journal import CompletedCase, RunCaseKey, RunJournal
+from .repeat import RepeatMode, SharedFeatureOutputs
+from .scheduler import StageScheduler
+from .sharding import Shard, ShardStrategy, select_shard
 from .vtest import TestingService
 from .vtest_setup import TestSetup
 from .vtest_summary import ReportSummary
+from .workers import WorkerPool
 
 if TYPE_CHECKING:
     from collections.abc import Iterable
 
     from vera.core.data_models.test_case import TestCase
+    from vera.core.data_models.test_case.output import TestCaseOutput
+    from vera.core.feature_cache import FeatureOutputCache
     from vera.core.hook_specs import CliService
     from vera.core.plugin_service import PluginCreation
 
 app: typer.Typer = typer.Typer(help="Test features.")
 logger: logging.Logger = logging.getLogger(PROJECT_NAME)
 
+TOTAL_PROGRESS_DESCRIPTION: str = "[bold green]Total Progress[/bold green]"
+
 
 class SmartProgressColumn(ProgressColumn):
     @override
     def render(self, task: Task) -> ConsoleRenderable:
-        if task.description == "[bold green]Total Progress[/bold green]":
+        if task.description == TOTAL_PROGRESS_DESCRIPTION:
             return Text(f"{int(task.completed)}/{int(task.total or 0)}")
         return Text(f"{task.percentage:>3.0f}%")
 
 
+class LlmWindowColumn(ProgressColumn):
+    """Shows the in-flight LLM requests and the current adaptive concurrency window."""
+
+    @override
+    def render(self, task: Task) -> ConsoleRenderable:
+        if task.description != TOTAL_PROGRESS_DESCRIPTION:
+            return Text("")
+
+        limiter: throttling.AdaptiveConcurrencyLimiter = throttling.get_llm_limiter()
+        return Text(f"LLM {limiter.in_flight}/{limiter.window}", style="dim")
+
+
 @app.command(
     name="test",
     help="Test installed features.",
     context_settings={"allow_extra_args": True, "ignore_unknown_options": True},
 )
 @utils.syncify
-async def vtest_feature(  # noqa: PLR0913
+async def vtest_feature(  # noqa: C901, PLR0912, PLR0913, PLR0914, PLR0915
     context: typer.Context,
     test_tags: Annotated[
         list[str],
@@ -86,13 +123,163 @@ async def vtest_feature(  # noqa: PLR0913
         ),
     ] = None,
     runs_count: Annotated[
-        int,
-        typer.Option("--runs-count", "-r", help="The number of times the test suite will run"),
-    ] = 1,
+        str,
+        typer.Option(
+            "--runs-count",
+            "-r",
+            metavar="INTEGER|auto",
+            help="The number of times the test suite will run, "
+            "or auto to repeat each test case until its score is stable",
+        ),
+    ] = "1",
     *,
     verbose: Annotated[bool, typer.Option("--verbose", "-v", help="Use verbose output")] = False,
     quiet: Annotated[bool, typer.Option("--quiet", "-q", help="Do not print any output")] = False,
     create_csv: Annotated[bool, typer.Option(help="Enable/Disable CSV report generation")] = True,
+    feature_concurrency: Annotated[
+        int | None,
+        typer.Option(
+            min=1,
+            help="The maximum number of test cases running the feature at the same time",
+        ),
+    ] = None,
+    static_concurrency: Annotated[
+        int | None,
+        typer.Option(
+            min=1,
+            help="The maximum number of test cases running static tests at the same time",
+        ),
+    ] = None,
+    llm_concurrency: Annotated[
+        int | None,
+        typer.Option(
+            min=1,
+            help="The maximum number of test cases evaluated by the LLM judge at the same time",
+        ),
+    ] = None,
+    workers: Annotated[
+        int | None,
+        typer.Option(
+            min=1,
+            help="The number of worker processes that run the test cases",
+        ),
+    ] = None,
+    repeat: Annotated[
+        RepeatMode | None,
+        typer.Option(
+            help="Repeat the whole test suite for each run, "
+            "or run the feature once and only repeat the evaluations",
+        ),
+    ] = None,
+    max_runs: Annotated[
+        int | None,
+        typer.Option(
+            min=MIN_ADAPTIVE_RUNS,
+            help="The maximum number of runs of a test case with --runs-count auto",
+        ),
+    ] = None,
+    ci: Annotated[
+        float | None,
+        typer.Option(
+            help="The width of the 95% confidence interval of the final score "
+            "below which --runs-count auto stops repeating a test case",
+        ),
+    ] = None,
+    shard: Annotated[
+        str | None,
+        typer.Option(
+            metavar="INDEX/COUNT",
+            help="Only run one of COUNT parts of the test cases, such as 3/8",
+        ),
+    ] = None,
+    shard_strategy: Annotated[
+        ShardStrategy,
+        typer.Option(
+            help="Split the test cases by the hash of their ID, "
+            "or balance the parts by the test case durations of --durations",
+        ),
+    ] = ShardStrategy.HASH,
+    durations_file: Annotated[
+        Path | None,
+        typer.Option(
+            "--durations",
+            metavar="FILE",
+            help="The test case durations that --shard-strategy duration balances the parts by, "
+            "as written by vera history --export-durations",
+        ),
+    ] = None,
+    coordinator: Annotated[
+        bool,
+        typer.Option(
+            help="Serve the test cases to workers started with the worker command, "
+            "instead of running them",
+        ),
+    ] = False,
+    listen: Annotated[
+        str,
+        typer.Option(
+            metavar="HOST:PORT",
+            help="The address the coordinator listens on, "
+            "use 0.0.0.0 as the host to accept workers on other machines",
+        ),
+    ] = f"127.0.0.1:{DEFAULT_PORT}",
+    feature_cache_option: Annotated[
+        bool | None,
+        typer.Option(
+            "--feature-cache/--no-feature-cache",
+            help="Enable/Disable reusing cached outputs of deterministic features",
+        ),
+    ] = None,
+    llm_cache: Annotated[
+        bool | None,
+        typer.Option(help="Enable/Disable reusing cached LLM judge responses"),
+    ] = None,
+    refresh_llm_cache: Annotated[
+        bool,
+        typer.Option(help="Ignore cached LLM judge responses and replace them with new ones"),
+    ] = False,
+    judge_mode: Annotated[
+        JudgeMode | None,
+        typer.Option(
+            help="Send each judge prompt interactively, or send all of them in batches",
+        ),
+    ] = None,
+    judge_batch_size: Annotated[
+        int | None,
+        typer.Option(min=1, help="The maximum number of judge prompts in one batch"),
+    ] = None,
+    columnar_report: Annotated[
+        ColumnarFormat | None,
+        typer.Option(help="Also write the results to a Parquet or Arrow report file"),
+    ] = None,
+    resume_batch: Annotated[
+        bool,
+        typer.Option(
+            help="Reattach to the batch jobs of an interrupted run instead of sending them again",
+        ),
+    ] = False,
+    resume: Annotated[
+        str | None,
+        typer.Option(
+            metavar="RUN_ID",
+            help="Resume an interrupted run, skipping the test cases it already finished",
+        ),
+    ] = None,
+    rejudge: Annotated[
+        str | None,
+        typer.Option(
+            metavar="RUN_ID",
+            help="Judge the feature outputs recorded by an earlier run again, "
+            "without running the feature",
+        ),
+    ] = None,
+    changed_only: Annotated[
+        bool,
+        typer.Option(
+            help="Only run the test cases that changed since the last run they passed in, "
+            "and carry the results of the others forward",
+        ),
+    ] = False,
 ) -> None:
     _handle_logging(quiet=quiet, verbose=verbose)
     logger.debug(
@@ -105,52 +292,233 @@ async def vtest_feature(  # noqa: PLR0913
     setup: TestSetup = TestSetup(pc)
     setup.handle_command_extrac_args(context).log_plugin_names().validate_llm_api_key()
 
-    if runs_count < 1:
-        logger.error("Run count must be greater than 0")
+    adaptive: bool = runs_count == AUTO_RUNS_COUNT
+    if not adaptive and (not runs_count.isdigit() or int(runs_count) < 1):
+        logger.error("Run count must be greater than 0, or auto")
+        raise typer.Exit(1)
+    if ci is not None and ci <= 0:
+        logger.error("The confidence interval width must be greater than 0")
         raise typer.Exit(1)
 
     if dst_dir:
         CONFIG.dst_dir = dst_dir
     if not create_csv:
         CONFIG.enable_csv_report = False
+    if feature_concurrency is not None:
+        CONFIG.feature_concurrency = feature_concurrency
+    if static_concurrency is not None:
+        CONFIG.static_concurrency = static_concurrency
+    if llm_concurrency is not None:
+        CONFIG.llm_concurrency = llm_concurrency
+    if workers is not None:
+        CONFIG.workers = workers
+    if coordinator and CONFIG.workers > 1:
+        logger.error("The coordinator cannot run test cases in worker processes")
+        raise typer.Exit(1)
+    if llm_cache is not None:
+        CONFIG.enable_llm_cache = llm_cache
+    if feature_cache_option is not None:
+        CONFIG.enable_feature_cache = feature_cache_option
+    if max_runs is not None:
+        CONFIG.max_runs = max_runs
+    if ci is not None:
+        CONFIG.ci_width = ci
+
+    adaptive_runs: AdaptiveRuns | None = None
+    # With adaptive runs, every test case may run up to the maximum number of runs
+    runs: int = CONFIG.max_runs if adaptive else int(runs_count)
+    if adaptive:
+        if CONFIG.workers > 1 or coordinator:
+            logger.error("Adaptive runs cannot be combined with workers or a coordinator")
+            raise typer.Exit(1)
+        if CONFIG.max_runs < MIN_ADAPTIVE_RUNS:
+            logger.error("Adaptive runs need a maximum of at least %s runs", MIN_ADAPTIVE_RUNS)
+            raise typer.Exit(1)
+        adaptive_runs = AdaptiveRuns(CONFIG.ci_width)
+
+    if repeat is not None:
+        CONFIG.repeat = repeat.value
+    if refresh_llm_cache:
+        CONFIG.refresh_llm_cache = True
+    if judge_mode is not None:
+        CONFIG.judge_mode = judge_mode.value
+    if judge_batch_size is not None:
+        CONFIG.judge_batch_size = judge_batch_size
+    if columnar_report is not None:
+        CONFIG.columnar_report = columnar_report.value
+    if CONFIG.columnar_report is not None:
+        _ensure_pyarrow()
+    if resume_batch:
+        CONFIG.resume_batch = True
+        CONFIG.judge_mode = JudgeMode.BATCH.value
 
     CONFIG.verbose = verbose
+    if rejudge is not None and (adaptive or CONFIG.workers > 1 or coordinator):
+        logger.error("Rejudging cannot be combined with adaptive runs, workers or a coordinator")
+        raise typer.Exit(1)
+    if changed_only and (rejudge is not None or not CONFIG.enable_results_store):
+        logger.error("Running only changed test cases needs the results store and no rejudging")
+        raise typer.Exit(1)
+
+    address: tuple[str, int] | None = None
+    if coordinator:
+        address = _parse_address_option(listen, "--listen")
+
+    selected_shard: Shard | None = None
+    if shard is not None:
+        try:
+            selected_shard = Shard.parse(shard)
+        except ValueError as e:
+            raise typer.BadParameter(str(e), param_hint="--shard") from e
+
+    shard_durations: dict[int, float] | None = None
+    if selected_shard is not None and shard_strategy == ShardStrategy.DURATION:
+        shard_durations = _read_shard_durations(durations_file)
+
+    test_cases: list[TestCase[Any]] = list(
+        _get_filtered_test_cases(test_tags, pc, selected_shard, shard_durations)
+    )
+    recorded_outputs: dict[RunCaseKey, Any] | None = None
+    total_runs: int = runs * len(test_cases)
+    if rejudge is not None:
+        recorded_outputs = _load_recorded_outputs(rejudge, pc, test_cases)
+        # The runs of the rejudged run are judged again, each with its own outputs
+        runs = max(run_index for run_index, _ in recorded_outputs) + 1
+        total_runs = len(recorded_outputs)
+
+    journal: RunJournal = _open_journal(resume)
+    completed: dict[RunCaseKey, CompletedCase[Any]] = {}
+    if resume is not None:
+        completed = _load_completed_cases(journal, pc, test_cases, runs)
+
+    test_case_hashes: dict[int, str] = {}
+    carried: list[CompletedCase[Any]] = []
+    if changed_only:
+        test_case_hashes = await hash_test_cases(test_cases, pc.plugin_service)
+        unchanged: dict[RunCaseKey, CompletedCase[Any]] = _load_unchanged_cases(
+            pc, test_case_hashes, runs
+        )
+        carried = [case for key, case in unchanged.items() if key not in completed]
+        completed = unchanged | completed
+
+    duration_history: dict[int, dict[str, float]] = load_mean_durations(plugin=_get_plugin_name(pc))
+    logger.info("Run ID: %s", journal.run_id)
+    results_store: ResultsStore | None = None
+    if CONFIG.enable_results_store:
+        results_store = await ResultsStore.open(journal.run_id)
+    if results_store is not None:
+        await results_store.start_run(
+            _get_plugin_name(pc),
+            test_tags,
+            runs,
+            test_cases,
+        )
+    # Carried rows are recorded again so that this run holds every row of its test cases
+    test_cases_by_id: dict[int, TestCase[Any]] = {tc.id: tc for tc in test_cases}
+    for case in carried:
+        await journal.record_row(case.run_index, case.row, case.durations)
+        if results_store is not None:
+            await results_store.record_row(
+                case.run_index, test_cases_by_id[case.row.identifier], case.row, case.durations
+            )
 
-    test_cases: list[TestCase[Any]] = list(_get_filtered_test_cases(test_tags, pc))
     progress: Progress = Progress(
         SpinnerColumn(),
         TextColumn(text_format="[progress.description]{task.description}"),
         BarColumn(),
         SmartProgressColumn(),
+        LlmWindowColumn(),
         TimeElapsedColumn(),
         disable=quiet,
         transient=True,
     )
+    scheduler: StageScheduler = StageScheduler.from_config(CONFIG)
+    prompt_cache: PromptCache = PromptCache(pc.plugin_service)
+    # Workers run, cache and judge their own test cases
+    run_locally: bool = CONFIG.workers == 1 and address is None
+    feature_cache: FeatureOutputCache[Any] | None = None
+    if run_locally:
+        feature_cache = get_feature_cache(pc.plugin_service)
+
+    shared_outputs: SharedFeatureOutputs | None = None
+    if CONFIG.repeat == RepeatMode.JUDGE:
+        shared_outputs = SharedFeatureOutputs()
+
+    batch_judge: BatchJudge | None = None
+    if CONFIG.judge_mode == JudgeMode.BATCH and run_locally:
+        batch_judge = BatchJudge(
+            pc.plugin_service,
+            prompt_cache,
+            expected_evaluations=total_runs - len(completed),
+            max_batch_size=CONFIG.judge_batch_size,
+        )
+
     testing_services: list[TestingService] = []
     try:
         with progress:
             task_id: TaskID = progress.add_task(
-                description="[bold green]Total Progress[/bold green]",
-                total=runs_count * len(test_cases),
+                description=TOTAL_PROGRESS_DESCRIPTION,
+                total=total_runs,
+                completed=len(completed),
             )
             cli_service: CliService[Progress, TaskID] = pc.plugin_service.get_cli_service(
                 progress=progress,
                 task_id=task_id,
             )
             async with asyncio.TaskGroup() as tg:
-                for _ in range(runs_count):
-                    es = TestingService(test_cases, pc.plugin_service, cli_service)
+                for run_index in range(runs):
+                    es = TestingService(
+                        [
+                            tc
+                            for tc in test_cases
+                            if (run_index, tc.id) not in completed
+                            and (recorded_outputs is None or (run_index, tc.id) in recorded_outputs)
+                        ],
+                        pc.plugin_service,
+                        cli_service,
+                        scheduler=scheduler,
+                        prompt_cache=prompt_cache,
+                        batch_judge=batch_judge,
+                        run_index=run_index,
+                        journal=journal,
+                        results_store=results_store,
+                        duration_history=duration_history,
+                        shared_outputs=shared_outputs,
+                        adaptive_runs=adaptive_runs,
+                        recorded_outputs=_get_run_outputs(recorded_outputs, run_index),
+                        feature_cache=feature_cache,
+                    )
+                    _restore_completed_cases(es, completed)
                     testing_services.append(es)
-                    tg.create_task(es.run_tests())
+                    if run_locally:
+                        tg.create_task(es.run_tests())
+
+                if address is not None:
+                    tg.create_task(_run_coordinator(testing_services, context.args, address))
+                elif CONFIG.workers > 1:
+                    tg.create_task(_run_in_workers(testing_services, context.args))
     finally:
         console = Console()
         if not quiet and testing_services:
             console.print()
             console.rule("[bold]Results[/bold]")
 
+        if batch_judge is not None:
+            await batch_judge.aclose()
+
         await asyncio.gather(
             *(es.publish_results(run_index=i) for i, es in enumerate(testing_services))
         )
+        await CLIENT_POOL.aclose()
+        close_llm_cache()
+        close_feature_cache()
+        if results_store is not None:
+            if changed_only:
+                await results_store.record_test_case_hashes(
+                    _get_plugin_name(pc), _get_green_hashes(testing_services, test_case_hashes)
+                )
+            await results_store.finish_run()
+            await results_store.aclose()
 
         if not quiet and testing_services:
             console.rule("[bold]Summary[/bold]")
@@ -162,6 +530,225 @@ async def vtest_feature(  # noqa: PLR0913
                 all_durations.append(es.durations)
             ReportSummary(all_runs_rows, all_failed_tests, all_durations).display()
 
+        skipped_runs: int = adaptive_runs.skipped if adaptive_runs is not None else 0
+        if sum(len(es.csv_rows) for es in testing_services) < total_runs - skipped_runs:
+            logger.info(
+                "Some test cases did not finish. To run only them, use: %s test --resume %s",
+                PROJECT_NAME,
+                journal.run_id,
+            )
+
+
+@app.command(name="worker", help="Run the test cases served by a coordinator.")
+@utils.syncify
+async def vtest_worker(
+    connect: Annotated[
+        str,
+        typer.Option(metavar="HOST:PORT", help="The address of the coordinator"),
+    ],
+    capacity: Annotated[
+        int | None,
+        typer.Option(
+            min=1,
+            help="The maximum number of test cases run at the same time "
+            "(default: the feature concurrency)",
+        ),
+    ] = None,
+    *,
+    verbose: Annotated[bool, typer.Option("--verbose", "-v", help="Use verbose output")] = False,
+    quiet: Annotated[bool, typer.Option("--quiet", "-q", help="Do not print any output")] = False,
+) -> None:
+    _handle_logging(quiet=quiet, verbose=verbose)
+    host, port = _parse_address_option(connect, "--connect")
+    try:
+        await run_remote_worker(host, port, capacity=capacity)
+    except exceptions.ApiKeyNotFoundError as e:
+        logger.exception("API key not found")
+        raise typer.Exit(1) from e
+    except (OSError, exceptions.WorkerError) as e:
+        logger.error("Failed to run the test cases of the coordinator at %s: %s", connect, e)  # noqa: TRY400
+        raise typer.Exit(1) from e
+
+
+async def _run_in_workers(testing_services: list[TestingService], extra_args: list[str]) -> None:
+    pool: WorkerPool = WorkerPool(testing_services, workers=CONFIG.workers, extra_args=extra_args)
+    async with contextlib.AsyncExitStack() as stack:
+        for es in testing_services:
+            await stack.enter_async_context(es.streaming())
+
+        await pool.run()
+
+
+async def _run_coordinator(
+    testing_services: list[TestingService], extra_args: list[str], address: tuple[str, int]
+) -> None:
+    host, port = address
+    coordinator = Coordinator(testing_services, host=host, port=port, extra_args=extra_args)
+    async with contextlib.AsyncExitStack() as stack:
+        for es in testing_services:
+            await stack.enter_async_context(es.streaming())
+
+        await coordinator.run()
+
+
+def _parse_address_option(address: str, option: str) -> tuple[str, int]:
+    try:
+        return parse_address(address)
+    except ValueError as e:
+        raise typer.BadParameter(str(e), param_hint=option) from e
+
+
+def _ensure_pyarrow() -> None:
+    try:
+        import_pyarrow()
+    except ImportError as e:
+        logger.error("Cannot write a columnar report: %s", e)  # noqa: TRY400
+        raise typer.Exit(1) from e
+
+
+def _open_journal(run_id: str | None) -> RunJournal:
+    if run_id is None:
+        return RunJournal.create()
+
+    try:
+        return RunJournal.open(run_id)
+    except FileNotFoundError as e:
+        logger.error("Cannot resume the run: %s", e)  # noqa: TRY400
+        raise typer.Exit(1) from e
+
+
+def _load_recorded_outputs(
+    run_id: str, pc: PluginCreation, test_cases: list[TestCase[Any]]
+) -> dict[RunCaseKey, Any]:
+    output_class: type[TestCaseOutput] | None = pc.plugin_service.get_output_class()
+    if output_class is None:
+        logger.error("Cannot rejudge the run: the plugin does not implement get_output_class")
+        raise typer.Exit(1)
+
+    try:
+        recorded: dict[RunCaseKey, Any] = RunJournal.open(run_id).load_outputs(output_class)
+    except FileNotFoundError as e:
+        logger.error("Cannot rejudge the run: %s", e)  # noqa: TRY400
+        raise typer.Exit(1) from e
+
+    test_case_ids: set[int] = {tc.id for tc in test_cases}
+    outputs: dict[RunCaseKey, Any] = {
+        key: output for key, output in recorded.items() if key[1] in test_case_ids
+    }
+    if not outputs:
+        logger.error("Run %s recorded no feature outputs of the selected test cases", run_id)
+        raise typer.Exit(1)
+
+    logger.info("Rejudging %s recorded feature outputs of run %s", len(outputs), run_id)
+    return outputs
+
+
+def _get_run_outputs(
+    recorded_outputs: dict[RunCaseKey, Any] | None, run_index: int
+) -> dict[int, Any] | None:
+    if recorded_outputs is None:
+        return None
+
+    return {
+        test_case_id: output
+        for (output_run_index, test_case_id), output in recorded_outputs.items()
+        if output_run_index == run_index
+    }
+
+
+def _load_completed_cases(
+    journal: RunJournal,
+    pc: PluginCreation,
+    test_cases: list[TestCase[Any]],
+    runs_count: int,
+) -> dict[RunCaseKey, CompletedCase[Any]]:
+    recorded: dict[RunCaseKey, CompletedCase[Any]] = journal.load(
+        pc.plugin_service.get_csv_row_class()
+    )
+    test_case_ids: set[int] = {tc.id for tc in test_cases}
+    completed: dict[RunCaseKey, CompletedCase[Any]] = {
+        (run_index, test_case_id): case
+        for (run_index, test_case_id), case in recorded.items()
+        if run_index < runs_count and test_case_id in test_case_ids
+    }
+    logger.info(
+        "Resuming run %s: %s of %s test case runs already finished",
+        journal.run_id,
+        len(completed),
+        runs_count * len(test_cases),
+    )
+    return completed
+
+
+def _load_unchanged_cases(
+    pc: PluginCreation, test_case_hashes: dict[int, str], runs_count: int
+) -> dict[RunCaseKey, CompletedCase[Any]]:
+    recorded_hashes: dict[int, tuple[str, str]] = load_test_case_hashes(plugin=_get_plugin_name(pc))
+    unchanged_by_run: dict[str, set[int]] = {}
+    for test_case_id, digest in test_case_hashes.items():
+        recorded: tuple[str, str] | None = recorded_hashes.get(test_case_id)
+        if recorded is not None and recorded[0] == digest:
+            unchanged_by_run.setdefault(recorded[1], set()).add(test_case_id)
+
+    carried: dict[RunCaseKey, CompletedCase[Any]] = {}
+    for run_id, test_case_ids in unchanged_by_run.items():
+        try:
+            journal: RunJournal = RunJournal.open(run_id)
+        except FileNotFoundError as e:
+            logger.warning("Running test cases last passed in run %s again: %s", run_id, e)
+            continue
+
+        recorded_cases: dict[RunCaseKey, CompletedCase[Any]] = journal.load(
+            pc.plugin_service.get_csv_row_class()
+        )
+        carried.update({
+            (run_index, test_case_id): case
+            for (run_index, test_case_id), case in recorded_cases.items()
+            if run_index < runs_count and test_case_id in test_case_ids
+        })
+
+    logger.info(
+        "%s of %s test cases are unchanged since the last run they passed in",
+        len({test_case_id for _, test_case_id in carried}),
+        len(test_case_hashes),
+    )
+    return carried
+
+
+def _get_green_hashes(
+    testing_services: list[TestingService], test_case_hashes: dict[int, str]
+) -> dict[int, str]:
+    passed: set[int] = {row.identifier for es in testing_services for row in es.csv_rows}
+    # A test case is green only if every run of it finished with a green score
+    failed: set[int] = {tc.id for es in testing_services for tc, _ in es.failed_test_cases}
+    failed.update(
+        row.identifier
+        for es in testing_services
+        for row in es.csv_rows
+        if row.get_score_color() != "green"
+    )
+    return {
+        test_case_id: digest
+        for test_case_id, digest in test_case_hashes.items()
+        if test_case_id in passed and test_case_id not in failed
+    }
+
+
+def _restore_completed_cases(
+    es: TestingService, completed: dict[RunCaseKey, CompletedCase[Any]]
+) -> None:
+    for case in completed.values():
+        if case.run_index == es.run_index:
+            es.csv_rows.append(case.row)
+            es.durations[case.row.identifier] = case.durations
+            if es.adaptive_runs is not None:
+                es.adaptive_runs.add_score(case.row.identifier, case.row.final_score)
+                es.adaptive_runs.finish(case.run_index, case.row.identifier)
+
+
+def _get_plugin_name(pc: PluginCreation) -> str:
+    return ",".join(utils.get_plugin_names(pc.registered_plugin_names))
+
 
 def _handle_logging(*, quiet: bool, verbose: bool) -> None:
     if verbose:
@@ -170,8 +757,25 @@ def _handle_logging(*, quiet: bool, verbose: bool) -> None:
         setup_logging(level="ERROR")
 
 
+def _read_shard_durations(path: Path | None) -> dict[int, float]:
+    # Every shard must balance by the same durations, which the local history of each CI runner
+    # is not, or test cases would run in several shards or in none
+    if path is None:
+        logger.error("--shard-strategy duration needs the durations file of --durations")
+        raise typer.Exit(1)
+
+    try:
+        return read_durations_file(path)
+    except (OSError, ValueError) as e:
+        logger.error("Cannot read the test case durations: %s", e)  # noqa: TRY400
+        raise typer.Exit(1) from e
+
+
 def _get_filtered_test_cases[T_Input: TestCaseInput](
-    test_tags: list[str], pc: PluginCreation
+    test_tags: list[str],
+    pc: PluginCreation,
+    shard: Shard | None = None,
+    shard_durations: dict[int, float] | None = None,
 ) -> Iterable[TestCase[T_Input]]:
     logger.debug("Fetching test cases from plugin service")
     test_cases: Iterable[TestCase[T_Input]] = pc.plugin_service.get_test_cases()
@@ -188,4 +792,15 @@ def _get_filtered_test_cases[T_Input: TestCaseInput](
 
         raise typer.Exit(1)
 
-    return test_cases
+    if shard is None:
+        return test_cases
+
+    shard_test_cases: list[TestCase[T_Input]] = select_shard(test_cases, shard, shard_durations)
+    logger.info(
+        "Running %s of %s test cases in shard %s", len(shard_test_cases), len(test_cases), shard
+    )
+    if not shard_test_cases:
+        logger.warning("Shard %s has no test cases to run", shard)
+        raise typer.Exit
+
+    return shard_test_cases
@@ -13,6 +13,7 @@
 # limitations under the License.
 
 import asyncio
+import contextlib
 import logging
 import time
 from typing import TYPE_CHECKING, Any
@@ -21,21 +22,34 @@ from vera.core import exceptions
 from vera.core.configuration import CONFIG
 from vera.core.data_models.csv import CsvColumn, CsvRow
 from vera.core.data_models.test_case.output import TestCaseOutput
+from vera.core.prompt_cache import PromptCache
+from vera.core.serialization import dump_model_state
 from vera.project_name import PROJECT_NAME
 
+from .scheduler import Stage, StageScheduler, estimate_durations
+
 if TYPE_CHECKING:
-    from collections.abc import Coroutine, Iterable
+    from collections.abc import AsyncGenerator, Coroutine, Iterable, Mapping
 
     import anyio
 
     from vera.core.data_models.test_case import TestCase, TestCaseInput
+    from vera.core.feature_cache import FeatureOutputCache
     from vera.core.hook_specs import CliService
     from vera.core.plugin_service import PluginService
+    from vera.core.results_store import ResultsStore
+
+    from .adaptive import AdaptiveRuns
+    from .batch_judge import BatchJudge
+    from .journal import RunRecorder
+    from .repeat import SharedFeatureOutputs
 
 type EvalTask = Coroutine[Any, Any, CsvColumn]
 
 logger: logging.Logger = logging.getLogger(PROJECT_NAME)
 
+COMPLETED_ROWS_QUEUE_SIZE: int = 64
+
 
 class TestingService[
     T_Input: TestCaseInput,
@@ -43,42 +57,147 @@ class TestingService[
     T_Row: CsvRow,
     T_TaskId,
 ]:
-    def __init__(
+    def __init__(  # noqa: PLR0913
         self,
         test_cases: Iterable[TestCase[T_Input]],
         plugin_service: PluginService[T_Input, T_Output, T_Row],
         cli_service: CliService[Any, T_TaskId],
+        *,
+        scheduler: StageScheduler | None = None,
+        prompt_cache: PromptCache | None = None,
+        batch_judge: BatchJudge | None = None,
+        run_index: int = 0,
+        journal: RunRecorder | None = None,
+        results_store: ResultsStore | None = None,
+        stream_rows: bool = True,
+        duration_history: Mapping[int, Mapping[str, float]] | None = None,
+        shared_outputs: SharedFeatureOutputs | None = None,
+        adaptive_runs: AdaptiveRuns | None = None,
+        recorded_outputs: Mapping[int, T_Output] | None = None,
+        feature_cache: FeatureOutputCache[T_Output] | None = None,
     ) -> None:
         self.plugin_service: PluginService[T_Input, T_Output, T_Row] = plugin_service
         self.csv_rows: list[T_Row] = []
-        self.test_cases: Iterable[TestCase[T_Input]] = test_cases
+        cases: list[TestCase[T_Input]] = list(test_cases)
+        self.duration_history: Mapping[int, Mapping[str, float]] = duration_history or {}
+        self.expected_durations: dict[int, float] = self._estimate_durations(cases)
+        # The longest test cases are started first, so they do not set the tail of the run
+        self.test_cases: Iterable[TestCase[T_Input]] = sorted(
+            cases, key=lambda tc: self.expected_durations[tc.id], reverse=True
+        )
         self.cli_service: CliService[Any, T_TaskId] = cli_service
         self.failed_test_cases: list[tuple[TestCase, Exception]] = []
         self.durations: dict[int, dict[str, float]] = {}
+        self.scheduler: StageScheduler = scheduler or StageScheduler.from_config(CONFIG)
+        self.prompt_cache: PromptCache = prompt_cache or PromptCache(plugin_service)
+        self.batch_judge: BatchJudge | None = batch_judge
+        self.run_index: int = run_index
+        self.journal: RunRecorder | None = journal
+        self.results_store: ResultsStore | None = results_store
+        self.stream_rows: bool = stream_rows
+        self.shared_outputs: SharedFeatureOutputs | None = shared_outputs
+        self.adaptive_runs: AdaptiveRuns | None = adaptive_runs
+        self.recorded_outputs: Mapping[int, T_Output] | None = recorded_outputs
+        self.feature_cache: FeatureOutputCache[T_Output] | None = feature_cache
+        self._completed_rows: asyncio.Queue[T_Row] = asyncio.Queue(COMPLETED_ROWS_QUEUE_SIZE)
+
+    def _estimate_durations(self, test_cases: Iterable[TestCase[T_Input]]) -> dict[int, float]:
+        totals: dict[int, float] = {
+            test_case_id: stages["total"]
+            for test_case_id, stages in self.duration_history.items()
+            if "total" in stages
+        }
+        return estimate_durations((tc.id for tc in test_cases), totals)
 
     async def run_tests(self) -> None:
         strict_errors: list[Exception] = []
-        try:
-            async with asyncio.TaskGroup() as tg:
-                for test_case in self.test_cases:
-                    tg.create_task(self._run_task(test_case, strict_errors))
+        async with self.streaming():
+            try:
+                async with asyncio.TaskGroup() as tg:
+                    for test_case in self.test_cases:
+                        tg.create_task(self._run_task(test_case, strict_errors))
 
-        except* Exception:
-            logger.exception("TaskGroup failed during test suite execution")
+            except* Exception:
+                logger.exception("TaskGroup failed during test suite execution")
 
         if strict_errors:
             msg: str = "Strict mode test failures"
             raise ExceptionGroup(msg, strict_errors)
 
+    @contextlib.asynccontextmanager
+    async def streaming(self) -> AsyncGenerator[None]:
+        """Stream the rows added while the context is open to the publishers.
+
+        Rows restored from an earlier run are streamed first, like new ones.
+        """
+        if not self.stream_rows:
+            yield
+            return
+
+        streaming: asyncio.Task[None] = asyncio.create_task(self._stream_rows())
+        try:
+            for row in list(self.csv_rows):
+                await self._completed_rows.put(row)
+
+            yield
+        finally:
+            self._completed_rows.shutdown()
+            await streaming
+
+    async def add_row(
+        self,
+        test_case: TestCase,
+        row: T_Row,
+        durations: dict[str, float],
+        output: dict[str, Any] | None = None,
+    ) -> None:
+        """Record the row of a finished test case and stream it to the publishers.
+
+        The state of the feature output, if given, is recorded in the journal, so that the run
+        can be judged again without running the feature.
+        """
+        self.csv_rows.append(row)
+        self.durations[test_case.id] = durations
+        if self.adaptive_runs is not None:
+            self.adaptive_runs.add_score(test_case.id, row.final_score)
+        if self.journal is not None:
+            await self.journal.record_row(self.run_index, row, durations, output)
+        if self.results_store is not None:
+            await self.results_store.record_row(self.run_index, test_case, row, durations)
+        if self.stream_rows:
+            await self._completed_rows.put(row)
+
+    async def add_failure(self, test_case: TestCase, e: Exception) -> None:
+        """Record the error of a test case that failed."""
+        await self._record_failure(test_case, e)
+        self.failed_test_cases.append((test_case, e))
+
     async def _run_task(self, test_case: TestCase, strict_errors: list[Exception]) -> None:
         try:
-            await self.process_single_case(test_case)
+            if self.adaptive_runs is None or await self.adaptive_runs.should_run(
+                self.run_index, test_case.id
+            ):
+                await self.process_single_case(test_case)
+            else:
+                self._skip_stable_case(test_case)
         except exceptions.TestCaseTestingError as e:
             strict_errors.append(e)
         except Exception as e:
             logger.exception("Unexpected error in test task for test case %s", test_case.id)
             if test_case.config.strict_mode:
                 strict_errors.append(e)
+        finally:
+            if self.adaptive_runs is not None:
+                self.adaptive_runs.finish(self.run_index, test_case.id)
+
+    def _skip_stable_case(self, test_case: TestCase) -> None:
+        logger.debug(
+            "Test case %s: final score is stable, skipping run %s", test_case.id, self.run_index
+        )
+        if self.batch_judge is not None:
+            self.batch_judge.release((id(self), test_case.id))
+
+        self.cli_service.advance_overall()
 
     async def process_single_case(self, test_case: TestCase) -> None:
         task_id: T_TaskId = self.cli_service.add_task(f"[cyan]Test {test_case.id}[/cyan]")
@@ -86,7 +205,7 @@ class TestingService[
         durations: dict[str, float] = {}
         try:
             logger.debug("Test case %s details: %s", test_case.id, test_case.model_dump())
-            async with asyncio.timeout(test_case.config.timeout_seconds):
+            async with asyncio.timeout(test_case.config.timeout_seconds) as deadline:
                 setup_start: float = time.perf_counter()
                 self.cli_service.update_task(
                     task_id,
@@ -95,7 +214,12 @@ class TestingService[
                 )
                 durations["setup"] = time.perf_counter() - setup_start
 
-                output, feature_duration = await self._run_feature_stage(test_case, task_id)
+                if self.recorded_outputs is None:
+                    output, feature_duration = await self._run_feature_stage(
+                        test_case, task_id, deadline
+                    )
+                else:
+                    output, feature_duration = self.recorded_outputs[test_case.id], 0.0
                 durations["feature"] = feature_duration
 
                 testing_start: float = time.perf_counter()
@@ -104,25 +228,32 @@ class TestingService[
                     llm_cols,
                     static_duration,
                     llm_duration,
-                ) = await self._run_testing_stage(test_case, output, task_id)
+                ) = await self._run_testing_stage(test_case, output, task_id, deadline)
                 durations["static_eval"] = static_duration
                 durations["llm_eval"] = llm_duration
                 durations["testing_stage"] = time.perf_counter() - testing_start
 
-                await self._finalize_row_stage(test_case, output, static_cols, llm_cols, task_id)
+                row: T_Row = await self._finalize_row_stage(
+                    test_case, output, static_cols, llm_cols, task_id
+                )
 
             total_duration: float = time.perf_counter() - start_time
             durations["total"] = total_duration
-            self.durations[test_case.id] = durations
+            await self.add_row(test_case, row, durations, dump_model_state(output))
             self._update_task_with_duration(test_case, task_id, total_duration, durations)
 
         except TimeoutError as e:
+            await self._record_failure(test_case, e)
             self._handle_timeout(test_case, task_id, e)
 
         except Exception as e:  # noqa: BLE001
+            await self._record_failure(test_case, e)
             self._handle_error(test_case, task_id, e)
 
         finally:
+            if self.batch_judge is not None:
+                self.batch_judge.release((id(self), test_case.id))
+
             await self._cleanup_task(task_id)
 
     def _update_task_with_duration(
@@ -155,23 +286,62 @@ class TestingService[
         return f"Test {test_case.id}"
 
     async def _run_feature_stage(
-        self, test_case: TestCase, task_id: T_TaskId
+        self, test_case: TestCase, task_id: T_TaskId, deadline: asyncio.Timeout
     ) -> tuple[T_Output, float]:
         self.cli_service.update_task(
             task_id,
-            description=f"Test {test_case.id}: [yellow]Running feature...[/yellow]",
-            completed=15,
+            description=f"Test {test_case.id}: [yellow]Queued...[/yellow]",
+            completed=10,
+        )
+        if self.shared_outputs is None:
+            return await self._run_cached_feature(test_case, task_id, deadline)
+
+        # Waiting for the feature output of another run is like waiting for a slot
+        return await self.shared_outputs.get_or_run(
+            test_case.id,
+            lambda: self._run_cached_feature(test_case, task_id, deadline),
+            lambda: self.scheduler.paused(deadline),
         )
 
-        resources_dir: anyio.Path = self.plugin_service.get_resources_dir()
-        logger.debug("Test case %s: using resources_dir: %s", test_case.id, resources_dir)
+    async def _run_cached_feature(
+        self, test_case: TestCase, task_id: T_TaskId, deadline: asyncio.Timeout
+    ) -> tuple[T_Output, float]:
+        if self.feature_cache is None or not test_case.config.cacheable:
+            return await self._run_feature(test_case, task_id, deadline)
 
-        logger.debug("Test case %s: running feature", test_case.id)
         start_time: float = time.perf_counter()
-        output: T_Output = await self.plugin_service.run_feature(
-            test_case=test_case, resources_dir=resources_dir
-        )
-        duration: float = time.perf_counter() - start_time
+        key: str = await self.feature_cache.key(test_case, self.plugin_service.get_resources_dir())
+        cached: T_Output | None = await self.feature_cache.get(key)
+        if cached is not None:
+            logger.debug("Test case %s: feature output cache hit", test_case.id)
+            return cached, time.perf_counter() - start_time
+
+        output, duration = await self._run_feature(test_case, task_id, deadline)
+        await self.feature_cache.set(key, output)
+        return output, duration
+
+    async def _run_feature(
+        self, test_case: TestCase, task_id: T_TaskId, deadline: asyncio.Timeout
+    ) -> tuple[T_Output, float]:
+        async with self.scheduler.slot(
+            Stage.FEATURE, deadline, self.expected_durations.get(test_case.id, 0.0)
+        ):
+            self.cli_service.update_task(
+                task_id,
+                description=f"Test {test_case.id}: [yellow]Running feature...[/yellow]",
+                completed=15,
+            )
+
+            resources_dir: anyio.Path = self.plugin_service.get_resources_dir()
+            logger.debug("Test case %s: using resources_dir: %s", test_case.id, resources_dir)
+
+            logger.debug("Test case %s: running feature", test_case.id)
+            start_time: float = time.perf_counter()
+            output: T_Output = await self.plugin_service.run_feature(
+                test_case=test_case, resources_dir=resources_dir
+            )
+            duration: float = time.perf_counter() - start_time
+
         logger.debug("Test case %s: feature output: %s", test_case.id, output.model_dump())
         return output, duration
 
@@ -180,6 +350,7 @@ class TestingService[
         test_case: TestCase,
         output: T_Output,
         task_id: T_TaskId,
+        deadline: asyncio.Timeout,
     ) -> tuple[CsvColumn, CsvColumn, float, float]:
         self.cli_service.update_task(
             task_id,
@@ -190,13 +361,17 @@ class TestingService[
         logger.debug("Test case %s: starting evaluation and test tasks", test_case.id)
 
         async def timed_static() -> tuple[CsvColumn, float]:
-            s = time.perf_counter()
-            res = await asyncio.to_thread(
-                self.plugin_service.run_static_tests,
-                test_case=test_case,
-                test_output=output,
-            )
-            duration = time.perf_counter() - s
+            async with self.scheduler.slot(
+                Stage.STATIC, deadline, self.expected_durations.get(test_case.id, 0.0)
+            ):
+                s = time.perf_counter()
+                res = await asyncio.to_thread(
+                    self.plugin_service.run_static_tests,
+                    test_case=test_case,
+                    test_output=output,
+                )
+                duration = time.perf_counter() - s
+
             self.cli_service.update_task(
                 task_id,
                 description=f"Test {test_case.id}: [yellow]LLM Eval...[/yellow]",
@@ -205,19 +380,45 @@ class TestingService[
             return res, duration
 
         async def timed_llm() -> tuple[CsvColumn, float]:
-            s = time.perf_counter()
-            res = await self.plugin_service.llm_evaluation(
-                test_case=test_case,
-                test_output=output,
-                plugin_service=self.plugin_service,
-            )
-            duration = time.perf_counter() - s
+            if self.batch_judge is not None:
+                # Batches may take hours, so the wait does not count towards the timeout
+                async with self.scheduler.paused(deadline):
+                    s = time.perf_counter()
+                    res = await self.batch_judge.evaluate(
+                        (id(self), test_case.id), test_case, output
+                    )
+                    return res, time.perf_counter() - s
+
+            async with self.scheduler.slot(
+                Stage.LLM, deadline, self.expected_durations.get(test_case.id, 0.0)
+            ):
+                s = time.perf_counter()
+                res = await self.plugin_service.llm_evaluation(
+                    test_case=test_case,
+                    test_output=output,
+                    plugin_service=self.plugin_service,
+                    prompt_cache=self.prompt_cache,
+                )
+                duration = time.perf_counter() - s
+
             return res, duration
 
-        (
-            (static_cols, static_duration),
-            (llm_cols, llm_duration),
-        ) = await asyncio.gather(timed_static(), timed_llm())
+        stages: tuple[asyncio.Task[tuple[CsvColumn, float]], ...] = (
+            asyncio.create_task(timed_static()),
+            asyncio.create_task(timed_llm()),
+        )
+        try:
+            (
+                (static_cols, static_duration),
+                (llm_cols, llm_duration),
+            ) = await asyncio.gather(*stages)
+        except BaseException:
+            # gather leaves the other stage running when one fails, so it would still queue
+            # its judge prompt after the test case run is released
+            for stage in stages:
+                stage.cancel()
+            await asyncio.gather(*stages, return_exceptions=True)
+            raise
 
         self.cli_service.update_task(
             task_id,
@@ -235,7 +436,7 @@ class TestingService[
         static_checks_cols: CsvColumn,
         llm_checks_cols: CsvColumn,
         task_id: T_TaskId,
-    ) -> None:
+    ) -> T_Row:
         self.cli_service.update_task(
             task_id,
             description=f"Test {test_case.id}: [yellow]Finalizing...[/yellow]",
@@ -250,7 +451,6 @@ class TestingService[
             static_checks_columns=static_checks_cols,
         )
         logger.debug("Test case %s: row created with score %s", test_case.id, row.final_score)
-        self.csv_rows.append(row)
 
         color: str = row.get_score_color()
         self.cli_service.update_task(
@@ -258,6 +458,13 @@ class TestingService[
             description=f"Test {test_case.id}: [{color}]Score {row.final_score:.2f}[/{color}]",
             completed=100,
         )
+        return row
+
+    async def _record_failure(self, test_case: TestCase, e: Exception) -> None:
+        if self.journal is not None:
+            await self.journal.record_failure(self.run_index, test_case.id, e)
+        if self.results_store is not None:
+            await self.results_store.record_failure(self.run_index, test_case, e)
 
     def _handle_timeout(self, test_case: TestCase, task_id: T_TaskId, e: TimeoutError) -> None:
         self.cli_service.update_task(
@@ -286,6 +493,22 @@ class TestingService[
         self.cli_service.remove_task(task_id)
         self.cli_service.advance_overall()
 
+    async def _stream_rows(self) -> None:
+        while True:
+            try:
+                row: T_Row = await self._completed_rows.get()
+            except asyncio.QueueShutDown:
+                return
+
+            try:
+                await asyncio.gather(
+                    *self.plugin_service.on_row_completed(  # ty: ignore[not-iterable]
+                        row=row, run_index=self.run_index
+                    )
+                )
+            except Exception:
+                logger.exception("Failed to stream the row of test case %s", row.identifier)
+
     async def publish_results(self, run_index: int) -> None:
         logger.debug("Publishing results for %s rows", len(self.csv_rows))
         await asyncio.gather(
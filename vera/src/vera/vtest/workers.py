@@ -0,0 +1,422 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import dataclasses
+import logging
+import multiprocessing
+import queue
+from collections import defaultdict
+from typing import TYPE_CHECKING, Any
+
+from rich.progress import Progress
+
+from vera.core import exceptions, plugin_service
+from vera.core.configuration import CONFIG, VeraConfig
+from vera.core.feature_cache import close_feature_cache, get_feature_cache
+from vera.core.gemini import CLIENT_POOL
+from vera.core.llm_cache import close_llm_cache
+from vera.core.prompt_cache import PromptCache
+from vera.core.serialization import dump_model_state, load_model_state
+from vera.logger import setup_logging
+from vera.project_name import PROJECT_NAME
+
+from .batch_judge import BatchJudge, JudgeMode
+from .repeat import RepeatMode, SharedFeatureOutputs
+from .scheduler import StageScheduler
+from .vtest import TestingService
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Sequence
+    from multiprocessing.process import BaseProcess
+
+    from vera.core.data_models.csv import CsvRow
+    from vera.core.data_models.test_case import TestCase
+    from vera.core.feature_cache import FeatureOutputCache
+    from vera.core.plugin_service import PluginCreation
+
+    from .journal import RunCaseKey
+
+type WorkerEvent = dict[str, Any]
+type EventQueue = multiprocessing.Queue[WorkerEvent]
+
+logger: logging.Logger = logging.getLogger(PROJECT_NAME)
+
+EVENT_POLL_INTERVAL_SEC: float = 1.0
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class WorkerTask:
+    """The test case runs of one worker process, and the settings it runs them with."""
+
+    worker_index: int
+    cases: tuple[RunCaseKey, ...]
+    config: dict[str, Any]
+    extra_args: tuple[str, ...]
+    log_level: str
+
+
+def row_event(
+    run_index: int,
+    row: CsvRow,
+    durations: dict[str, float],
+    output: dict[str, Any] | None = None,
+) -> WorkerEvent:
+    """Builds the event that reports the row of a finished test case run.
+
+    Returns:
+        WorkerEvent: The JSON serializable event.
+
+    """
+    return {
+        "type": "row",
+        "run_index": run_index,
+        "test_case_id": row.identifier,
+        "row": dump_model_state(row),
+        "durations": durations,
+        "output": output,
+    }
+
+
+def failure_event(run_index: int, test_case_id: int, error: Exception) -> WorkerEvent:
+    """Builds the event that reports the error of a failed test case run.
+
+    Returns:
+        WorkerEvent: The JSON serializable event.
+
+    """
+    return {
+        "type": "failure",
+        "run_index": run_index,
+        "test_case_id": test_case_id,
+        "error": f"{type(error).__name__}: {error}",
+    }
+
+
+def apply_config(config: dict[str, Any]) -> None:
+    """Validate settings sent by the parent and apply them to the global configuration.
+
+    Only the given settings are applied, other settings keep their local values.
+    """
+    validated: VeraConfig = VeraConfig.model_validate(config)
+    for name in config:
+        setattr(CONFIG, name, getattr(validated, name))
+
+
+class EventRecorder:
+    """Reports the outcome of each test case run of a worker as an event to the parent."""
+
+    __slots__ = ("_events",)
+
+    def __init__(self, events: EventQueue) -> None:
+        self._events: EventQueue = events
+
+    async def record_row(
+        self,
+        run_index: int,
+        row: CsvRow,
+        durations: dict[str, float],
+        output: dict[str, Any] | None = None,
+    ) -> None:
+        self._events.put(row_event(run_index, row, durations, output))
+
+    async def record_failure(self, run_index: int, test_case_id: int, error: Exception) -> None:
+        self._events.put(failure_event(run_index, test_case_id, error))
+
+
+def run_worker(task: WorkerTask, events: EventQueue) -> None:
+    """Runs the test cases of a worker process, reporting each outcome to the parent.
+
+    The worker loads its own plugins, applies the parent's settings and command line options
+    to them, and runs its test cases on its own event loop. A ``done`` event is always sent
+    last, so the parent can tell test cases that were never reported from ones still running.
+    """
+    setup_logging(level=task.log_level)
+    apply_config(task.config)
+
+    try:
+        asyncio.run(_run_shard(task, EventRecorder(events)))
+    except Exception:
+        logger.exception("Worker %s failed", task.worker_index)
+    finally:
+        events.put({"type": "done", "worker_index": task.worker_index})
+
+
+async def _run_shard(task: WorkerTask, recorder: EventRecorder) -> None:
+    pc: PluginCreation = plugin_service.create_service()
+    pc.plugin_service.handle_test_command_extra_args(extra_args=list(task.extra_args))
+    test_cases: dict[int, TestCase[Any]] = {tc.id: tc for tc in pc.plugin_service.get_test_cases()}
+    cases_by_run: dict[int, list[TestCase[Any]]] = defaultdict(list)
+    for run_index, test_case_id in task.cases:
+        cases_by_run[run_index].append(test_cases[test_case_id])
+
+    progress: Progress = Progress(disable=True)
+    cli_service = pc.plugin_service.get_cli_service(
+        progress=progress, task_id=progress.add_task("")
+    )
+    scheduler: StageScheduler = StageScheduler.from_config(CONFIG)
+    prompt_cache: PromptCache = PromptCache(pc.plugin_service)
+    feature_cache: FeatureOutputCache[Any] | None = get_feature_cache(pc.plugin_service)
+    shared_outputs: SharedFeatureOutputs | None = None
+    if CONFIG.repeat == RepeatMode.JUDGE:
+        shared_outputs = SharedFeatureOutputs()
+
+    batch_judge: BatchJudge | None = None
+    if CONFIG.judge_mode == JudgeMode.BATCH:
+        batch_judge = BatchJudge(
+            pc.plugin_service,
+            prompt_cache,
+            expected_evaluations=len(task.cases),
+            max_batch_size=CONFIG.judge_batch_size,
+        )
+
+    try:
+        async with asyncio.TaskGroup() as tg:
+            for run_index, cases in cases_by_run.items():
+                es = TestingService(
+                    cases,
+                    pc.plugin_service,
+                    cli_service,
+                    scheduler=scheduler,
+                    prompt_cache=prompt_cache,
+                    batch_judge=batch_judge,
+                    run_index=run_index,
+                    journal=recorder,
+                    stream_rows=False,
+                    shared_outputs=shared_outputs,
+                    feature_cache=feature_cache,
+                )
+                tg.create_task(es.run_tests())
+    except* exceptions.TestCaseTestingError:
+        # Strict mode failures were reported as failures, and are raised by the parent
+        pass
+    finally:
+        if batch_judge is not None:
+            await batch_judge.aclose()
+
+        await CLIENT_POOL.aclose()
+        close_llm_cache()
+        close_feature_cache()
+
+
+class OutcomeCollector:
+    """Adds the outcomes of test case runs reported by workers to the testing service of their run.
+
+    Each test case run is counted once: outcomes reported again, such as by a worker whose
+    lease expired while it was still running the test case, are ignored.
+    """
+
+    __slots__ = ("_reported", "_strict_errors", "_test_cases", "services")
+
+    def __init__(self, services: Sequence[TestingService]) -> None:
+        self.services: dict[int, TestingService] = {es.run_index: es for es in services}
+        self._test_cases: dict[RunCaseKey, TestCase] = {
+            (es.run_index, test_case.id): test_case
+            for es in services
+            for test_case in es.test_cases
+        }
+        self._reported: set[RunCaseKey] = set()
+        self._strict_errors: list[Exception] = []
+
+    @property
+    def finished(self) -> bool:
+        """Whether the outcome of every test case run was reported."""
+        return len(self._reported) == len(self._test_cases)
+
+    async def add_outcome(self, event: WorkerEvent) -> bool:
+        """Add a ``row`` or ``failure`` event to the testing service of its run.
+
+        Returns:
+            bool: True if the outcome was added, False if the test case run is unknown or its
+                outcome was already reported.
+
+        """
+        key: RunCaseKey = (event["run_index"], event["test_case_id"])
+        if key not in self._test_cases or key in self._reported:
+            logger.debug("Ignoring outcome of test case run %s", key)
+            return False
+
+        es: TestingService = self.services[key[0]]
+        test_case: TestCase = self._test_cases[key]
+        if event["type"] == "row":
+            row: CsvRow = load_model_state(es.plugin_service.get_csv_row_class(), event["row"])
+            self._reported.add(key)
+            await es.add_row(test_case, row, event["durations"], event.get("output"))
+            es.cli_service.advance_overall()
+        else:
+            await self.add_failure(key, exceptions.WorkerError(event["error"]))
+
+        return True
+
+    async def add_failure(self, key: RunCaseKey, error: exceptions.WorkerError) -> None:
+        """Record a test case run as failed, and as a strict mode failure if its test case is."""
+        es: TestingService = self.services[key[0]]
+        test_case: TestCase = self._test_cases[key]
+        self._reported.add(key)
+        await es.add_failure(test_case, error)
+        es.cli_service.advance_overall()
+        if test_case.config.strict_mode:
+            msg: str = f"Failed to run test case {test_case.id}."
+            strict_error = exceptions.TestCaseTestingError(msg)
+            strict_error.__cause__ = error
+            self._strict_errors.append(strict_error)
+
+    def raise_strict_errors(self) -> None:
+        """Raise the strict mode failures, if any.
+
+        Raises:
+            ExceptionGroup: If test cases in strict mode failed.
+
+        """
+        if self._strict_errors:
+            msg: str = "Strict mode test failures"
+            raise ExceptionGroup(msg, self._strict_errors)
+
+
+class WorkerPool(OutcomeCollector):
+    """Runs the test cases of a suite's runs in worker processes.
+
+    The pending test case runs of the given testing services are dealt to the workers in
+    turn. Rows and failures reported by the workers are added to the testing service of their
+    run, which journals them and streams them to the publishers as in a single process run.
+    LLM concurrency is split between the workers, since they share the same quota. Test
+    cases of a worker that exits without reporting them are recorded as failed.
+
+    Workers are spawned rather than forked by default, so they do not inherit the parent's
+    threads, event loop or open clients.
+    """
+
+    __slots__ = ("_assigned", "_target", "extra_args", "start_method", "workers")
+
+    def __init__(
+        self,
+        services: Sequence[TestingService],
+        *,
+        workers: int,
+        extra_args: Iterable[str] = (),
+        target: Callable[[WorkerTask, EventQueue], None] = run_worker,
+        start_method: str = "spawn",
+    ) -> None:
+        super().__init__(services)
+        self.workers: int = workers
+        self.extra_args: tuple[str, ...] = tuple(extra_args)
+        self.start_method: str = start_method
+        self._target: Callable[[WorkerTask, EventQueue], None] = target
+        self._assigned: dict[int, list[RunCaseKey]] = defaultdict(list)
+
+    async def run(self) -> None:
+        """Run all test cases in the worker processes and wait for them to finish.
+
+        Strict mode failures are raised as an ``ExceptionGroup`` once the workers are done.
+        """
+        tasks: list[WorkerTask] = self._create_tasks()
+        context = multiprocessing.get_context(self.start_method)
+        events: EventQueue = context.Queue()
+        processes: dict[int, BaseProcess] = {
+            task.worker_index: context.Process(
+                target=self._target,
+                args=(task, events),
+                name=f"{PROJECT_NAME}-worker-{task.worker_index}",
+            )
+            for task in tasks
+        }
+        logger.info("Running %s test cases in %s workers", len(self._test_cases), len(tasks))
+        for process in processes.values():
+            process.start()
+
+        try:
+            await self._handle_events(events, processes)
+        finally:
+            for process in processes.values():
+                if process.is_alive():
+                    process.terminate()
+
+                await asyncio.to_thread(process.join)
+
+            events.close()
+
+        self.raise_strict_errors()
+
+    def _create_tasks(self) -> list[WorkerTask]:
+        keys: list[RunCaseKey] = list(self._test_cases)
+        # All runs of a test case go to the same worker, so that they can share its feature output
+        positions: dict[int, int] = {}
+        for _, test_case_id in keys:
+            positions.setdefault(test_case_id, len(positions))
+
+        worker_count: int = max(1, min(self.workers, len(positions)))
+        for key in keys:
+            self._assigned[positions[key[1]] % worker_count].append(key)
+
+        config: dict[str, Any] = CONFIG.model_dump(mode="json")
+        config["llm_concurrency"] = max(1, CONFIG.llm_concurrency // worker_count)
+        log_level: str = logging.getLevelName(logger.getEffectiveLevel())
+        return [
+            WorkerTask(
+                worker_index=worker_index,
+                cases=tuple(keys),
+                config=config,
+                extra_args=self.extra_args,
+                log_level=log_level,
+            )
+            for worker_index, keys in self._assigned.items()
+        ]
+
+    async def _handle_events(self, events: EventQueue, processes: dict[int, BaseProcess]) -> None:
+        running: set[int] = set(processes)
+        while running:
+            event: WorkerEvent | None = await asyncio.to_thread(_get_event, events)
+            if event is not None:
+                await self._handle_event(event, running)
+                continue
+
+            exited: list[int] = [index for index in running if not processes[index].is_alive()]
+            if not exited:
+                continue
+
+            # Events sent right before a worker exited may still be queued
+            while (event := _get_event(events, timeout=0)) is not None:
+                await self._handle_event(event, running)
+
+            for index in exited:
+                if index in running:
+                    reason: str = f"Worker {index} exited with code {processes[index].exitcode}"
+                    await self._finish_worker(index, reason, running)
+
+    async def _handle_event(self, event: WorkerEvent, running: set[int]) -> None:
+        match event["type"]:
+            case "row" | "failure":
+                await self.add_outcome(event)
+            case "done":
+                index: int = event["worker_index"]
+                reason: str = f"Worker {index} finished without reporting it"
+                await self._finish_worker(index, reason, running)
+            case _:
+                logger.warning("Ignoring unknown worker event: %s", event)
+
+    async def _finish_worker(self, index: int, reason: str, running: set[int]) -> None:
+        running.discard(index)
+        for key in self._assigned[index]:
+            if key in self._reported:
+                continue
+
+            logger.error("Test case %s was not run: %s", key[1], reason)
+            await self.add_failure(key, exceptions.WorkerError(reason))
+
+
+def _get_event(events: EventQueue, timeout: float = EVENT_POLL_INTERVAL_SEC) -> WorkerEvent | None:
+    try:
+        return events.get(timeout=timeout) if timeout else events.get_nowait()
+    except queue.Empty:
+        return None
@@ -0,0 +1,100 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import json
+import time
+from typing import TYPE_CHECKING
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from anyio import Path as AsyncPath
+from google.genai.errors import ClientError, ServerError
+from google.genai.types import BatchJob
+
+from vera.core.batch_jobs import MAX_JOB_AGE_SEC, BatchJobPoller, BatchJobStore
+from vera.project_name import PROJECT_NAME
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+pytestmark = pytest.mark.anyio
+
+
+async def test_store_keeps_found_jobs_resumable_after_removal(tmp_path: Path) -> None:
+    path: Path = tmp_path / "batch_jobs.json"
+    await BatchJobStore(path).add("job", ["a", "b"])
+
+    store = BatchJobStore(path)
+    assert await store.find(["b", "c"]) == {"job": ["a", "b"]}
+    assert await store.find(["c"]) == {}
+
+    await store.remove("job")
+    assert json.loads(await AsyncPath(path).read_text(encoding="utf-8")) == {}
+    assert await store.find(["a"]) == {"job": ["a", "b"]}
+
+
+async def test_store_ignores_old_and_unreadable_jobs(tmp_path: Path) -> None:
+    path: Path = tmp_path / "batch_jobs.json"
+    stale: float = time.time() - MAX_JOB_AGE_SEC - 1
+    await AsyncPath(path).write_text(
+        json.dumps({
+            "old": {"fingerprints": ["a"], "created_at": stale},
+            "broken": {"created_at": time.time()},
+            "new": {"fingerprints": ["a"], "created_at": time.time()},
+        }),
+        encoding="utf-8",
+    )
+    assert await BatchJobStore(path).find(["a"]) == {"new": ["a"]}
+
+    await AsyncPath(path).write_text("not json", encoding="utf-8")
+    assert await BatchJobStore(path).find(["a"]) == {}
+
+
+async def test_poller_polls_outstanding_jobs_together() -> None:
+    states: dict[str, list[str | Exception]] = {
+        "first": ["JOB_STATE_PENDING", "JOB_STATE_RUNNING", "JOB_STATE_SUCCEEDED"],
+        "second": [
+            ServerError(503, {}),
+            ClientError(429, {}),
+            "JOB_STATE_RUNNING",
+            "JOB_STATE_FAILED",
+        ],
+        "gone": [ClientError(404, {})],
+    }
+
+    def get(name: str) -> BatchJob:
+        state: str | Exception = states[name].pop(0)
+        if isinstance(state, Exception):
+            raise state
+
+        return BatchJob(name=name, state=state)
+
+    batches = MagicMock(get=AsyncMock(side_effect=get))
+    poller = BatchJobPoller(batches)
+    with patch(f"{PROJECT_NAME}.core.batch_jobs.INITIAL_POLL_DELAY_SEC", 0):
+        first, second, gone = await asyncio.gather(
+            poller.wait("first"),
+            poller.wait("second"),
+            poller.wait("gone"),
+            return_exceptions=True,
+        )
+
+    assert isinstance(first, BatchJob)
+    assert first.state == "JOB_STATE_SUCCEEDED"
+    assert isinstance(second, BatchJob)
+    assert second.state == "JOB_STATE_FAILED"
+    assert isinstance(gone, ClientError)
+    assert batches.get.await_count == 8
+    await poller.aclose()
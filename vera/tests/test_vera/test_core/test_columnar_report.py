@@ -0,0 +1,107 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from typing import TYPE_CHECKING, Annotated, Any, Self, override
+
+import pytest
+from pydantic import BaseModel, ConfigDict, Field, PlainSerializer
+
+from vera.core.columnar_report import ColumnarFormat, ColumnarReportWriter, get_column_types
+from vera.core.data_models.csv import CsvRow, ScoreRange
+
+if TYPE_CHECKING:
+    import pathlib
+
+
+class Reasoning(BaseModel):
+    summary: str
+    steps: list[str]
+
+
+class TypedRow(CsvRow):
+    model_config = ConfigDict(populate_by_name=True)
+    passed: Annotated[bool, Field(alias="Passed")]
+    attempts: Annotated[int | None, Field(alias="Attempts")] = None
+    reasoning: Annotated[Reasoning, Field(alias="Reasoning")]
+    verdict: Annotated[
+        Reasoning, PlainSerializer(lambda r: r.summary, return_type=str), Field(alias="Verdict")
+    ]
+
+    @override
+    def calculate_final_score(self) -> float:
+        return self.final_score
+
+    @property
+    @override
+    def score_range(self) -> ScoreRange:
+        return ScoreRange(min=0, max=1)
+
+    @classmethod
+    @override
+    def from_columns(cls, **kwargs: Any) -> Self:  # ty:ignore[invalid-method-override]
+        return cls(**kwargs)
+
+
+def _row(identifier: int, *, passed: bool, attempts: int | None) -> TypedRow:
+    reasoning = Reasoning(summary=f"summary {identifier}", steps=["a", "b"])
+    return TypedRow(
+        identifier=identifier,
+        final_score=1 if passed else 0.5,
+        passed=passed,
+        attempts=attempts,
+        reasoning=reasoning,
+        verdict=reasoning,
+    )
+
+
+def test_column_types_follow_the_serialized_row_schema() -> None:
+    assert get_column_types(TypedRow) == {
+        "Test Case ID": "integer",
+        "Final Score": "number",
+        "Passed": "boolean",
+        "Attempts": "integer",
+        "Reasoning": "json",
+        "Verdict": "string",
+    }
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize("columnar_format", list(ColumnarFormat))
+async def test_rows_are_written_with_typed_columns_in_row_groups(
+    tmp_path: pathlib.Path, columnar_format: ColumnarFormat
+) -> None:
+    pa = pytest.importorskip("pyarrow")
+    path = tmp_path / f"report.{columnar_format}"
+    writer = ColumnarReportWriter(path, columnar_format, flush_rows=2, flush_interval=60)
+    for identifier in range(3):
+        await writer.write(_row(identifier, passed=identifier != 1, attempts=identifier or None))
+
+    await writer.aclose()
+
+    if columnar_format == ColumnarFormat.PARQUET:
+        parquet = pytest.importorskip("pyarrow.parquet")
+        assert parquet.ParquetFile(path).metadata.num_row_groups == 2
+        table = parquet.read_table(path)
+    else:
+        with pa.ipc.open_stream(path) as reader:
+            table = reader.read_all()
+
+    assert table.schema.field("Passed").type == pa.bool_()
+    assert table.schema.field("Attempts").type == pa.int64()
+    assert table.schema.field("Final Score").type == pa.float64()
+    assert table.column("Attempts").to_pylist() == [None, 1, 2]
+    assert table.column("Verdict").to_pylist()[0] == "summary 0"
+    assert table.column("Reasoning").to_pylist()[0] == (
+        '{"summary": "summary 0", "steps": ["a", "b"]}'
+    )
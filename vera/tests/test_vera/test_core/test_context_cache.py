@@ -0,0 +1,138 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import itertools
+from typing import TYPE_CHECKING
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from google.genai.errors import ClientError
+from google.genai.types import CachedContent, CreateCachedContentConfig, UpdateCachedContentConfig
+
+from vera.core.context_cache import MIN_CACHED_TOKENS, ContextCacheRegistry
+from vera.core.gemini import Gemini, GeminiConfig
+from vera.project_name import PROJECT_NAME
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+SPECS: str = "spec " * MIN_CACHED_TOKENS
+
+
+class FakeCaches:
+    """An in-memory stand-in for the Gemini caching endpoints."""
+
+    def __init__(self) -> None:
+        self.contents: dict[str, CreateCachedContentConfig] = {}
+        self.ttls: dict[str, str | None] = {}
+        self._names: Iterator[str] = (f"cachedContents/{i}" for i in itertools.count())
+
+    async def create(self, *, model: str, config: CreateCachedContentConfig) -> CachedContent:
+        name: str = next(self._names)
+        self.contents[name] = config
+        self.ttls[name] = config.ttl
+        return CachedContent(name=name, model=model)
+
+    async def update(self, *, name: str, config: UpdateCachedContentConfig) -> CachedContent:
+        self.ttls[name] = config.ttl
+        return CachedContent(name=name)
+
+    async def delete(self, *, name: str) -> None:
+        del self.contents[name]
+
+
+@pytest.fixture
+def fake_caches() -> FakeCaches:
+    return FakeCaches()
+
+
+@pytest.fixture
+def clock() -> Iterator[MagicMock]:
+    with patch(f"{PROJECT_NAME}.core.context_cache.time.monotonic", return_value=0.0) as clock:
+        yield clock
+
+
+async def _get(registry: ContextCacheRegistry, system_instruction: str = SPECS) -> str | None:
+    return await registry.get(
+        model="model", system_instruction=system_instruction, tools=[], ttl_seconds=600
+    )
+
+
+@pytest.mark.anyio
+async def test_same_system_instruction_shares_one_cache(fake_caches: FakeCaches) -> None:
+    registry = ContextCacheRegistry(fake_caches)  # ty:ignore[invalid-argument-type]
+    name = await _get(registry)
+
+    assert name is not None
+    assert await _get(registry) == name
+    assert await _get(registry, SPECS + "changed") != name
+    assert len(fake_caches.contents) == 2
+    assert fake_caches.contents[name].system_instruction == SPECS
+
+    await registry.aclose()
+    assert not fake_caches.contents
+
+
+@pytest.mark.anyio
+async def test_small_system_instruction_is_not_cached(fake_caches: FakeCaches) -> None:
+    registry = ContextCacheRegistry(fake_caches)  # ty:ignore[invalid-argument-type]
+    assert await _get(registry, "short") is None
+    assert not fake_caches.contents
+
+
+@pytest.mark.anyio
+async def test_ttl_is_refreshed_and_expired_cache_is_recreated(
+    fake_caches: FakeCaches, clock: MagicMock
+) -> None:
+    registry = ContextCacheRegistry(fake_caches)  # ty:ignore[invalid-argument-type]
+    fake_caches.update = AsyncMock(wraps=fake_caches.update)
+    name = await _get(registry)
+
+    clock.return_value = 200.0
+    assert await _get(registry) == name
+    fake_caches.update.assert_not_awaited()
+
+    clock.return_value = 400.0
+    assert await _get(registry) == name
+    fake_caches.update.assert_awaited_once()
+
+    clock.return_value = 2000.0
+    assert await _get(registry) != name
+
+
+@pytest.mark.anyio
+async def test_rejected_content_is_sent_inline(fake_caches: FakeCaches) -> None:
+    registry = ContextCacheRegistry(fake_caches)  # ty:ignore[invalid-argument-type]
+    fake_caches.create = AsyncMock(side_effect=ClientError(400, {"error": {"message": "small"}}))
+
+    assert await _get(registry) is None
+    assert await _get(registry) is None
+    fake_caches.create.assert_awaited_once()
+
+
+@pytest.mark.anyio
+async def test_gemini_references_cached_system_prompt(fake_caches: FakeCaches) -> None:
+    client = MagicMock(caches=fake_caches, aclose=AsyncMock())
+    client.models.generate_content = AsyncMock(return_value=MagicMock(text="ok"))
+    async with Gemini(GeminiConfig(), client=client) as gemini:
+        gemini.set_system_prompt_to_session(SPECS)
+        await gemini.send_bulk_messages(["prompt"])
+
+        config = client.models.generate_content.await_args.kwargs["config"]
+        assert config.cached_content in fake_caches.contents
+        assert config.system_instruction is None
+        assert config.tools is None
+        assert fake_caches.contents[config.cached_content].tools
+
+    assert not fake_caches.contents
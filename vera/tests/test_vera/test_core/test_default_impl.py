@@ -32,7 +32,7 @@ async def test_publish_results_respects_config() -> None:
             f"{PROJECT_NAME}.core.default_impl.write_to_file", new_callable=AsyncMock
         ) as mock_write,
     ):
-        await default_impl.publish_results([])
+        await default_impl.publish_results([], run_index=0)
         mock_write.assert_not_called()
 
 
@@ -47,5 +47,5 @@ async def test_publish_results_enabled_by_default() -> None:
             f"{PROJECT_NAME}.core.default_impl.write_to_file", new_callable=AsyncMock
         ) as mock_write,
     ):
-        await default_impl.publish_results([])
+        await default_impl.publish_results([], run_index=0)
         mock_write.assert_called_once()
@@ -0,0 +1,63 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import random
+import time
+from pathlib import Path  # noqa: TC003
+from unittest.mock import patch
+
+import pytest
+
+from vera.core.disk_cache import DiskCache
+
+
+@pytest.mark.anyio
+async def test_round_trip_survives_reopening(tmp_path: Path) -> None:
+    cache = DiskCache(tmp_path / "cache.sqlite", max_size_bytes=1024)
+    assert await cache.get("key") is None
+
+    await cache.set("key", b"value")
+    cache.close()
+
+    reopened = DiskCache(tmp_path / "cache.sqlite", max_size_bytes=1024)
+    assert await reopened.get("key") == b"value"
+    reopened.close()
+
+
+@pytest.mark.anyio
+async def test_evicts_least_recently_used(tmp_path: Path) -> None:
+    value: bytes = random.Random(0).randbytes(1000)
+    cache = DiskCache(tmp_path / "cache.sqlite", max_size_bytes=2500)
+    await cache.set("first", value)
+    await cache.set("second", value)
+    assert await cache.get("first") == value
+
+    await cache.set("third", value)
+
+    assert await cache.get("second") is None
+    assert await cache.get("first") == value
+    assert await cache.get("third") == value
+    cache.close()
+
+
+@pytest.mark.anyio
+async def test_expired_entries_are_missing(tmp_path: Path) -> None:
+    cache = DiskCache(tmp_path / "cache.sqlite", max_size_bytes=1024, ttl_seconds=60)
+    await cache.set("key", b"value")
+
+    with patch("vera.core.disk_cache.time.time", return_value=time.time() + 120):
+        assert await cache.get("key") is None
+
+    assert await cache.get("key") is None
+    cache.close()
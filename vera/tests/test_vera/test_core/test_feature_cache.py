@@ -0,0 +1,124 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from pathlib import Path  # noqa: TC003
+from typing import Self, override
+from unittest.mock import AsyncMock, MagicMock
+
+import anyio
+import pytest
+
+from vera.core.data_models.csv import CsvColumn, CsvRow, ScoreRange
+from vera.core.data_models.test_case import TestCase
+from vera.core.data_models.test_case.input import TestCaseInput
+from vera.core.data_models.test_case.output import TestCaseOutput
+from vera.core.disk_cache import DiskCache
+from vera.core.feature_cache import FeatureOutputCache
+from vera.vtest.vtest import TestingService
+
+
+class QuestionInput(TestCaseInput):
+    question: str = "q"
+
+    @override
+    def to_description_prompt(self) -> str:
+        return self.question
+
+
+class AnswerOutput(TestCaseOutput):
+    answer: str
+
+    @override
+    def to_output_description_prompt(self) -> str:
+        return self.answer
+
+
+class AnswerRow(CsvRow):
+    @override
+    def calculate_final_score(self) -> float:
+        return 1.0
+
+    @property
+    @override
+    def score_range(self) -> ScoreRange:
+        return ScoreRange(min=0, max=1)
+
+    @classmethod
+    @override
+    def from_columns(
+        cls,
+        test_case: TestCase,
+        test_output: TestCaseOutput,
+        llm_checks_columns: CsvColumn,
+        static_checks_columns: CsvColumn,
+    ) -> Self:
+        return cls.model_validate({"Test Case ID": test_case.id, "Final Score": 1.0})
+
+
+def _cache(path: Path, version: str = "1") -> FeatureOutputCache[AnswerOutput]:
+    store = DiskCache(path / "feature.sqlite", max_size_bytes=1 << 20)
+    return FeatureOutputCache(store, AnswerOutput, version)
+
+
+def _test_case(
+    test_case_id: int = 1, file_name: str | None = None, question: str = "q"
+) -> TestCase[QuestionInput]:
+    test_input = QuestionInput(file_name=file_name, question=question)
+    return TestCase(id=test_case_id, name="N", description="D", input=test_input)  # ty:ignore[missing-argument]
+
+
+@pytest.mark.anyio
+async def test_key_covers_version_input_and_resource(tmp_path: Path) -> None:
+    resources_dir = anyio.Path(tmp_path)
+    await (resources_dir / "context.md").write_text("context")
+    test_case = _test_case(file_name="context.md")
+    key = await _cache(tmp_path).key(test_case, resources_dir)
+
+    assert await _cache(tmp_path).key(test_case, resources_dir) == key
+    assert await _cache(tmp_path).key(_test_case(2, file_name="context.md"), resources_dir) == key
+    assert await _cache(tmp_path, version="2").key(test_case, resources_dir) != key
+    changed_input = _test_case(file_name="context.md", question="other")
+    assert await _cache(tmp_path).key(changed_input, resources_dir) != key
+
+    await (resources_dir / "context.md").write_text("changed context")
+    assert await _cache(tmp_path).key(test_case, resources_dir) != key
+
+
+@pytest.mark.anyio
+async def test_cached_outputs_skip_the_feature(tmp_path: Path) -> None:
+    plugin_service = MagicMock()
+    plugin_service.get_resources_dir.return_value = anyio.Path(tmp_path)
+    plugin_service.run_feature = AsyncMock(return_value=AnswerOutput(answer="a"))
+    plugin_service.run_static_tests = MagicMock(return_value=CsvColumn())
+    plugin_service.llm_evaluation = AsyncMock(return_value=CsvColumn())
+    plugin_service.get_csv_row_class.return_value = AnswerRow
+    uncacheable = _test_case(2)
+    uncacheable.config.cacheable = False
+
+    for _ in range(2):
+        ts = TestingService(
+            [_test_case(1), uncacheable],
+            plugin_service,
+            MagicMock(),
+            feature_cache=_cache(tmp_path),
+        )
+        await ts.run_tests()
+        assert sorted(row.identifier for row in ts.csv_rows) == [1, 2]
+
+    feature_runs = [c.kwargs["test_case"].id for c in plugin_service.run_feature.await_args_list]
+    assert sorted(feature_runs) == [1, 2, 2]
+    static_outputs = [
+        c.kwargs["test_output"] for c in plugin_service.run_static_tests.call_args_list
+    ]
+    assert static_outputs == [AnswerOutput(answer="a")] * 4
@@ -0,0 +1,331 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import json
+from typing import TYPE_CHECKING, BinaryIO
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from anyio import Path as AsyncPath
+from google.genai.types import (
+    BatchJob,
+    BatchJobDestination,
+    Candidate,
+    Content,
+    GenerateContentResponse,
+    InlinedResponse,
+    JobError,
+    Part,
+)
+from pydantic import BaseModel
+
+from vera.core.batch_jobs import BatchJobStore
+from vera.core.configuration import CONFIG, VeraConfig
+from vera.core.gemini import Gemini, GeminiClientPool, GeminiConfig
+from vera.project_name import PROJECT_NAME
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from pathlib import Path
+
+
+@pytest.fixture
+def mock_client_cls() -> Iterator[MagicMock]:
+    with (
+        patch(
+            f"{PROJECT_NAME}.core.gemini.VeraConfig.load",
+            return_value=VeraConfig(gemini_api_key="key"),
+        ),
+        patch(f"{PROJECT_NAME}.core.gemini.genai.client.Client") as client_cls,
+    ):
+        client_cls.side_effect = lambda **_: MagicMock(aio=MagicMock(aclose=AsyncMock()))
+        yield client_cls
+
+
+def test_pool_shares_client_between_sessions(mock_client_cls: MagicMock) -> None:
+    pool = GeminiClientPool()
+    first = pool.session(GeminiConfig())
+    second = pool.session(GeminiConfig())
+
+    mock_client_cls.assert_called_once_with(api_key="key")
+    assert first.client is second.client
+    assert first.content is not second.content
+
+    first.set_system_prompt_to_session("first")
+    assert not second.system_prompt
+
+
+@pytest.mark.anyio
+async def test_closing_session_keeps_pooled_client_open(mock_client_cls: MagicMock) -> None:
+    pool = GeminiClientPool()
+    async with pool.session(GeminiConfig()) as session:
+        client = session.client
+
+    client.aclose.assert_not_awaited()
+
+    await pool.aclose()
+    client.aclose.assert_awaited_once()
+
+    pool.session(GeminiConfig())
+    assert mock_client_cls.call_count == 2
+
+
+@pytest.fixture
+def batch_job_store(tmp_path: Path) -> Iterator[BatchJobStore]:
+    store = BatchJobStore(tmp_path / "batch_jobs.json")
+    with patch(f"{PROJECT_NAME}.core.gemini.get_batch_job_store", return_value=store):
+        yield store
+
+
+class Score(BaseModel):
+    score: int
+
+
+def _inlined(key: str, text: str | None = None, error: JobError | None = None) -> InlinedResponse:
+    response: GenerateContentResponse | None = None
+    if text is not None:
+        response = GenerateContentResponse(
+            candidates=[Candidate(content=Content(role="model", parts=[Part(text=text)]))]
+        )
+
+    return InlinedResponse(response=response, metadata={"key": key}, error=error)
+
+
+@pytest.mark.anyio
+@pytest.mark.usefixtures("batch_job_store")
+async def test_batch_results_are_matched_by_key_and_failures_are_resent() -> None:
+    responses: list[InlinedResponse] = [
+        _inlined("3", '{"score": 3}'),
+        _inlined("0", '{"score": 0}'),
+        _inlined("1", error=JobError(code=500, message="internal")),
+        _inlined("4", "not json"),
+    ]
+    client = MagicMock(aclose=AsyncMock())
+    client.batches.create = AsyncMock(return_value=BatchJob(name="job", state="JOB_STATE_PENDING"))
+    client.batches.get = AsyncMock(
+        return_value=BatchJob(
+            name="job",
+            state="JOB_STATE_SUCCEEDED",
+            dest=BatchJobDestination(inlined_responses=responses),
+        )
+    )
+    client.models.generate_content = AsyncMock(
+        side_effect=lambda contents, **_: MagicMock(text=f'{{"score": {len(contents[0].parts)}}}')
+    )
+    gemini = Gemini(GeminiConfig(context_caching=False), client=client)
+    gemini.bulk_threshold = 0
+    prompts: list[str] = ["a", "b", "c", "d", "e"]
+
+    results = await gemini.send_bulk_messages(prompts, response_json_schema=Score)
+
+    assert results == [
+        Score(score=0),
+        Score(score=1),
+        Score(score=1),
+        Score(score=3),
+        Score(score=1),
+    ]
+    sent = client.batches.create.await_args.kwargs["src"]
+    assert [request.metadata["key"] for request in sent] == ["0", "1", "2", "3", "4"]
+    resent = [
+        c.kwargs["contents"][0].parts[-1].text
+        for c in client.models.generate_content.await_args_list
+    ]
+    assert sorted(resent) == ["b", "c", "e"]
+
+
+@pytest.mark.anyio
+@pytest.mark.usefixtures("batch_job_store")
+async def test_batch_file_results_are_matched_by_key() -> None:
+    def line(key: str, text: str) -> str:
+        response = {"candidates": [{"content": {"parts": [{"text": text}]}}]}
+        return json.dumps({"key": key, "response": response})
+
+    output: str = "\n".join([
+        line("2", '{"score": 2}'),
+        "",
+        json.dumps({"key": "0", "error": {"code": 500}}),
+        line("1", '{"score": 1}'),
+    ])
+    client = MagicMock(aclose=AsyncMock())
+    client.batches.create = AsyncMock(
+        return_value=BatchJob(
+            name="job",
+            state="JOB_STATE_SUCCEEDED",
+            dest=BatchJobDestination(file_name="files/results"),
+        )
+    )
+    client.files.download = AsyncMock(return_value=output.encode())
+    client.models.generate_content = AsyncMock(return_value=MagicMock(text='{"score": 0}'))
+    gemini = Gemini(GeminiConfig(context_caching=False), client=client)
+    gemini.bulk_threshold = 0
+
+    results = await gemini.send_bulk_messages(["a", "b", "c"], response_json_schema=Score)
+
+    assert results == [Score(score=0), Score(score=1), Score(score=2)]
+    client.models.generate_content.assert_awaited_once()
+
+
+@pytest.mark.anyio
+async def test_interrupted_batch_job_is_resumed(tmp_path: Path) -> None:
+    path: Path = tmp_path / "batch_jobs.json"
+    never: asyncio.Event = asyncio.Event()
+
+    async def wait_forever(**_: object) -> BatchJob:
+        await never.wait()
+        raise AssertionError
+
+    interrupted = MagicMock(aclose=AsyncMock())
+    interrupted.batches.create = AsyncMock(
+        return_value=BatchJob(name="job", state="JOB_STATE_PENDING")
+    )
+    interrupted.batches.get = AsyncMock(side_effect=wait_forever)
+    gemini = Gemini(GeminiConfig(context_caching=False), client=interrupted)
+    gemini.bulk_threshold = 0
+    with patch(f"{PROJECT_NAME}.core.gemini.get_batch_job_store", return_value=BatchJobStore(path)):
+        with pytest.raises(TimeoutError):
+            await asyncio.wait_for(
+                gemini.send_bulk_messages(["a", "b"], response_json_schema=Score), timeout=0.1
+            )
+
+        await gemini.close()
+
+    assert list(json.loads(await AsyncPath(path).read_text(encoding="utf-8"))) == ["job"]
+
+    client = MagicMock(aclose=AsyncMock())
+    client.batches.create = AsyncMock(
+        return_value=BatchJob(
+            name="new-job",
+            state="JOB_STATE_SUCCEEDED",
+            dest=BatchJobDestination(inlined_responses=[_inlined("0", '{"score": 3}')]),
+        )
+    )
+    client.batches.get = AsyncMock(
+        side_effect=lambda name: BatchJob(
+            name=name,
+            state="JOB_STATE_SUCCEEDED",
+            dest=BatchJobDestination(
+                inlined_responses=[_inlined("1", '{"score": 2}'), _inlined("0", '{"score": 1}')]
+            ),
+        )
+    )
+    gemini = Gemini(GeminiConfig(context_caching=False), client=client)
+    gemini.bulk_threshold = 0
+    with (
+        patch(f"{PROJECT_NAME}.core.gemini.get_batch_job_store", return_value=BatchJobStore(path)),
+        patch.object(CONFIG, "resume_batch", new=True),
+    ):
+        results = await gemini.send_bulk_messages(["b", "c", "a"], response_json_schema=Score)
+
+    assert results == [Score(score=2), Score(score=3), Score(score=1)]
+    sent = client.batches.create.await_args.kwargs["src"]
+    assert [request.contents[0].parts[-1].text for request in sent] == ["c"]
+    assert json.loads(await AsyncPath(path).read_text(encoding="utf-8")) == {}
+
+
+@pytest.mark.anyio
+async def test_batch_job_is_resumed_by_request_key(tmp_path: Path) -> None:
+    path: Path = tmp_path / "batch_jobs.json"
+    interrupted = MagicMock(aclose=AsyncMock())
+    interrupted.batches.create = AsyncMock(
+        return_value=BatchJob(name="job", state="JOB_STATE_PENDING")
+    )
+    interrupted.batches.get = AsyncMock(side_effect=asyncio.CancelledError)
+    gemini = Gemini(GeminiConfig(context_caching=False), client=interrupted)
+    gemini.bulk_threshold = 0
+    with (
+        patch(f"{PROJECT_NAME}.core.gemini.get_batch_job_store", return_value=BatchJobStore(path)),
+        pytest.raises(asyncio.CancelledError),
+    ):
+        await gemini.send_bulk_messages(
+            ["output 1", "output 2"], response_json_schema=Score, request_keys=["1", "2"]
+        )
+
+    client = MagicMock(aclose=AsyncMock())
+    client.batches.create = AsyncMock()
+    client.batches.get = AsyncMock(
+        return_value=BatchJob(
+            name="job",
+            state="JOB_STATE_SUCCEEDED",
+            dest=BatchJobDestination(
+                inlined_responses=[_inlined("1", '{"score": 2}'), _inlined("0", '{"score": 1}')]
+            ),
+        )
+    )
+    gemini = Gemini(GeminiConfig(context_caching=False), client=client)
+    gemini.bulk_threshold = 0
+    with (
+        patch(f"{PROJECT_NAME}.core.gemini.get_batch_job_store", return_value=BatchJobStore(path)),
+        patch.object(CONFIG, "resume_batch", new=True),
+    ):
+        # The feature outputs in the prompts changed since the job was submitted
+        results = await gemini.send_bulk_messages(
+            ["new output 2", "new output 1"], response_json_schema=Score, request_keys=["2", "1"]
+        )
+
+    assert results == [Score(score=2), Score(score=1)]
+    client.batches.create.assert_not_awaited()
+
+
+class StreamingFiles:
+    """Files endpoint that writes the results file to the destination in chunks."""
+
+    def __init__(self, output: bytes) -> None:
+        self.output: bytes = output
+        self.destinations: list[object] = []
+
+    async def download(self, *, file: str, destination: BinaryIO | None = None) -> bytes | None:
+        assert file == "files/results"
+        if destination is None:
+            return self.output
+
+        self.destinations.append(destination)
+        for start in range(0, len(self.output), 7):
+            destination.write(self.output[start : start + 7])
+            await asyncio.sleep(0)
+
+        return None
+
+
+@pytest.mark.anyio
+@pytest.mark.usefixtures("batch_job_store")
+async def test_batch_file_results_are_streamed_to_a_temporary_file() -> None:
+    lines: list[str] = [
+        json.dumps({
+            "key": str(index),
+            "response": {
+                "candidates": [{"content": {"parts": [{"text": f'{{"score": {index}}}'}]}}]
+            },
+        })
+        for index in range(20)
+    ]
+    files = StreamingFiles("\n\n".join(lines).encode())
+    client = MagicMock(aclose=AsyncMock(), files=files)
+    client.batches.create = AsyncMock(
+        return_value=BatchJob(
+            name="job",
+            state="JOB_STATE_SUCCEEDED",
+            dest=BatchJobDestination(file_name="files/results"),
+        )
+    )
+    gemini = Gemini(GeminiConfig(context_caching=False), client=client)
+    gemini.bulk_threshold = 0
+
+    results = await gemini.send_bulk_messages(
+        [str(index) for index in range(20)], response_json_schema=Score
+    )
+
+    assert results == [Score(score=index) for index in range(20)]
+    assert len(files.destinations) == 1
@@ -0,0 +1,123 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from pathlib import Path  # noqa: TC003
+from typing import Any, override
+
+import pytest
+from pydantic import BaseModel
+
+from vera.core.data_models.llm_config import LlmConfig
+from vera.core.data_models.llm_sdk import LlmSdk
+from vera.core.disk_cache import DiskCache
+from vera.core.llm_cache import LlmResponseCache
+
+
+class Verdict(BaseModel):
+    score: int
+
+
+class FakeConfig(LlmConfig):
+    model_name: str = "model"
+
+    @override
+    @property
+    def api_key(self) -> str:
+        return "key"
+
+
+class CountingSdk(LlmSdk[FakeConfig]):
+    def __init__(self) -> None:
+        super().__init__(FakeConfig())
+        self.sent: list[str] = []
+
+    @override
+    async def __aexit__(self, *_: object) -> None:
+        pass
+
+    @override
+    async def send_message(self, prompt: str, /, **_: Any) -> Verdict:
+        self.sent.append(prompt)
+        return Verdict(score=len(self.sent))
+
+    @override
+    async def send_bulk_messages(self, prompts: list[str], /, **_: Any) -> list[Verdict | str]:
+        self.sent.extend(prompts)
+        return [Verdict(score=len(prompt)) for prompt in prompts]
+
+    @override
+    def clean_session_history(self) -> None:
+        pass
+
+
+def _cache(path: Path, *, refresh: bool = False) -> LlmResponseCache:
+    return LlmResponseCache(DiskCache(path / "llm.sqlite", max_size_bytes=1 << 20), refresh=refresh)
+
+
+async def _judge(
+    cache: LlmResponseCache, sdk: CountingSdk, system_prompt: str = "specs"
+) -> Verdict:
+    async with cache.wrap(sdk) as llm:
+        llm.set_system_prompt_to_session(system_prompt)
+        return await llm.send_message(
+            "prompt", raise_error_if_empty_response=True, response_json_schema=Verdict
+        )
+
+
+@pytest.mark.anyio
+async def test_repeated_request_is_served_from_cache(tmp_path: Path) -> None:
+    sdk = CountingSdk()
+    assert await _judge(_cache(tmp_path), sdk) == Verdict(score=1)
+
+    assert await _judge(_cache(tmp_path), sdk) == Verdict(score=1)
+    assert sdk.sent == ["prompt"]
+
+    await _judge(_cache(tmp_path), sdk, system_prompt="changed specs")
+    assert len(sdk.sent) == 2
+
+
+@pytest.mark.anyio
+async def test_repeats_within_a_process_are_cached_separately(tmp_path: Path) -> None:
+    sdk = CountingSdk()
+    cache = _cache(tmp_path)
+    assert await _judge(cache, sdk) == Verdict(score=1)
+    assert await _judge(cache, sdk) == Verdict(score=2)
+
+    replay = _cache(tmp_path)
+    assert [await _judge(replay, sdk), await _judge(replay, sdk)] == [
+        Verdict(score=1),
+        Verdict(score=2),
+    ]
+    assert len(sdk.sent) == 2
+
+
+@pytest.mark.anyio
+async def test_refresh_replaces_cached_responses(tmp_path: Path) -> None:
+    sdk = CountingSdk()
+    await _judge(_cache(tmp_path), sdk)
+    assert await _judge(_cache(tmp_path, refresh=True), sdk) == Verdict(score=2)
+    assert await _judge(_cache(tmp_path), sdk) == Verdict(score=2)
+
+
+@pytest.mark.anyio
+async def test_bulk_messages_only_send_misses(tmp_path: Path) -> None:
+    sdk = CountingSdk()
+    async with _cache(tmp_path).wrap(sdk) as llm:
+        await llm.send_bulk_messages(["a"], response_json_schema=Verdict)
+
+    async with _cache(tmp_path).wrap(sdk) as llm:
+        responses = await llm.send_bulk_messages(["a", "bb"], response_json_schema=Verdict)
+
+    assert responses == [Verdict(score=1), Verdict(score=2)]
+    assert sdk.sent == ["a", "bb"]
@@ -0,0 +1,69 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+from pathlib import Path  # noqa: TC003
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import anyio
+import pytest
+
+from vera.core.prompt_cache import PromptCache
+from vera.project_name import PROJECT_NAME
+
+
+@pytest.fixture
+def plugin_service(tmp_path: Path) -> MagicMock:
+    specs_dir: Path = tmp_path / "specs"
+    specs_dir.mkdir()
+    (specs_dir / "rubric.md").write_text("rubric", encoding="utf-8")
+    (tmp_path / "task.md").write_text("Evaluate $actual_output_string", encoding="utf-8")
+
+    async def get_spec_files(specs_dir: anyio.Path) -> tuple[str, ...]:
+        return (await (specs_dir / "rubric.md").read_text(),)
+
+    service = MagicMock()
+    service.get_llm_specs_dir.return_value = anyio.Path(specs_dir)
+    service.get_evaluation_task_template_path.return_value = anyio.Path(tmp_path / "task.md")
+    service.get_spec_files = AsyncMock(side_effect=get_spec_files)
+    return service
+
+
+@pytest.mark.anyio
+async def test_bundle_is_loaded_once(plugin_service: MagicMock) -> None:
+    cache = PromptCache(plugin_service)
+    first = await cache.get()
+    second = await cache.get()
+
+    assert first is second
+    assert first.system_prompt == "rubric\n\n"
+    assert first.task_template.substitute(actual_output_string="it") == "Evaluate it"
+    plugin_service.get_spec_files.assert_awaited_once()
+
+
+@pytest.mark.anyio
+async def test_bundle_is_reloaded_when_a_spec_changes(
+    plugin_service: MagicMock, tmp_path: Path
+) -> None:
+    cache = PromptCache(plugin_service)
+    with patch(f"{PROJECT_NAME}.core.prompt_cache.CHANGE_CHECK_INTERVAL_SEC", 0):
+        await cache.get()
+        assert (await cache.get()).system_prompt == "rubric\n\n"
+
+        rubric = anyio.Path(tmp_path / "specs" / "rubric.md")
+        await rubric.write_text("new rubric", encoding="utf-8")
+        os.utime(rubric, ns=(0, 0))
+
+        assert (await cache.get()).system_prompt == "new rubric\n\n"
+        assert plugin_service.get_spec_files.await_count == 2
@@ -0,0 +1,98 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import csv
+from typing import TYPE_CHECKING
+from unittest.mock import MagicMock, patch
+
+import pytest
+from typer.testing import CliRunner
+
+from vera.core.data_models.csv import ScoreRange
+from vera.core.report_merge import group_runs, read_reports
+from vera.main import app
+from vera.project_name import PROJECT_NAME
+
+from .test_results_store import MockRow
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+def write_csv(path: Path, rows: list[dict[str, object]]) -> Path:
+    with path.open("w", encoding="utf-8", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=list(rows[0]))
+        writer.writeheader()
+        writer.writerows(rows)
+
+    return path
+
+
+@pytest.fixture
+def shard_reports(tmp_path: Path) -> list[Path]:
+    return [
+        write_csv(
+            tmp_path / "shard_1.csv",
+            [
+                {"Test Case ID": 1, "Final Score": 0.5, "Notes": "a"},
+                {"Test Case ID": 1, "Final Score": 1.0, "Notes": "b"},
+            ],
+        ),
+        write_csv(
+            tmp_path / "shard_2.csv",
+            [
+                {"Test Case ID": 2, "Final Score": 0.0, "Extra": "x"},
+                {"Test Case ID": 2, "Final Score": 1.0, "Extra": "y"},
+            ],
+        ),
+    ]
+
+
+def test_shard_reports_are_merged_into_runs(shard_reports: list[Path]) -> None:
+    report = read_reports(shard_reports)
+    assert report.columns == ["Test Case ID", "Final Score", "Notes", "Extra"]
+    assert len(report.rows) == 4
+
+    runs = group_runs(report, MockRow)
+    assert [[(row.identifier, row.final_score) for row in run] for run in runs] == [
+        [(1, 0.5), (2, 0.0)],
+        [(1, 1.0), (2, 1.0)],
+    ]
+    assert runs[0][0].score_range == ScoreRange(min=0, max=1)
+    assert group_runs(report)[0][0].score_range is None
+
+
+def test_files_that_are_not_reports_are_rejected(tmp_path: Path) -> None:
+    path = write_csv(tmp_path / "other.csv", [{"name": "x"}])
+    with pytest.raises(ValueError, match="is not a report"):
+        read_reports([path])
+
+
+def test_merge_command_writes_one_report(shard_reports: list[Path], tmp_path: Path) -> None:
+    output = tmp_path / "merged.csv"
+    with patch(f"{PROJECT_NAME}.core.plugin_service.create_service") as mock_create:
+        mock_create.return_value = MagicMock()
+        mock_create.return_value.plugin_service.get_csv_row_class.return_value = MockRow
+        result = CliRunner().invoke(app, ["merge", *map(str, shard_reports), "-o", str(output)])
+
+    assert result.exit_code == 0, result.output
+    assert "Test Summary" in result.output
+    with output.open(encoding="utf-8", newline="") as f:
+        rows = list(csv.DictReader(f))
+    assert [(row["Test Case ID"], row["Notes"], row["Extra"]) for row in rows] == [
+        ("1", "a", ""),
+        ("1", "b", ""),
+        ("2", "", "x"),
+        ("2", "", "y"),
+    ]
@@ -0,0 +1,178 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import contextlib
+from typing import TYPE_CHECKING, Any, Self, override
+
+import pytest
+from pydantic import ConfigDict
+from typer.testing import CliRunner
+
+from vera.core.data_models.csv import CsvRow, ScoreRange
+from vera.core.data_models.test_case import TestCase
+from vera.core.data_models.test_case.input import TestCaseInput
+from vera.core.results_store import (
+    ResultsStore,
+    connect,
+    load_mean_durations,
+    load_test_case_hashes,
+    query_runs,
+    query_test_case,
+    read_durations_file,
+)
+from vera.main import app
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+class MockInput(TestCaseInput):
+    @override
+    def to_description_prompt(self) -> str:
+        return ""
+
+
+class MockRow(CsvRow):
+    model_config = ConfigDict(populate_by_name=True)
+
+    @override
+    def calculate_final_score(self) -> float:
+        return self.final_score
+
+    @property
+    @override
+    def score_range(self) -> ScoreRange:
+        return ScoreRange(min=0, max=1)
+
+    @classmethod
+    @override
+    def from_columns(cls, **kwargs: Any) -> Self:  # ty:ignore[invalid-method-override]
+        return cls(**kwargs)
+
+
+def _test_case(test_case_id: int, tags: list[str]) -> TestCase[MockInput]:
+    return TestCase(
+        id=test_case_id,
+        name=f"test {test_case_id}",
+        description="",
+        input=MockInput(),
+        tags=tags,
+    )
+
+
+async def _record_run(
+    path: Path, run_id: str, plugin: str, scores: dict[int, float], tags: list[str]
+) -> None:
+    store = await ResultsStore.open(run_id, path)
+    assert store is not None
+    test_cases = [_test_case(test_case_id, tags) for test_case_id in scores]
+    await store.start_run(plugin, [], 1, test_cases)
+    for test_case in test_cases:
+        score = scores[test_case.id]
+        await store.record_row(
+            0,
+            test_case,
+            MockRow(identifier=test_case.id, final_score=score),
+            {"feature": 1.0, "total": 2.5},
+        )
+
+    await store.record_failure(0, _test_case(3, tags), TimeoutError("too slow"))
+    await store.finish_run()
+    await store.aclose()
+
+
+@pytest.mark.anyio
+async def test_runs_are_queried_by_plugin_and_tag(tmp_path: Path) -> None:
+    path = tmp_path / "results.sqlite3"
+    await _record_run(path, "first", "plugin_a", {1: 0.5, 2: 1.0}, ["smoke"])
+    await _record_run(path, "second", "plugin_b", {1: 0.0}, ["nightly"])
+
+    with contextlib.closing(connect(path)) as connection:
+        runs = query_runs(connection)
+        assert [run.run_id for run in runs] == ["second", "first"]
+        assert runs[1].rows == 2
+        assert runs[1].failures == 1
+        assert runs[1].average_score == pytest.approx(0.75)
+        assert runs[1].finished_at is not None
+
+        assert [run.run_id for run in query_runs(connection, plugin="plugin_a")] == ["first"]
+        assert [run.run_id for run in query_runs(connection, tag="nightly")] == ["second"]
+
+        history = query_test_case(connection, 1)
+        assert [(entry.run_id, entry.final_score) for entry in history] == [
+            ("second", 0.0),
+            ("first", 0.5),
+        ]
+        assert history[0].total_duration == pytest.approx(2.5)
+
+        failures = query_test_case(connection, 3)
+        assert [entry.error for entry in failures] == [
+            "TimeoutError: too slow",
+            "TimeoutError: too slow",
+        ]
+
+
+@pytest.mark.anyio
+async def test_history_command_shows_recorded_runs(results_db_path: Path) -> None:
+    await _record_run(results_db_path, "recorded-run", "plugin_a", {1: 0.5}, ["smoke"])
+    runner = CliRunner()
+
+    result = runner.invoke(app, ["history", "--tag", "smoke"])
+    assert result.exit_code == 0
+    assert "recorded-run" in result.output
+
+    result = runner.invoke(app, ["history", "--test-case", "3"])
+    assert result.exit_code == 0
+    assert "too slow" in result.output
+
+
+@pytest.mark.anyio
+async def test_mean_durations_are_loaded_by_plugin(results_db_path: Path) -> None:
+    assert load_mean_durations() == {}
+
+    await _record_run(results_db_path, "first", "plugin_a", {1: 0.5, 2: 1.0}, [])
+    await _record_run(results_db_path, "second", "plugin_b", {1: 0.0}, [])
+
+    assert load_mean_durations(plugin="plugin_b") == {
+        1: {"feature": pytest.approx(1.0), "total": pytest.approx(2.5)}
+    }
+    assert set(load_mean_durations()) == {1, 2}
+
+
+@pytest.mark.anyio
+async def test_history_command_exports_durations(results_db_path: Path, tmp_path: Path) -> None:
+    await _record_run(results_db_path, "first", "plugin_a", {1: 0.5, 2: 1.0}, [])
+    await _record_run(results_db_path, "second", "plugin_b", {1: 0.0}, [])
+    path = tmp_path / "durations.json"
+
+    result = CliRunner().invoke(
+        app, ["history", "--plugin", "plugin_b", "--export-durations", str(path)]
+    )
+
+    assert result.exit_code == 0
+    assert read_durations_file(path) == {1: pytest.approx(2.5)}
+
+
+@pytest.mark.anyio
+async def test_test_case_hashes_keep_the_last_run_by_plugin(results_db_path: Path) -> None:
+    assert load_test_case_hashes(plugin="plugin_a") == {}
+
+    for run_id, hashes in (("first", {1: "a", 2: "b"}), ("second", {1: "c"})):
+        store = await ResultsStore.open(run_id, results_db_path)
+        assert store is not None
+        await store.record_test_case_hashes("plugin_a", hashes)
+        await store.aclose()
+
+    assert load_test_case_hashes(plugin="plugin_a") == {1: ("c", "second"), 2: ("b", "first")}
+    assert load_test_case_hashes(plugin="plugin_b") == {}
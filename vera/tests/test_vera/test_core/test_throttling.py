@@ -0,0 +1,155 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import contextlib
+
+import pytest
+
+from vera.core.throttling import (
+    AdaptiveConcurrencyLimiter,
+    RateLimiter,
+    estimate_tokens,
+    get_rate_limiter,
+)
+
+
+class OverloadError(Exception):
+    pass
+
+
+def _is_overload(e: BaseException) -> bool:
+    return isinstance(e, OverloadError)
+
+
+async def _fail(limiter: AdaptiveConcurrencyLimiter) -> None:
+    with contextlib.suppress(OverloadError):
+        async with limiter.slot(is_overload=_is_overload):
+            raise OverloadError
+
+
+def test_invalid_arguments() -> None:
+    with pytest.raises(ValueError, match="min_window"):
+        AdaptiveConcurrencyLimiter(max_window=2, min_window=3)
+
+    with pytest.raises(ValueError, match="Decrease factor"):
+        AdaptiveConcurrencyLimiter(max_window=2, decrease_factor=1)
+
+
+@pytest.mark.anyio
+async def test_overload_shrinks_window_and_success_grows_it() -> None:
+    limiter = AdaptiveConcurrencyLimiter(max_window=8)
+    assert limiter.window == 8
+
+    await _fail(limiter)
+    assert limiter.window == 4
+
+    for _ in range(5):
+        async with limiter.slot(is_overload=_is_overload):
+            pass
+
+    assert limiter.window == 5
+
+
+@pytest.mark.anyio
+async def test_other_errors_do_not_shrink_window() -> None:
+    limiter = AdaptiveConcurrencyLimiter(max_window=4)
+    with contextlib.suppress(ValueError):
+        async with limiter.slot(is_overload=_is_overload):
+            raise ValueError
+
+    assert limiter.window == 4
+    assert limiter.in_flight == 0
+
+
+@pytest.mark.anyio
+async def test_concurrent_overloads_count_once() -> None:
+    limiter = AdaptiveConcurrencyLimiter(max_window=8)
+    started: asyncio.Event = asyncio.Event()
+    release: asyncio.Event = asyncio.Event()
+
+    async def overloaded() -> None:
+        with contextlib.suppress(OverloadError):
+            async with limiter.slot(is_overload=_is_overload):
+                if limiter.in_flight == 4:
+                    started.set()
+                await release.wait()
+                raise OverloadError
+
+    tasks = [asyncio.create_task(overloaded()) for _ in range(4)]
+    await started.wait()
+    release.set()
+    await asyncio.gather(*tasks)
+
+    assert limiter.window == 4
+
+
+@pytest.mark.anyio
+async def test_window_bounds_in_flight_requests() -> None:
+    limiter = AdaptiveConcurrencyLimiter(max_window=4)
+    await _fail(limiter)
+    peak: int = 0
+
+    async def work() -> None:
+        nonlocal peak
+        async with limiter.slot(is_overload=_is_overload):
+            peak = max(peak, limiter.in_flight)
+            await asyncio.sleep(0.01)
+
+    await asyncio.gather(*(work() for _ in range(6)))
+    assert peak <= 3
+    assert limiter.in_flight == 0
+
+
+@pytest.mark.anyio
+async def test_rate_limiter_reconciles_tokens() -> None:
+    limiter = RateLimiter(requests_per_minute=None, tokens_per_minute=600)
+    assert limiter.tokens is not None
+
+    charged = await limiter.acquire(tokens=600)
+    assert charged == 600
+    assert limiter.tokens.delay_for(300) > 0
+
+    limiter.reconcile(charged, actual=300)
+    assert limiter.tokens.delay_for(300) == 0
+
+
+@pytest.mark.anyio
+async def test_rate_limiter_counts_requests() -> None:
+    limiter = RateLimiter(requests_per_minute=2, tokens_per_minute=None)
+    assert limiter.requests is not None
+
+    await limiter.acquire()
+    await limiter.acquire()
+    assert limiter.requests.delay_for(1) > 0
+
+
+@pytest.mark.anyio
+async def test_rate_limiter_caps_tokens_at_capacity() -> None:
+    limiter = RateLimiter(requests_per_minute=None, tokens_per_minute=100)
+    assert await limiter.acquire(tokens=1000) == 100
+
+
+def test_get_rate_limiter_is_shared() -> None:
+    assert get_rate_limiter("model", None, None) is None
+
+    limiter = get_rate_limiter("model", 10, 1000)
+    assert limiter is not None
+    assert get_rate_limiter("model", 10, 1000) is limiter
+    assert get_rate_limiter("other-model", 10, 1000) is not limiter
+
+
+def test_estimate_tokens() -> None:
+    assert estimate_tokens() == 0
+    assert estimate_tokens("abcd", "efgh", "i") == 3
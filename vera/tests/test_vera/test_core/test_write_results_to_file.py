@@ -11,6 +11,7 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import asyncio
 from typing import TYPE_CHECKING, Any, Self, override
 from unittest.mock import patch
 
@@ -21,6 +22,9 @@ from vera import CONFIG
 from vera.core.configuration import VeraConfig
 from vera.core.data_models.csv import CsvRow, ScoreRange
 from vera.core.write_results_to_file import (
+    CsvReportWriter,
+    append_row,
+    close_report,
     create_report_file,
     get_report_dir,
     write_to_file,
@@ -114,3 +118,56 @@ async def test_write_to_file(tmp_path: pathlib.Path) -> None:
         assert "test2" in content
         assert "0.9" in content
         assert "Final Score" in content
+
+
+@pytest.mark.anyio
+async def test_appended_rows_are_written_as_they_arrive(tmp_path: pathlib.Path) -> None:
+    report_dir = tmp_path / "reports"
+    config = VeraConfig(dst_dir=report_dir)
+    with patch(f"{PROJECT_NAME}.core.write_results_to_file.CONFIG", config):
+        await append_row(MockRow(identifier=2, name="test2", score=0.9, final_score=0.9), 0)
+        report_file = Path(report_dir / "report_1.csv")
+        await append_row(MockRow(identifier=1, name="test1", score=0.8, final_score=0.8), 0)
+        assert await close_report(0)
+        assert not await close_report(0)
+
+    lines = (await report_file.read_text()).splitlines()
+    assert len(lines) == 3
+    assert "Final Score" in lines[0]
+    assert "test2" in lines[1]
+    assert "test1" in lines[2]
+
+
+async def _wait_for_lines(path: Path, count: int) -> list[str]:
+    for _ in range(200):
+        lines: list[str] = (await path.read_text()).splitlines()
+        if len(lines) >= count:
+            return lines
+
+        await asyncio.sleep(0.01)
+
+    return (await path.read_text()).splitlines()
+
+
+@pytest.mark.anyio
+async def test_writer_flushes_by_row_count_and_interval(tmp_path: pathlib.Path) -> None:
+    path = tmp_path / "report.csv"
+    report_file = Path(path)
+    writer = CsvReportWriter(path, flush_rows=2, flush_interval=60)
+    await writer.write(MockRow(identifier=1, name="test1", score=0.8, final_score=0.8))
+    await writer.write(MockRow(identifier=2, name="test2", score=0.9, final_score=0.9))
+    assert len(await _wait_for_lines(report_file, 3)) == 3
+    await writer.aclose()
+
+    writer = CsvReportWriter(path, flush_rows=100, flush_interval=0.05, fsync=True)
+    await writer.write(MockRow(identifier=3, name="test3", score=0.7, final_score=0.7))
+    lines = await _wait_for_lines(report_file, 2)
+    assert "test3" in lines[1]
+    await writer.aclose()
+
+
+@pytest.mark.anyio
+async def test_writer_reports_write_failures(tmp_path: pathlib.Path) -> None:
+    writer = CsvReportWriter(tmp_path / "missing" / "report.csv", flush_rows=1, flush_interval=1)
+    with pytest.raises(OSError, match="Failed to write the report file"):
+        await writer.aclose()
@@ -16,11 +16,14 @@ from __future__ import annotations
 
 from unittest.mock import AsyncMock, MagicMock, patch
 
+import pytest
 from typer.testing import CliRunner
 
 from vera.main import app
 from vera.project_name import PROJECT_NAME
 
+pytestmark = pytest.mark.usefixtures("results_db_path")
+
 runner = CliRunner()
 
 
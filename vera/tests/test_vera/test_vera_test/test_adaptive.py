@@ -0,0 +1,117 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import itertools
+import math
+import statistics
+from typing import TYPE_CHECKING, Any, Self, override
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from vera.core.data_models.test_case import TestCase
+from vera.vtest.adaptive import AdaptiveRuns, RunningStats
+from vera.vtest.vtest import TestingService
+
+from .mock_cli_service import MockCliService
+from .test_evaluate import MockColumn, MockInput, MockOutput, MockRow
+
+if TYPE_CHECKING:
+    from vera.core.data_models.csv import CsvColumn
+    from vera.core.data_models.test_case.output import TestCaseOutput
+
+# Test case 1 always gets the same score, test case 2 alternates between the extremes
+SCORES: dict[int, itertools.cycle[float]] = {}
+
+
+class NoisyRow(MockRow):
+    @classmethod
+    @override
+    def from_columns(
+        cls,
+        test_case: TestCase,
+        test_output: TestCaseOutput,
+        llm_checks_columns: CsvColumn,
+        static_checks_columns: CsvColumn,
+    ) -> Self:
+        score: float = next(SCORES[test_case.id])
+        return cls.model_validate({"Test Case ID": test_case.id, "Final Score": score})
+
+
+def test_running_stats_match_statistics() -> None:
+    values = [0.5, 0.75, 1.0, 0.25, 0.5]
+    stats = RunningStats()
+    for value in values:
+        stats.add(value)
+
+    assert stats.count == len(values)
+    assert stats.mean == pytest.approx(statistics.mean(values))
+    assert stats.variance == pytest.approx(statistics.variance(values))
+    # The t quantile for 4 degrees of freedom
+    expected_width = 2 * 2.776 * statistics.stdev(values) / math.sqrt(len(values))
+    assert stats.ci_width() == pytest.approx(expected_width)
+
+
+def test_ci_width_needs_two_scores() -> None:
+    stats = RunningStats()
+    stats.add(1.0)
+
+    assert stats.ci_width() == math.inf
+
+
+@pytest.mark.anyio
+async def test_later_runs_wait_for_earlier_runs() -> None:
+    adaptive = AdaptiveRuns(target_width=0.25)
+    decision = asyncio.create_task(adaptive.should_run(2, 1))
+    adaptive.add_score(1, 1.0)
+    adaptive.finish(0, 1)
+    await asyncio.sleep(0)
+    assert not decision.done()
+
+    adaptive.add_score(1, 1.0)
+    adaptive.finish(1, 1)
+
+    assert not await decision
+    assert adaptive.skipped == 1
+
+
+@pytest.mark.anyio
+async def test_only_unstable_test_cases_are_repeated() -> None:
+    SCORES[1] = itertools.cycle([0.5])
+    SCORES[2] = itertools.cycle([0.0, 1.0])
+    test_cases = [
+        TestCase(id=i, name=f"test {i}", description="", input=MockInput())  # ty:ignore[missing-argument]
+        for i in (1, 2)
+    ]
+    plugin_service = MagicMock()
+    plugin_service.get_resources_dir.return_value = MagicMock()
+    plugin_service.run_feature = AsyncMock(return_value=MockOutput())
+    plugin_service.run_static_tests = MagicMock(return_value=MockColumn())
+    plugin_service.llm_evaluation = AsyncMock(return_value=MockColumn())
+    plugin_service.get_csv_row_class.return_value = NoisyRow
+    cli_service = MockCliService()
+    adaptive = AdaptiveRuns(target_width=0.25)
+    services: list[TestingService[Any, Any, Any, Any]] = [
+        TestingService(test_cases, plugin_service, cli_service, run_index=i, adaptive_runs=adaptive)
+        for i in range(5)
+    ]
+
+    await asyncio.gather(*(es.run_tests() for es in services))
+
+    runs = [[row.identifier for row in es.csv_rows] for es in services]
+    assert sum(ids.count(1) for ids in runs) == 2
+    assert sum(ids.count(2) for ids in runs) == 5
+    assert adaptive.skipped == 3
+    assert cli_service.overall_advances == 10
@@ -0,0 +1,208 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+from string import Template
+from typing import TYPE_CHECKING, Self
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from vera.core.data_models.csv import CsvColumn
+from vera.core.data_models.test_case import TestCase
+from vera.core.prompt_cache import PromptBundle
+from vera.project_name import PROJECT_NAME
+from vera.vtest.batch_judge import BatchJudge
+from vera.vtest.vtest import TestingService
+
+from .mock_cli_service import MockCliService
+from .test_evaluate import MockInput, MockOutput, MockRow
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+pytestmark = pytest.mark.usefixtures("no_llm_cache")
+
+
+class Verdict(CsvColumn):
+    prompt: str
+
+
+class BulkSdk:
+    def __init__(self) -> None:
+        self.chunks: list[list[str]] = []
+        self.system_prompt: str = ""
+
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(self, *_: object) -> None:
+        pass
+
+    def set_system_prompt_to_session(self, prompt: str) -> None:
+        self.system_prompt = prompt
+
+    async def send_bulk_messages(self, prompts: list[str], **_: object) -> list[Verdict]:
+        self.chunks.append(prompts)
+        return [Verdict(prompt=prompt) for prompt in prompts]
+
+
+@pytest.fixture
+def no_llm_cache() -> Iterator[None]:
+    with patch(f"{PROJECT_NAME}.vtest.batch_judge.get_llm_cache", return_value=None):
+        yield
+
+
+@pytest.fixture
+def sdk() -> BulkSdk:
+    return BulkSdk()
+
+
+@pytest.fixture
+def plugin_service(sdk: BulkSdk) -> MagicMock:
+    def create_prompt(test_case: TestCase, **_: object) -> str:
+        return f"prompt {test_case.id}"
+
+    service = MagicMock()
+    service.create_evaluation_task_prompt = AsyncMock(side_effect=create_prompt)
+    service.get_llm_csv_columns_class.return_value = Verdict
+    service.get_llm_sdk.return_value = sdk
+    return service
+
+
+def _judge(plugin_service: MagicMock, expected: int, batch_size: int) -> BatchJudge:
+    prompt_cache = MagicMock()
+    prompt_cache.get = AsyncMock(
+        return_value=PromptBundle(specs=(), system_prompt="specs", task_template=Template(""))
+    )
+    return BatchJudge(
+        plugin_service, prompt_cache, expected_evaluations=expected, max_batch_size=batch_size
+    )
+
+
+def _test_case(test_case_id: int) -> TestCase:
+    return TestCase(id=test_case_id, name="N", description="D", input=MockInput())  # ty:ignore[missing-argument]
+
+
+@pytest.mark.anyio
+async def test_prompts_are_sent_in_chunks(plugin_service: MagicMock, sdk: BulkSdk) -> None:
+    judge = _judge(plugin_service, expected=5, batch_size=2)
+    results = await asyncio.gather(
+        *(judge.evaluate(i, _test_case(i), MockOutput()) for i in range(1, 6))
+    )
+
+    assert [r.prompt for r in results] == [f"prompt {i}" for i in range(1, 6)]  # ty:ignore[unresolved-attribute]
+    assert [len(chunk) for chunk in sdk.chunks] == [2, 2, 1]
+    assert sdk.system_prompt == "specs"
+
+
+@pytest.mark.anyio
+async def test_last_chunk_is_sent_once_other_runs_are_released(
+    plugin_service: MagicMock, sdk: BulkSdk
+) -> None:
+    judge = _judge(plugin_service, expected=3, batch_size=10)
+    evaluation = asyncio.create_task(judge.evaluate(1, _test_case(1), MockOutput()))
+    await asyncio.sleep(0)
+    judge.release(2)
+    await asyncio.sleep(0)
+    assert not sdk.chunks
+
+    judge.release(3)
+    await evaluation
+    judge.release(1)
+    assert sdk.chunks == [["prompt 1"]]
+
+
+@pytest.mark.anyio
+async def test_failed_batch_fails_its_evaluations(plugin_service: MagicMock) -> None:
+    plugin_service.get_llm_sdk.return_value.send_bulk_messages = AsyncMock(return_value=[])
+    judge = _judge(plugin_service, expected=1, batch_size=10)
+    with pytest.raises(RuntimeError, match="Expected 1 batch results"):
+        await judge.evaluate(1, _test_case(1), MockOutput())
+
+
+@pytest.mark.anyio
+async def test_testing_service_uses_batch_judge(plugin_service: MagicMock, sdk: BulkSdk) -> None:
+    plugin_service.run_feature = AsyncMock(return_value=MockOutput())
+    plugin_service.run_static_tests = MagicMock(return_value=CsvColumn())
+    plugin_service.llm_evaluation = AsyncMock()
+    plugin_service.get_csv_row_class.return_value = MockRow
+    test_cases = [_test_case(1), _test_case(2)]
+    es = TestingService(
+        test_cases=test_cases,
+        plugin_service=plugin_service,
+        cli_service=MockCliService(),
+        batch_judge=_judge(plugin_service, expected=2, batch_size=10),
+    )
+
+    await es.run_tests()
+
+    assert len(es.csv_rows) == 2
+    assert sdk.chunks == [["prompt 1", "prompt 2"]]
+    plugin_service.llm_evaluation.assert_not_awaited()
+
+
+@pytest.mark.anyio
+async def test_runs_are_counted_once(plugin_service: MagicMock, sdk: BulkSdk) -> None:
+    judge = _judge(plugin_service, expected=2, batch_size=10)
+    judge.release(1)
+    judge.release(1)
+    with pytest.raises(RuntimeError, match="already released"):
+        await judge.evaluate(1, _test_case(1), MockOutput())
+    assert not sdk.chunks
+
+    async with asyncio.timeout(5):
+        await judge.evaluate(2, _test_case(2), MockOutput())
+    assert sdk.chunks == [["prompt 2"]]
+
+
+@pytest.mark.anyio
+async def test_failed_static_tests_do_not_stall_the_batch(
+    plugin_service: MagicMock, sdk: BulkSdk
+) -> None:
+    async def create_prompt(test_case: TestCase, **_: object) -> str:
+        if test_case.id == 1:
+            # The static tests of test case 1 fail before its prompt is queued
+            await asyncio.sleep(0.05)
+        return f"prompt {test_case.id}"
+
+    async def run_feature(test_case: TestCase, **_: object) -> MockOutput:
+        if test_case.id == 3:
+            await asyncio.sleep(0.1)
+        return MockOutput()
+
+    def run_static_tests(test_case: TestCase, **_: object) -> CsvColumn:
+        if test_case.id == 1:
+            msg = "static test failed"
+            raise ValueError(msg)
+        return CsvColumn()
+
+    plugin_service.create_evaluation_task_prompt = AsyncMock(side_effect=create_prompt)
+    plugin_service.run_feature = AsyncMock(side_effect=run_feature)
+    plugin_service.run_static_tests = MagicMock(side_effect=run_static_tests)
+    plugin_service.get_csv_row_class.return_value = MockRow
+    test_cases = [_test_case(1), _test_case(2), _test_case(3)]
+    es = TestingService(
+        test_cases=test_cases,
+        plugin_service=plugin_service,
+        cli_service=MockCliService(),
+        batch_judge=_judge(plugin_service, expected=3, batch_size=10),
+    )
+
+    async with asyncio.timeout(5):
+        await es.run_tests()
+
+    assert sorted(row.identifier for row in es.csv_rows) == [2, 3]
+    assert [tc.id for tc, _ in es.failed_test_cases] == [1]
+    assert sorted(prompt for chunk in sdk.chunks for prompt in chunk) == ["prompt 2", "prompt 3"]
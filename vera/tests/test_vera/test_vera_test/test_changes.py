@@ -0,0 +1,89 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from pathlib import Path  # noqa: TC003
+from unittest.mock import MagicMock
+
+import anyio
+import pytest
+
+from vera.core.data_models.test_case import ExpectedOutput, TestCase
+from vera.vtest.changes import hash_test_cases
+from vera.vtest.typer_app import _get_green_hashes  # noqa: PLC2701
+
+from .test_evaluate import MockInput
+
+
+def _test_case(test_case_id: int, name: str = "N") -> TestCase[MockInput]:
+    return TestCase(
+        id=test_case_id,
+        name=name,
+        description="D",
+        input=MockInput(file_name="context.md"),
+        expected_output=ExpectedOutput(file_name=f"expected_{test_case_id}.json"),
+    )
+
+
+@pytest.mark.anyio
+async def test_hashes_change_with_the_files_of_each_test_case(tmp_path: Path) -> None:
+    root = anyio.Path(tmp_path)
+    for name in ("context.md", "expected_1.json", "expected_2.json", "test_task.md"):
+        await (root / name).write_text(name)
+    await (root / "specs").mkdir()
+    await (root / "specs" / "accuracy.md").write_text("accurate")
+    plugin_service = MagicMock()
+    plugin_service.get_resources_dir.return_value = root
+    plugin_service.get_llm_specs_dir.return_value = root / "specs"
+    plugin_service.get_evaluation_task_template_path.return_value = root / "test_task.md"
+
+    async def hash_cases(*test_cases: TestCase[MockInput]) -> dict[int, str]:
+        return await hash_test_cases(test_cases, plugin_service)
+
+    hashes = await hash_cases(_test_case(1), _test_case(2))
+    assert hashes == await hash_cases(_test_case(1), _test_case(2))
+    assert hashes[1] != hashes[2]
+
+    changed_definition = await hash_cases(_test_case(1, name="renamed"), _test_case(2))
+    assert changed_definition[1] != hashes[1]
+    assert changed_definition[2] == hashes[2]
+
+    await (root / "expected_2.json").write_text("changed")
+    changed_expected = await hash_cases(_test_case(1), _test_case(2))
+    assert changed_expected[1] == hashes[1]
+    assert changed_expected[2] != hashes[2]
+
+    await (root / "specs" / "accuracy.md").write_text("changed")
+    changed_specs = await hash_cases(_test_case(1), _test_case(2))
+    assert changed_specs[1] != changed_expected[1]
+    assert changed_specs[2] != changed_expected[2]
+
+    await (root / "test_task.md").unlink()
+    assert (await hash_cases(_test_case(1)))[1] != changed_specs[1]
+
+
+def test_only_test_cases_green_in_every_run_are_recorded() -> None:
+    def row(test_case_id: int, color: str) -> MagicMock:
+        return MagicMock(identifier=test_case_id, **{"get_score_color.return_value": color})
+
+    first_run = MagicMock(
+        csv_rows=[row(1, "green"), row(2, "green"), row(3, "red")],
+        failed_test_cases=[],
+    )
+    second_run = MagicMock(
+        csv_rows=[row(1, "green"), row(2, "yellow")],
+        failed_test_cases=[(_test_case(3), ValueError())],
+    )
+    hashes = {1: "a", 2: "b", 3: "c", 4: "d"}
+
+    assert _get_green_hashes([first_run, second_run], hashes) == {1: "a"}
@@ -0,0 +1,120 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from vera.core.data_models.test_case import TestCase
+from vera.vtest.coordinator import Connection, Coordinator, parse_address, run_leased_cases
+from vera.vtest.vtest import TestingService
+
+from .mock_cli_service import MockCliService
+from .test_evaluate import MockColumn, MockInput, MockOutput, MockRow
+
+
+def create_test_cases() -> list[TestCase[Any]]:
+    return [
+        TestCase(id=i, name=f"test {i}", description="", input=MockInput())  # ty:ignore[missing-argument]
+        for i in range(1, 7)
+    ]
+
+
+def create_plugin_service() -> MagicMock:
+    plugin_service = MagicMock()
+    plugin_service.get_resources_dir.return_value = MagicMock()
+    plugin_service.run_feature = AsyncMock(return_value=MockOutput())
+    plugin_service.run_static_tests = MagicMock(return_value=MockColumn())
+    plugin_service.llm_evaluation = AsyncMock(return_value=MockColumn())
+    plugin_service.get_csv_row_class.return_value = MockRow
+    plugin_service.get_test_cases.return_value = create_test_cases()
+    plugin_service.get_cli_service.return_value = MockCliService()
+    return plugin_service
+
+
+async def connect(address: tuple[str, int], name: str) -> Connection:
+    connection = Connection(*await asyncio.open_connection(*address))
+    await connection.send({"type": "hello", "worker": name})
+    welcome = await connection.receive()
+    assert welcome is not None
+    assert welcome["type"] == "welcome"
+    assert "gemini_api_key" not in welcome["config"]
+    return connection
+
+
+async def run_worker(address: tuple[str, int], name: str) -> None:
+    connection = await connect(address, name)
+    try:
+        await run_leased_cases(
+            connection, create_plugin_service(), capacity=2, heartbeat_interval=0.05
+        )
+    finally:
+        await connection.aclose()
+
+
+@pytest.mark.anyio
+async def test_workers_run_all_test_cases_and_leases_are_reissued() -> None:
+    plugin_service = MagicMock()
+    plugin_service.get_csv_row_class.return_value = MockRow
+    cli_service = MockCliService()
+    services = [
+        TestingService(create_test_cases(), plugin_service, cli_service, run_index=run_index)
+        for run_index in range(2)
+    ]
+    coordinator = Coordinator(services, host="127.0.0.1", port=0, lease_timeout=0.2)
+    address = await coordinator.start()
+
+    # One worker dies holding a lease, another stops sending heartbeats for its lease
+    dead = await connect(address, "dead")
+    await dead.send({"type": "lease", "count": 2})
+    dead_cases = await dead.receive()
+    await dead.aclose()
+    stalled = await connect(address, "stalled")
+    await stalled.send({"type": "lease", "count": 1})
+    stalled_cases = await stalled.receive()
+    await asyncio.sleep(0.5)
+    await stalled.aclose()
+
+    async with services[0].streaming(), services[1].streaming():
+        await asyncio.wait_for(
+            asyncio.gather(
+                coordinator.run(), run_worker(address, "first"), run_worker(address, "second")
+            ),
+            timeout=10,
+        )
+
+    assert dead_cases is not None
+    assert len(dead_cases["cases"]) == 2
+    assert stalled_cases is not None
+    assert len(stalled_cases["cases"]) == 1
+    for es in services:
+        assert sorted(row.identifier for row in es.csv_rows) == list(range(1, 7))
+        assert not es.failed_test_cases
+    assert cli_service.overall_advances == 12
+
+
+@pytest.mark.parametrize(
+    ("address", "expected"),
+    [("localhost:8765", ("localhost", 8765)), ("[::1]:80", ("::1", 80))],
+)
+def test_parse_address(address: str, expected: tuple[str, int]) -> None:
+    assert parse_address(address) == expected
+
+
+@pytest.mark.parametrize("address", ["localhost", ":8765", "localhost:port", "host:70000"])
+def test_parse_address_rejects_invalid_addresses(address: str) -> None:
+    with pytest.raises(ValueError, match="HOST:PORT"):
+        parse_address(address)
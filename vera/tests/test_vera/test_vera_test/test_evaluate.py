@@ -24,6 +24,7 @@ from vera.core.data_models.csv import CsvColumn, CsvRow, ScoreRange
 from vera.core.data_models.test_case import TestCase
 from vera.core.data_models.test_case.input import TestCaseInput
 from vera.core.data_models.test_case.output import TestCaseOutput
+from vera.vtest.scheduler import Stage, StageScheduler
 from vera.vtest.vtest import TestingService
 
 from .mock_cli_service import MockCliService
@@ -193,3 +194,67 @@ async def test_evaluation_service_strict_mode_error() -> None:
         await ts.run_tests()
 
     assert len(ts.csv_rows) == 0
+
+
+@pytest.mark.anyio
+async def test_rows_are_streamed_as_test_cases_complete() -> None:
+    restored = MockRow.model_validate({"Test Case ID": 9, "Final Score": 1.0})
+    streamed: list[tuple[int, int]] = []
+
+    async def record(row: MockRow, run_index: int) -> None:  # noqa: RUF029
+        streamed.append((run_index, row.identifier))
+
+    plugin_service = MagicMock()
+    plugin_service.get_resources_dir.return_value = MagicMock()
+    plugin_service.run_feature = AsyncMock(return_value=MockOutput())
+    plugin_service.run_static_tests = MagicMock(return_value=MockColumn())
+    plugin_service.llm_evaluation = AsyncMock(return_value=MockColumn())
+    plugin_service.get_csv_row_class.return_value = MockRow
+    plugin_service.on_row_completed = MagicMock(
+        side_effect=lambda row, run_index: [record(row, run_index)]
+    )
+    test_cases = [
+        TestCase(id=i, name="N", description="D", input=MockInput())  # ty:ignore[missing-argument]
+        for i in (1, 2)
+    ]
+
+    ts = TestingService(test_cases, plugin_service, MockCliService(), run_index=2)
+    ts.csv_rows.append(restored)
+    await ts.run_tests()
+
+    assert streamed[0] == (2, 9)
+    assert sorted(streamed) == [(2, 1), (2, 2), (2, 9)]
+
+
+@pytest.mark.anyio
+async def test_longest_expected_test_cases_start_first() -> None:
+    started: list[int] = []
+
+    async def run_feature(test_case: Any, resources_dir: Any) -> MockOutput:  # noqa: ANN401, RUF029
+        started.append(test_case.id)
+        return MockOutput()
+
+    plugin_service = MagicMock()
+    plugin_service.get_resources_dir.return_value = MagicMock()
+    plugin_service.run_feature = run_feature
+    plugin_service.run_static_tests = MagicMock(return_value=MockColumn())
+    plugin_service.llm_evaluation = AsyncMock(return_value=MockColumn())
+    plugin_service.get_csv_row_class.return_value = MockRow
+    test_cases = [
+        TestCase(id=i, name="N", description="D", input=MockInput())  # ty:ignore[missing-argument]
+        for i in range(1, 5)
+    ]
+    history = {1: {"total": 1.0}, 2: {"feature": 3.0, "total": 9.0}, 3: {"total": 4.0}}
+
+    ts = TestingService(
+        test_cases,
+        plugin_service,
+        MockCliService(),
+        scheduler=StageScheduler({Stage.FEATURE: 1, Stage.STATIC: 1, Stage.LLM: 1}),
+        duration_history=history,
+    )
+    await ts.run_tests()
+
+    # Test case 4 has no history and is expected to take the median duration
+    assert started == [2, 3, 4, 1]
+    assert ts.expected_durations[4] == 4.0
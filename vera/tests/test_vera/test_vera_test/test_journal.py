@@ -0,0 +1,187 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+from typing import TYPE_CHECKING, Annotated, Any, Self, override
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from anyio import Path as AsyncPath
+from pydantic import Field, PlainSerializer
+
+from vera.core.data_models.csv import CsvColumn, CsvRow, ScoreRange
+from vera.core.data_models.test_case import TestCase
+from vera.core.data_models.test_case.input import TestCaseInput
+from vera.core.data_models.test_case.output import TestCaseOutput
+from vera.project_name import PROJECT_NAME
+from vera.vtest.journal import RunJournal
+from vera.vtest.vtest import TestingService
+
+from .mock_cli_service import MockCliService
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from pathlib import Path
+
+pytestmark = pytest.mark.usefixtures("journals_dir")
+
+
+class MockInput(TestCaseInput):
+    question: str = ""
+
+    @override
+    def to_description_prompt(self) -> str:
+        return self.question
+
+
+class MockOutput(TestCaseOutput):
+    answer: str = ""
+
+    @override
+    def to_output_description_prompt(self) -> str:
+        return ""
+
+
+class MockColumn(CsvColumn):
+    pass
+
+
+class MockRow(CsvRow):
+    input: Annotated[MockInput, PlainSerializer(lambda x: x.question), Field(alias="Input")]
+
+    @override
+    def calculate_final_score(self) -> float:
+        return 1.0
+
+    @property
+    @override
+    def score_range(self) -> ScoreRange:
+        return ScoreRange(min=0, max=1)
+
+    @classmethod
+    @override
+    def from_columns(
+        cls,
+        test_case: TestCase,
+        test_output: TestCaseOutput,
+        llm_checks_columns: CsvColumn,
+        static_checks_columns: CsvColumn,
+    ) -> Self:
+        return cls.model_validate({
+            "Test Case ID": test_case.id,
+            "Final Score": 1.0,
+            "Input": test_case.input,
+        })
+
+
+@pytest.fixture
+def journals_dir(tmp_path: Path) -> Iterator[Path]:
+    with patch(f"{PROJECT_NAME}.vtest.journal.get_journals_dir", return_value=tmp_path):
+        yield tmp_path
+
+
+def _test_case(test_case_id: int) -> TestCase[MockInput]:
+    return TestCase(id=test_case_id, name="N", description="D", input=MockInput(question="q"))  # ty:ignore[missing-argument]
+
+
+def _plugin_service() -> MagicMock:
+    async def run_feature(test_case: TestCase, **_: object) -> MockOutput:  # noqa: RUF029
+        if test_case.id == 2:
+            msg = "Failure"
+            raise ValueError(msg)
+
+        return MockOutput(answer=f"answer {test_case.id}")
+
+    plugin_service = MagicMock()
+    plugin_service.run_feature = run_feature
+    plugin_service.run_static_tests = MagicMock(return_value=MockColumn())
+    plugin_service.llm_evaluation = AsyncMock(return_value=MockColumn())
+    plugin_service.get_csv_row_class.return_value = MockRow
+    return plugin_service
+
+
+@pytest.mark.anyio
+async def test_finished_and_failed_test_cases_are_journaled() -> None:
+    journal = RunJournal.create()
+    ts = TestingService(
+        [_test_case(1), _test_case(2)],
+        _plugin_service(),
+        MockCliService(),
+        run_index=3,
+        journal=journal,
+    )
+
+    await ts.run_tests()
+
+    records: list[dict[str, Any]] = [
+        json.loads(line)
+        for line in (await AsyncPath(journal.path).read_text(encoding="utf-8")).splitlines()
+    ]
+    assert sorted((r["type"], r["run_index"], r["test_case_id"]) for r in records) == [
+        ("failure", 3, 2),
+        ("row", 3, 1),
+    ]
+
+    completed = RunJournal.open(journal.run_id).load(MockRow)
+    assert list(completed) == [(3, 1)]
+    assert completed[3, 1].row == ts.csv_rows[0]
+    assert completed[3, 1].row.input == MockInput(question="q")
+    assert completed[3, 1].durations == ts.durations[1]
+
+
+@pytest.mark.anyio
+async def test_load_skips_unreadable_lines() -> None:
+    journal = RunJournal.create()
+    row = MockRow.model_validate({"Test Case ID": 1, "Final Score": 1.0, "Input": MockInput()})
+    await journal.record_row(0, row, {"total": 1.0})
+    async with await AsyncPath(journal.path).open("a", encoding="utf-8") as f:
+        await f.write('{"type": "row", "run_index": 0, "test_case_id": 2, "ro')
+
+    assert list(journal.load(MockRow)) == [(0, 1)]
+
+
+@pytest.mark.anyio
+async def test_recorded_outputs_are_judged_again() -> None:
+    journal = RunJournal.create()
+    await TestingService(
+        [_test_case(1), _test_case(2)],
+        _plugin_service(),
+        MockCliService(),
+        run_index=1,
+        journal=journal,
+    ).run_tests()
+
+    outputs = RunJournal.open(journal.run_id).load_outputs(MockOutput)
+    assert outputs == {(1, 1): MockOutput(answer="answer 1")}
+
+    plugin_service = _plugin_service()
+    plugin_service.run_feature = AsyncMock()
+    ts = TestingService(
+        [_test_case(1)],
+        plugin_service,
+        MockCliService(),
+        run_index=1,
+        recorded_outputs={1: outputs[1, 1]},
+    )
+    await ts.run_tests()
+
+    plugin_service.run_feature.assert_not_awaited()
+    plugin_service.run_static_tests.assert_called_once()
+    assert plugin_service.run_static_tests.call_args.kwargs["test_output"] == outputs[1, 1]
+    assert [row.identifier for row in ts.csv_rows] == [1]
+
+
+def test_open_unknown_run_fails() -> None:
+    with pytest.raises(FileNotFoundError):
+        RunJournal.open("missing")
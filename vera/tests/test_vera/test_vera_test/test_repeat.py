@@ -0,0 +1,112 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from vera.core.data_models.test_case import TestCase
+from vera.vtest.repeat import SharedFeatureOutputs
+from vera.vtest.vtest import TestingService
+
+from .mock_cli_service import MockCliService
+from .test_evaluate import MockColumn, MockInput, MockOutput, MockRow
+
+
+@pytest.mark.anyio
+async def test_feature_runs_once_for_all_runs() -> None:
+    shared = SharedFeatureOutputs()
+    calls: list[int] = []
+
+    async def run_feature() -> str:
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        return "output"
+
+    outputs = await asyncio.gather(*(shared.get_or_run(1, run_feature) for _ in range(3)))
+
+    assert outputs == ["output"] * 3
+    assert len(calls) == 1
+
+
+@pytest.mark.anyio
+async def test_feature_error_is_raised_in_every_run() -> None:
+    shared = SharedFeatureOutputs()
+
+    async def run_feature() -> str:
+        await asyncio.sleep(0.01)
+        msg = "feature failed"
+        raise RuntimeError(msg)
+
+    results = await asyncio.gather(
+        *(shared.get_or_run(1, run_feature) for _ in range(2)), return_exceptions=True
+    )
+
+    assert all(isinstance(r, RuntimeError) for r in results)
+
+
+@pytest.mark.anyio
+async def test_waiting_run_takes_over_when_running_run_is_cancelled() -> None:
+    shared = SharedFeatureOutputs()
+    started = asyncio.Event()
+
+    async def hang() -> str:
+        started.set()
+        await asyncio.sleep(10)
+        return "never"
+
+    async def run_feature() -> str:
+        await asyncio.sleep(0)
+        return "output"
+
+    first = asyncio.create_task(shared.get_or_run(1, hang))
+    await started.wait()
+    second = asyncio.create_task(shared.get_or_run(1, run_feature))
+    await asyncio.sleep(0)
+    first.cancel()
+
+    assert await asyncio.wait_for(second, timeout=1) == "output"
+    with pytest.raises(asyncio.CancelledError):
+        await first
+
+
+@pytest.mark.anyio
+async def test_runs_sharing_outputs_are_judged_separately() -> None:
+    test_cases = [
+        TestCase(id=i, name=f"test {i}", description="", input=MockInput())  # ty:ignore[missing-argument]
+        for i in range(1, 3)
+    ]
+    plugin_service = MagicMock()
+    plugin_service.get_resources_dir.return_value = MagicMock()
+    plugin_service.run_feature = AsyncMock(return_value=MockOutput())
+    plugin_service.run_static_tests = MagicMock(return_value=MockColumn())
+    plugin_service.llm_evaluation = AsyncMock(return_value=MockColumn())
+    plugin_service.get_csv_row_class.return_value = MockRow
+    shared = SharedFeatureOutputs()
+    services: list[TestingService[Any, Any, Any, Any]] = [
+        TestingService(
+            test_cases, plugin_service, MockCliService(), run_index=i, shared_outputs=shared
+        )
+        for i in range(3)
+    ]
+
+    await asyncio.gather(*(es.run_tests() for es in services))
+
+    assert plugin_service.run_feature.await_count == 2
+    assert plugin_service.llm_evaluation.await_count == 6
+    assert plugin_service.run_static_tests.call_count == 6
+    for es in services:
+        assert sorted(row.identifier for row in es.csv_rows) == [1, 2]
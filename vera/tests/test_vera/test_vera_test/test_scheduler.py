@@ -0,0 +1,128 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+
+import pytest
+
+from vera.core.configuration import VeraConfig
+from vera.vtest.scheduler import Stage, StageScheduler
+
+
+def _scheduler(feature: int = 1, static: int = 1, llm: int = 1) -> StageScheduler:
+    return StageScheduler({Stage.FEATURE: feature, Stage.STATIC: static, Stage.LLM: llm})
+
+
+def test_from_config() -> None:
+    config = VeraConfig(feature_concurrency=3, static_concurrency=2, llm_concurrency=5)
+    scheduler = StageScheduler.from_config(config)
+    assert scheduler.limits == {Stage.FEATURE: 3, Stage.STATIC: 2, Stage.LLM: 5}
+
+
+def test_invalid_limits() -> None:
+    with pytest.raises(ValueError, match="greater than 0"):
+        _scheduler(llm=0)
+
+    with pytest.raises(ValueError, match="Missing"):
+        StageScheduler({Stage.FEATURE: 1})
+
+
+@pytest.mark.anyio
+async def test_slot_bounds_concurrency() -> None:
+    scheduler = _scheduler(feature=2)
+    running: int = 0
+    peak: int = 0
+
+    async def work() -> None:
+        nonlocal running, peak
+        async with scheduler.slot(Stage.FEATURE):
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+
+    await asyncio.gather(*(work() for _ in range(6)))
+    assert peak == 2
+
+
+@pytest.mark.anyio
+async def test_slot_stages_are_independent() -> None:
+    scheduler = _scheduler()
+    async with asyncio.timeout(1), scheduler.slot(Stage.FEATURE), scheduler.slot(Stage.LLM):
+        pass
+
+
+@pytest.mark.anyio
+async def test_waiting_for_slot_does_not_consume_timeout() -> None:
+    scheduler = _scheduler()
+    release: asyncio.Event = asyncio.Event()
+
+    async def hold() -> None:
+        async with scheduler.slot(Stage.LLM):
+            await release.wait()
+
+    holder = asyncio.create_task(hold())
+    await asyncio.sleep(0)
+    asyncio.get_running_loop().call_later(0.1, release.set)
+
+    async with asyncio.timeout(0.05) as deadline:
+        async with scheduler.slot(Stage.LLM, deadline):
+            await asyncio.sleep(0.01)
+
+    await holder
+
+
+@pytest.mark.anyio
+async def test_queued_test_cases_enter_by_priority() -> None:
+    scheduler = _scheduler()
+    order: list[str] = []
+    release = asyncio.Event()
+
+    async def hold() -> None:
+        async with scheduler.slot(Stage.FEATURE):
+            await release.wait()
+
+    async def work(name: str, priority: float) -> None:
+        async with scheduler.slot(Stage.FEATURE, priority=priority):
+            order.append(name)
+
+    holder = asyncio.create_task(hold())
+    await asyncio.sleep(0)
+    waiters = [
+        asyncio.create_task(work(name, priority))
+        for name, priority in [("short", 1.0), ("long", 60.0), ("unknown", 1.0), ("medium", 5.0)]
+    ]
+    await asyncio.sleep(0)
+    release.set()
+    await asyncio.gather(holder, *waiters)
+    assert order == ["long", "medium", "short", "unknown"]
+
+
+@pytest.mark.anyio
+async def test_cancelled_waiter_does_not_lose_the_slot() -> None:
+    scheduler = _scheduler()
+    entered: list[str] = []
+
+    async def work(name: str) -> None:
+        async with scheduler.slot(Stage.FEATURE):
+            entered.append(name)
+            await asyncio.sleep(0.01)
+
+    first = asyncio.create_task(work("first"))
+    await asyncio.sleep(0)
+    cancelled = asyncio.create_task(work("cancelled"))
+    await asyncio.sleep(0)
+    cancelled.cancel()
+    await asyncio.gather(first, work("last"), cancelled, return_exceptions=True)
+    assert entered == ["first", "last"]
@@ -0,0 +1,71 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from typing import Any
+
+import pytest
+
+from vera.core.data_models.test_case import TestCase
+from vera.vtest.sharding import Shard, balance_shards, hash_shard, select_shard
+
+from .test_evaluate import MockInput
+
+
+def create_test_cases(count: int) -> list[TestCase[Any]]:
+    return [
+        TestCase(id=i, name=f"test {i}", description="", input=MockInput())  # ty:ignore[missing-argument]
+        for i in range(1, count + 1)
+    ]
+
+
+def test_parse_shard() -> None:
+    assert Shard.parse("3/8") == Shard(3, 8)
+    assert str(Shard(3, 8)) == "3/8"
+
+
+@pytest.mark.parametrize("value", ["0/8", "9/8", "3", "3/", "a/b", "-1/2"])
+def test_parse_shard_rejects_invalid_shards(value: str) -> None:
+    with pytest.raises(ValueError, match="INDEX/COUNT"):
+        Shard.parse(value)
+
+
+def test_hash_shards_cover_every_test_case_once() -> None:
+    test_cases = create_test_cases(100)
+    shards = [select_shard(test_cases, Shard(index, 4)) for index in range(1, 5)]
+
+    selected = [tc.id for shard in shards for tc in shard]
+    assert sorted(selected) == list(range(1, 101))
+    assert all(shard for shard in shards)
+    # Shards keep the order of the suite and do not depend on the other test cases
+    assert [tc.id for tc in shards[0]] == sorted(tc.id for tc in shards[0])
+    assert [tc.id for tc in select_shard(test_cases[::2], Shard(1, 4))] == [
+        tc.id for tc in shards[0] if tc.id % 2 == 1
+    ]
+    assert hash_shard(42, 4) == hash_shard(42, 4)
+
+
+def test_duration_shards_take_about_the_same_time() -> None:
+    durations = {1: 60.0, 2: 30.0, 3: 30.0, 4: 10.0, 5: 10.0, 6: 10.0, 7: 10.0}
+    assignment = balance_shards(range(1, 9), 2, durations)
+
+    loads = {1: 0.0, 2: 0.0}
+    for test_case_id, index in assignment.items():
+        # Test case 8 has no recorded duration, and is expected to take the median
+        loads[index] += durations.get(test_case_id, 10.0)
+    assert loads == {1: 90.0, 2: 80.0}
+    assert assignment[1] != assignment[2]
+
+    test_cases = create_test_cases(8)
+    shards = [select_shard(test_cases, Shard(index, 2), durations) for index in (1, 2)]
+    assert sorted(tc.id for shard in shards for tc in shard) == list(range(1, 9))
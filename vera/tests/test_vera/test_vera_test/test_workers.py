@@ -0,0 +1,109 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import sys
+from typing import Any, Self, override
+from unittest.mock import MagicMock
+
+import pytest
+from pydantic import ConfigDict
+
+from vera.core import exceptions
+from vera.core.data_models.csv import CsvRow, ScoreRange
+from vera.core.data_models.test_case import TestCase, TestCaseConfig
+from vera.core.data_models.test_case.input import TestCaseInput
+from vera.vtest.vtest import TestingService
+from vera.vtest.workers import EventQueue, WorkerPool, WorkerTask
+
+from .mock_cli_service import MockCliService
+
+
+class MockInput(TestCaseInput):
+    @override
+    def to_description_prompt(self) -> str:
+        return ""
+
+
+class MockRow(CsvRow):
+    model_config = ConfigDict(populate_by_name=True)
+
+    @override
+    def calculate_final_score(self) -> float:
+        return self.final_score
+
+    @property
+    @override
+    def score_range(self) -> ScoreRange:
+        return ScoreRange(min=0, max=1)
+
+    @classmethod
+    @override
+    def from_columns(cls, **kwargs: Any) -> Self:  # ty:ignore[invalid-method-override]
+        return cls(**kwargs)
+
+
+def fake_worker(task: WorkerTask, events: EventQueue) -> None:
+    """Reports a row for odd test cases and a failure for test case 2, and crashes on 3."""
+    for run_index, test_case_id in task.cases:
+        if test_case_id == 3:
+            sys.exit(3)
+
+        if test_case_id == 2:
+            events.put({
+                "type": "failure",
+                "run_index": run_index,
+                "test_case_id": test_case_id,
+                "error": "ValueError: bad output",
+            })
+            continue
+
+        events.put({
+            "type": "row",
+            "run_index": run_index,
+            "test_case_id": test_case_id,
+            "row": {"identifier": test_case_id, "final_score": task.config["llm_concurrency"]},
+            "durations": {"total": 1.5},
+        })
+
+    events.put({"type": "done", "worker_index": task.worker_index})
+
+
+@pytest.mark.anyio
+async def test_worker_outcomes_are_added_to_their_run() -> None:
+    test_cases = [
+        TestCase(  # ty:ignore[missing-argument]
+            id=test_case_id,
+            name=f"test {test_case_id}",
+            description="",
+            input=MockInput(),
+            config=TestCaseConfig(strict_mode=test_case_id == 3),
+        )
+        for test_case_id in range(1, 5)
+    ]
+    plugin_service = MagicMock()
+    plugin_service.get_csv_row_class.return_value = MockRow
+    cli_service = MockCliService()
+    es = TestingService(test_cases, plugin_service, cli_service)
+
+    with pytest.raises(ExceptionGroup) as strict_errors:
+        async with es.streaming():
+            await WorkerPool([es], workers=2, target=fake_worker, start_method="fork").run()
+
+    assert strict_errors.group_contains(exceptions.TestCaseTestingError)
+    assert sorted(row.identifier for row in es.csv_rows) == [1, 4]
+    assert {row.final_score for row in es.csv_rows} == {8}
+    assert es.durations[4] == {"total": 1.5}
+    failures = {test_case.id: str(error) for test_case, error in es.failed_test_cases}
+    assert failures == {2: "ValueError: bad output", 3: "Worker 0 exited with code 3"}
+    assert cli_service.overall_advances == 4